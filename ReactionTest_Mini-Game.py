@@ -4,45 +4,105 @@ import time
 import sys
 from pygame.locals import *
 import math
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
 import json
 import os
-
-# Initialize Pygame (robust audio init with fallbacks)
-# Try to configure mixer before pygame.init so the audio device matches our buffers
-SOUND_ENABLED = True
-try:
-    pygame.mixer.pre_init(22050, -16, 1, 512)  # mono 16-bit at 22.05kHz keeps buffers small and simple
-except Exception as e:
-    print(f"[Audio] pre_init warning: {e}")
-
-pygame.init()
-pygame.font.init()
-
-try:
-    pygame.mixer.init()  # use pre_init params
-except Exception as e:
-    print(f"[Audio] mixer.init failed (pass 1): {e}")
-    SOUND_ENABLED = False
-    # Try a fallback configuration
+import hashlib
+import mmap
+import threading
+import contextlib
+import collections
+import bisect
+import itertools
+
+# Importing this module has no side effects: pygame, the mixer, fonts, sounds, BGM and the
+# window are brought up by main() through the init_* functions below (each runs once, on
+# first need). Tools can import the module and initialize only the subsystems they use.
+
+# numpy is optional and imported on first use (_load_numpy); the synthesis code checks NUMPY_AVAILABLE
+np = None
+NUMPY_AVAILABLE = False
+_NUMPY_CHECKED = False
+
+def _load_numpy():
+    """Import numpy once, setting np/NUMPY_AVAILABLE. Returns NUMPY_AVAILABLE."""
+    global np, NUMPY_AVAILABLE, _NUMPY_CHECKED
+    if not _NUMPY_CHECKED:
+        _NUMPY_CHECKED = True
+        try:
+            import numpy
+            np = numpy
+            NUMPY_AVAILABLE = True
+        except ImportError:
+            NUMPY_AVAILABLE = False
+        _startup_mark("numpy import")
+    return NUMPY_AVAILABLE
+
+# Startup trace: set RT_STARTUP_TRACE=1 to print, per phase, milliseconds since the module
+# started loading and since the previous phase.
+STARTUP_TRACE = os.environ.get('RT_STARTUP_TRACE', '') == '1'
+STARTUP_T0 = time.perf_counter()
+_STARTUP_LAST = STARTUP_T0
+_STARTUP_MARKS_SEEN = set()
+
+def _startup_mark(label, once=False):
+    """Print a [Startup] timeline entry; with once=True only the first call for a label prints."""
+    global _STARTUP_LAST
+    if not STARTUP_TRACE:
+        return
+    if once:
+        if label in _STARTUP_MARKS_SEEN:
+            return
+        _STARTUP_MARKS_SEEN.add(label)
+    now = time.perf_counter()
+    print(f"[Startup] {(now - STARTUP_T0) * 1000.0:8.1f} ms  (+{(now - _STARTUP_LAST) * 1000.0:7.1f})  {label}")
+    _STARTUP_LAST = now
+
+# Audio device settings (applied by init_audio)
+SOUND_ENABLED = True  # cleared by init_audio if no mixer can be opened
+# Mixer buffer in sample frames; smaller is lower latency but more prone to dropouts.
+# RT_MIXER_BUFFER overrides it to tune latency against stability on a given machine.
+MIXER_BUFFER = int(os.environ.get('RT_MIXER_BUFFER', '512') or 512)
+_PYGAME_READY = False
+
+def init_pygame():
+    """pygame.init() once, with the mixer pre-configured so the audio device matches our buffers."""
+    global _PYGAME_READY
+    if _PYGAME_READY:
+        return
+    _PYGAME_READY = True
+    try:
+        pygame.mixer.pre_init(22050, -16, 1, MIXER_BUFFER)  # mono 16-bit at 22.05kHz keeps buffers small and simple
+    except Exception as e:
+        print(f"[Audio] pre_init warning: {e}")
+    pygame.init()
+    pygame.font.init()
+    _startup_mark("pygame.init")
+
+def _init_mixer():
+    """Open the mixer (robust init with a fallback configuration); sets SOUND_ENABLED."""
+    global SOUND_ENABLED
+    init_pygame()
+    try:
+        pygame.mixer.init()  # use pre_init params
+    except Exception as e:
+        print(f"[Audio] mixer.init failed (pass 1): {e}")
+        SOUND_ENABLED = False
+        # Try a fallback configuration
+        try:
+            pygame.mixer.quit()
+            pygame.mixer.pre_init(44100, -16, 1, MIXER_BUFFER)
+            pygame.mixer.init()
+            SOUND_ENABLED = True
+        except Exception as e2:
+            print(f"[Audio] mixer.init failed (pass 2): {e2}")
+
+    print(f"[Audio] device settings: {pygame.mixer.get_init()} | enabled={SOUND_ENABLED}")
+    _startup_mark("mixer ready")
     try:
-        pygame.mixer.quit()
-        pygame.mixer.pre_init(44100, -16, 1, 512)
-        pygame.mixer.init()
-        SOUND_ENABLED = True
-    except Exception as e2:
-        print(f"[Audio] mixer.init failed (pass 2): {e2}")
-
-print(f"[Audio] device settings: {pygame.mixer.get_init()} | enabled={SOUND_ENABLED}")
-try:
-    # Ensure we have enough channels for SFX + BGM
-    pygame.mixer.set_num_channels(max(16, pygame.mixer.get_num_channels()))
-except Exception:
-    pass
+        # Ensure we have enough channels for SFX + BGM
+        pygame.mixer.set_num_channels(max(16, pygame.mixer.get_num_channels()))
+    except Exception:
+        pass
 
 # Target volume for all SFX to keep loudness consistent across different tones
 SFX_TARGET_VOLUME = 0.5
@@ -69,6 +129,14 @@ BGM_VOLUME = 0.22  # keep bgm subtle so SFX remain clear
 BGM_LENGTH = 32.0  # seconds per loop (longer loop reduces repetition)
 BGM_SOUND = None
 BGM_CHANNEL = None
+# Synthesize the BGM on a worker thread so the first frame is not held up by it.
+# Set RT_BGM_SYNC=1 to restore the old blocking behaviour (e.g. to compare startup timelines).
+BGM_ASYNC = os.environ.get('RT_BGM_SYNC', '') != '1'
+BGM_FADE_IN = 0.8  # seconds of fade-in once the BGM buffer is ready
+BGM_TARGET_VOLUME = BGM_VOLUME  # channel volume requested by settings (0.0 when BGM is off)
+BGM_LOCK = threading.Lock()
+BGM_STREAM_PLAYER = None  # BgmStream when streaming mode is active
+BGM_STEMS_PLAYER = None  # BgmStems when adaptive music is active
 
 # Pixel-style font settings
 # Build candidate list at runtime, preferring local pixel fonts under fonts/ and assets/fonts/
@@ -93,46 +161,38 @@ def _pixel_font_candidates():
             candidates.append(os.path.join(folder, name))
     return candidates
 
-_SELECTED_FONT_PATH = None
-
-def _load_pixel_font(size):
-    global _SELECTED_FONT_PATH
+def _probe_pixel_font():
+    """Return the first usable pixel font file among the candidates (None: pygame's default font).
+    Logs the probe results; a directory candidate is searched for a .ttf/.otf inside.
+    """
     candidates = _pixel_font_candidates()
-    # On first load, log probe results for visibility
-    if _SELECTED_FONT_PATH is None:
-        try:
-            probe = {p: os.path.isfile(p) for p in candidates}
-            print("[Font] Probe candidates:")
-            for k, v in probe.items():
-                print(f"  - {k} -> {'FOUND' if v else 'missing'}")
-        except Exception:
-            pass
+    try:
+        print("[Font] Probe candidates:")
+        for p in candidates:
+            print(f"  - {p} -> {'FOUND' if os.path.isfile(p) else 'missing'}")
+    except Exception:
+        pass
     for p in candidates:
         try:
             if os.path.isfile(p):
-                f = pygame.font.Font(p, size)
-                if _SELECTED_FONT_PATH is None:
-                    _SELECTED_FONT_PATH = p
-                print(f"[Font] Using pixel font: {p} @ {size}px")
-                return f
+                pygame.font.Font(p, 8)  # make sure it actually loads
+                print(f"[Font] Using pixel font: {p}")
+                return p
             # If candidate is a directory (e.g., mistakenly copied as a folder), search inside for .ttf/.otf
             if os.path.isdir(p):
                 try:
                     for name in os.listdir(p):
                         if name.lower().endswith(('.ttf', '.otf')):
                             fp = os.path.join(p, name)
-                            f = pygame.font.Font(fp, size)
-                            if _SELECTED_FONT_PATH is None:
-                                _SELECTED_FONT_PATH = fp
-                            print(f"[Font] Using pixel font (from dir): {fp} @ {size}px")
-                            return f
+                            pygame.font.Font(fp, 8)
+                            print(f"[Font] Using pixel font (from dir): {fp}")
+                            return fp
                 except Exception as se:
                     print(f"[Font] Scan dir failed {p}: {se}")
         except Exception as e:
             print(f"[Font] Failed loading {p}: {e}")
-    if _SELECTED_FONT_PATH is None:
-        print("[Font] No pixel font found. Falling back to default.")
-    return pygame.font.Font(None, size)
+    print("[Font] No pixel font found. Falling back to default.")
+    return None
 
 # Suggested integer-multiple sizes to preserve pixel look (e.g., 16/24/32/48/64)
 # Global font scale: quickly shrink/enlarge all pixel fonts; lower to restore original proportions
@@ -145,11 +205,71 @@ def px(size):
     except Exception:
         return size
 
-font = _load_pixel_font(px(32))
-small_font = _load_pixel_font(px(24))
-large_font = _load_pixel_font(px(48))
-instruction_font = _load_pixel_font(px(20))
-title_font = _load_pixel_font(px(64))
+# Named font sizes (before FONT_SCALE) used by the screens
+FONT_SIZES = {
+    'font': 32,
+    'small': 24,
+    'large': 48,
+    'instruction': 20,
+    'title': 64,
+    'headline': 48,   # instructions text
+    'fallback': 44,   # instructions text when the animated render fails
+    'countdown': 84,  # 3-2-1/GO digits
+}
+
+class FontRegistry:
+    """Resolves the pixel font path once and caches pygame Font objects by (path, size).
+    get(size) takes a final pixel size, named(name) a FONT_SIZES entry; hits/misses count lookups.
+    """
+    def __init__(self, sizes=FONT_SIZES):
+        self.sizes = sizes
+        self.path = None
+        self.resolved = False
+        self._fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size):
+        if not self.resolved:
+            self.path = _probe_pixel_font()
+            self.resolved = True
+        key = (self.path, size)
+        f = self._fonts.get(key)
+        if f is not None:
+            self.hits += 1
+            return f
+        self.misses += 1
+        try:
+            f = pygame.font.Font(self.path, size)
+        except Exception as e:
+            print(f"[Font] Failed loading {self.path} @ {size}px: {e}")
+            f = pygame.font.Font(None, size)
+        self._fonts[key] = f
+        return f
+
+    def named(self, name):
+        return self.get(px(self.sizes[name]))
+
+    def stats(self):
+        return {'path': self.path, 'fonts': len(self._fonts), 'hits': self.hits, 'misses': self.misses}
+
+FONTS = FontRegistry()
+
+# UI fonts, loaded by init_fonts()
+font = small_font = large_font = instruction_font = title_font = None
+
+def init_fonts():
+    """Load the UI fonts once (probing the pixel font candidates on the first load)."""
+    global font, small_font, large_font, instruction_font, title_font
+    if font is not None:
+        return
+    init_pygame()
+    font = FONTS.named('font')
+    small_font = FONTS.named('small')
+    large_font = FONTS.named('large')
+    instruction_font = FONTS.named('instruction')
+    title_font = FONTS.named('title')
+    _startup_mark("fonts loaded")
 
 # Pixel-style color palette
 PIXEL_COLORS = {
@@ -168,37 +288,111 @@ PIXEL_COLORS = {
     'accent': (114, 137, 218),       # accent color (same as text_accent)
 }
 
-# Text wrapping helper
-def wrap_text(text, font_obj, max_width):
-    """Wrap text to fit max_width in pixels. Returns a list of lines."""
-    words = text.split(' ')
-    lines = []
-    current = ''
-    for w in words:
-        test = (current + ' ' + w).strip()
-        if font_obj.size(test)[0] <= max_width:
-            current = test
+# Text layout: wrap_text results are memoized per (text, font, max_width), least recently used
+# dropped past TEXT_LAYOUT_SIZE. For the pixel font a string's width is the sum of its glyph
+# advances (checked per font over GLYPH_ATLAS_CHARS, as for the glyph atlases), so lines are
+# measured from a cached advance table and a long word is hard-broken by bisecting its prefix
+# widths; fonts that kern, and text outside that character set, are measured with font.size.
+TEXT_LAYOUT_SIZE = 1024
+
+class TextLayout:
+    """LRU cache of wrapped lines: wrap() returns a new list of the lines on every call."""
+    def __init__(self, capacity=TEXT_LAYOUT_SIZE):
+        self.capacity = capacity
+        self._entries = collections.OrderedDict()
+        self._advances = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def advances(self, font_obj):
+        """{char: advance} for font_obj, or None when string widths are not glyph sums (kerning)."""
+        if font_obj not in self._advances:
+            advance = {ch: font_obj.size(ch)[0] for ch in GLYPH_ATLAS_CHARS}
+            additive = font_obj.size(GLYPH_ATLAS_CHARS)[0] == sum(advance.values())
+            self._advances[font_obj] = advance if additive else None
+        return self._advances[font_obj]
+
+    def wrap(self, text, font_obj, max_width):
+        key = (text, font_obj, max_width)
+        lines = self._entries.get(key)
+        if lines is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(lines)
+        self.misses += 1
+        lines = self._entries[key] = tuple(self._wrap(text, font_obj, max_width))
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return list(lines)
+
+    def _wrap(self, text, font_obj, max_width):
+        advance = self.advances(font_obj)
+        if advance is not None and not advance.keys() >= set(text):
+            advance = None
+        if advance is None:
+            measure = lambda s: font_obj.size(s)[0]
         else:
+            measure = lambda s: sum(map(advance.__getitem__, s))
+        space = advance[' '] if advance is not None else 0
+        words = text.split(' ')
+        lines = []
+        current, current_width = '', 0
+        for w in words:
+            test = (current + ' ' + w).strip()
+            if advance is not None and current and w:
+                # ' ' is the only whitespace with an advance, so strip() is a no-op here:
+                # extend the current line's width instead of re-measuring it
+                test_width = current_width + space + measure(w)
+            else:
+                test_width = measure(test)
+            if test_width <= max_width:
+                current, current_width = test, test_width
+                continue
             # if single word is too long, hard-break by characters
             if current:
                 lines.append(current)
                 current = ''
-            while font_obj.size(w)[0] > max_width and len(w) > 1:
-                # find max fit prefix
-                lo, hi = 1, len(w)
-                while lo < hi:
-                    mid = (lo + hi) // 2
-                    if font_obj.size(w[:mid])[0] <= max_width:
-                        lo = mid + 1
-                    else:
-                        hi = mid
-                fit = w[:lo-1]
-                lines.append(fit)
-                w = w[lo-1:]
-            current = w
-    if current:
-        lines.append(current)
-    return lines
+            if advance is not None:
+                # prefix widths once; each break is the longest prefix that fits (at least one char)
+                prefix = [0, *itertools.accumulate(advance[ch] for ch in w)]
+                start = 0
+                while prefix[-1] - prefix[start] > max_width and len(w) - start > 1:
+                    end = max(start + 1, bisect.bisect_right(prefix, prefix[start] + max_width, start + 1) - 1)
+                    lines.append(w[start:end])
+                    start = end
+                w = w[start:]
+            else:
+                while measure(w) > max_width and len(w) > 1:
+                    # find max fit prefix
+                    lo, hi = 1, len(w)
+                    while lo < hi:
+                        mid = (lo + hi) // 2
+                        if measure(w[:mid]) <= max_width:
+                            lo = mid + 1
+                        else:
+                            hi = mid
+                    fit = w[:max(1, lo - 1)]
+                    lines.append(fit)
+                    w = w[len(fit):]
+            current, current_width = w, measure(w)
+        if current:
+            lines.append(current)
+        return lines
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'entries': len(self._entries), 'fonts': len(self._advances), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0}
+
+TEXT_LAYOUT = TextLayout()
+
+# Text wrapping helper
+def wrap_text(text, font_obj, max_width):
+    """Wrap text to fit max_width in pixels. Returns a list of lines (memoized in TEXT_LAYOUT)."""
+    return TEXT_LAYOUT.wrap(text, font_obj, max_width)
 
 # Pixel-style drawing helper functions
 def draw_pixel_border(surface, rect, color, width=2):
@@ -216,6 +410,106 @@ def draw_pixel_border(surface, rect, color, width=2):
                     (inner_rect.x, inner_rect.y), 
                     (inner_rect.x, inner_rect.bottom-1), width)
 
+# Glyph atlases for frequently changing text (score, reaction time, countdown, typed name).
+# The pixel font is a fixed grid drawn without antialiasing, so a string is just its glyphs side
+# by side: the printable ASCII set is rasterized once per (font, color) as one line (so every
+# glyph sits on the same baseline), and a string is drawn with one Surface.blits() call of
+# slices of that line. Fonts whose string widths are not the sum of their glyph widths (kerning)
+# are not atlased. Text with other characters (e.g. IME/CJK names) goes through TEXT_CACHE.
+# At most GLYPH_ATLAS_MAX atlases are kept (least recently used dropped).
+GLYPH_ATLAS_CHARS = ''.join(chr(c) for c in range(32, 127))
+GLYPH_ATLAS_MAX = 16
+
+class GlyphAtlas:
+    """Printable ASCII glyphs of one font in one color, rasterized on first use into a strip."""
+    def __init__(self, font_obj, color):
+        self.font = font_obj
+        self.color = color
+        self.advance = {ch: font_obj.size(ch)[0] for ch in GLYPH_ATLAS_CHARS}
+        self.usable = font_obj.size(GLYPH_ATLAS_CHARS)[0] == sum(self.advance.values())
+        self.strip = None
+        self.areas = {}
+
+    def _rasterize(self):
+        strip = self.font.render(GLYPH_ATLAS_CHARS, False, self.color)
+        self.strip = strip.convert_alpha() if pygame.display.get_surface() is not None else strip
+        x, h = 0, self.strip.get_height()
+        for ch in GLYPH_ATLAS_CHARS:
+            self.areas[ch] = pygame.Rect(x, 0, self.advance[ch], h)
+            x += self.advance[ch]
+
+    def blits(self, text, x, y):
+        """(strip, position, area) sequence for Surface.blits()."""
+        if self.strip is None:
+            self._rasterize()
+        strip, areas, advance = self.strip, self.areas, self.advance
+        seq = []
+        for ch in text:
+            seq.append((strip, (x, y), areas[ch]))
+            x += advance[ch]
+        return seq
+
+class GlyphAtlases:
+    """(font, color) -> GlyphAtlas, LRU-bounded; draw() falls back to TEXT_CACHE when needed."""
+    def __init__(self, capacity=GLYPH_ATLAS_MAX):
+        self.capacity = capacity
+        self._atlases = collections.OrderedDict()
+        self.drawn = 0
+        self.fallbacks = 0
+        self.evictions = 0
+
+    def atlas(self, font_obj, color):
+        key = (font_obj, color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font_obj, color)
+            self._atlases[key] = atlas
+            if len(self._atlases) > self.capacity:
+                self._atlases.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._atlases.move_to_end(key)
+        return atlas
+
+    def _usable(self, text, font_obj, color):
+        atlas = self.atlas(font_obj, color)
+        if atlas.usable and all(ch in atlas.advance for ch in text):
+            return atlas
+        return None
+
+    def size(self, text, font_obj, color):
+        """(width, height) of `text` as draw() lays it out."""
+        atlas = self._usable(text, font_obj, color)
+        if atlas is None:
+            return font_obj.size(text)
+        return sum(atlas.advance[ch] for ch in text), font_obj.get_height()
+
+    def draw(self, surface, text, font_obj, x, y, color, shadow_color=None, offset=2):
+        """Draw `text` (with an optional shadow) at (x, y). Returns its (width, height)."""
+        atlas = self._usable(text, font_obj, color)
+        shadow = self._usable(text, font_obj, shadow_color) if shadow_color is not None else None
+        if atlas is None or (shadow_color is not None and shadow is None):
+            self.fallbacks += 1
+            surf, size = TEXT_CACHE.get(text, font_obj, color, shadow_color, offset)
+            surface.blit(surf, (x, y))
+            return size
+        self.drawn += 1
+        if shadow is not None:
+            surface.blits(shadow.blits(text, x + offset, y + offset), doreturn=False)
+        surface.blits(atlas.blits(text, x, y), doreturn=False)
+        return sum(atlas.advance[ch] for ch in text), font_obj.get_height()
+
+    def draw_centered(self, surface, text, font_obj, cx, y, color, shadow_color=None):
+        """draw() centered horizontally on cx."""
+        w = self.size(text, font_obj, color)[0]
+        return self.draw(surface, text, font_obj, cx - w // 2, y, color, shadow_color)
+
+    def stats(self):
+        return {'atlases': len(self._atlases), 'rasterized': sum(a.strip is not None for a in self._atlases.values()),
+                'drawn': self.drawn, 'fallbacks': self.fallbacks, 'evictions': self.evictions}
+
+GLYPHS = GlyphAtlases()
+
 def draw_pixel_button(surface, rect, text, font_obj, bg_color, text_color, border_color):
     """Draw a pixel-style button."""
     # Button background
@@ -223,19 +517,76 @@ def draw_pixel_button(surface, rect, text, font_obj, bg_color, text_color, borde
     # Button border
     draw_pixel_border(surface, rect, border_color, 2)
     # Button text
-    text_surface = font_obj.render(text, False, text_color)
+    text_surface, _ = TEXT_CACHE.get(text, font_obj, text_color)
     text_x = rect.x + (rect.width - text_surface.get_width()) // 2
     text_y = rect.y + (rect.height - text_surface.get_height()) // 2
     surface.blit(text_surface, (text_x, text_y))
 
+# Rendered-text cache: most labels are static from frame to frame, so each (text, font, colors,
+# shadow offset) is rasterized once into a single surface (shadow underneath, text on top),
+# converted to the display format, and reused. Least recently used entries are dropped past
+# TEXT_CACHE_SIZE.
+TEXT_CACHE_SIZE = 256
+
+class TextCache:
+    """LRU cache of rendered text: get() returns (surface, (width, height)), where the size is
+    font.size(text) (the text's own box, not counting the shadow offset).
+    """
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, text, font_obj, color, shadow_color=None, offset=2):
+        key = (text, font_obj, color, shadow_color, offset)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self._render(text, font_obj, color, shadow_color, offset)
+        self._entries[key] = entry
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    @staticmethod
+    def _render(text, font_obj, color, shadow_color, offset):
+        text_surface = font_obj.render(text, False, color)
+        size = font_obj.size(text)
+        if shadow_color is None:
+            surf = text_surface
+        else:
+            w, h = text_surface.get_size()
+            surf = pygame.Surface((w + offset, h + offset), pygame.SRCALPHA)
+            surf.blit(font_obj.render(text, False, shadow_color), (offset, offset))
+            surf.blit(text_surface, (0, 0))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        return surf, size
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0}
+
+TEXT_CACHE = TextCache()
+
 def draw_pixel_text_with_shadow(surface, text, font_obj, x, y, text_color, shadow_color):
-    """Draw pixel-style text with a shadow."""
-    # Draw shadow
-    shadow_surface = font_obj.render(text, False, shadow_color)
-    surface.blit(shadow_surface, (x + 2, y + 2))
-    # Draw main text
-    text_surface = font_obj.render(text, False, text_color)
-    surface.blit(text_surface, (x, y))
+    """Draw pixel-style text with a shadow (from TEXT_CACHE). Returns the text size."""
+    surf, size = TEXT_CACHE.get(text, font_obj, text_color, shadow_color)
+    surface.blit(surf, (x, y))
+    return size
+
+def draw_pixel_text_centered(surface, text, font_obj, cx, y, text_color, shadow_color):
+    """draw_pixel_text_with_shadow centered horizontally on cx. Returns the text size."""
+    surf, size = TEXT_CACHE.get(text, font_obj, text_color, shadow_color)
+    surface.blit(surf, (cx - size[0] // 2, y))
+    return size
 
 def draw_pixel_grid(surface, cell_size, color):
     """Draw a pixel-style background grid."""
@@ -249,189 +600,897 @@ def draw_pixel_grid(surface, cell_size, color):
     for y in range(0, height, cell_size):
         pygame.draw.line(surface, color, (0, y), (width, y), 1)
 
-# Sound generation functions
-def generate_sound(frequency, duration, volume=0.5, sample_rate=22050):
-    """Generate a simple tone sound using numpy when available."""
-    if not NUMPY_AVAILABLE:
-        return None
-    try:
-        frames = int(duration * sample_rate)
-        t = np.linspace(0, duration, frames, endpoint=False)
-        wave = volume * np.sin(2 * np.pi * frequency * t)
-        # Match current mixer channels
-        mi = pygame.mixer.get_init() or (sample_rate, -16, 1)
-        channels = mi[2]
-        if channels == 2:
-            arr = np.vstack([wave, wave]).T
+def draw_screen_background(surface, grid_size):
+    """Fill with the primary background color and draw the pixel grid."""
+    surface.fill(PIXEL_COLORS['bg_primary'])
+    draw_pixel_grid(surface, grid_size, PIXEL_COLORS['bg_secondary'])
+
+# Static screen layers: each screen's invariant part (fill, grid, fixed panels, titles) is drawn
+# once into a display-format surface and blitted in a single call per frame. A layer is rebuilt
+# when the screen size, the palette or the caller's layout key changes.
+class LayerCache:
+    """name -> (key, Surface); blit() rebuilds the layer through build(surface) when its key changes."""
+    def __init__(self):
+        self._layers = {}
+        self.builds = 0
+        self.blits = 0
+
+    def get(self, name, build, key=(), size=None):
+        size = size or (SCREEN_WIDTH, SCREEN_HEIGHT)
+        full_key = (size, tuple(PIXEL_COLORS.values()), key)
+        entry = self._layers.get(name)
+        if entry is None or entry[0] != full_key:
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            build(layer)
+            entry = self._layers[name] = (full_key, layer)
+            self.builds += 1
+        return entry[1]
+
+    def blit(self, surface, name, build, key=()):
+        """Blit layer `name` over the whole of `surface`. Returns the layer."""
+        layer = self.get(name, build, key, surface.get_size())
+        surface.blit(layer, (0, 0))
+        self.blits += 1
+        return layer
+
+    def stats(self):
+        return {'layers': len(self._layers), 'builds': self.builds, 'blits': self.blits}
+
+LAYERS = LayerCache()
+
+# Entrance animations: a panel that fades, scales and slides in is baked once into
+# ENTRANCE_FRAMES composited SRCALPHA frames indexed by eased progress (rebuilt when the
+# caller's font/layout key or the palette changes). The last frame is the settled panel, so
+# once the animation ends each frame is a single cached blit.
+ENTRANCE_FRAMES = 16
+
+class EntranceFrames:
+    """name -> (key, frames); frame k is drawn by build(surface, k / (ENTRANCE_FRAMES - 1))."""
+    def __init__(self):
+        self._frames = {}
+        self.builds = 0
+        self.blits = 0
+
+    def get(self, name, build, size, key=()):
+        full_key = (size, tuple(PIXEL_COLORS.values()), key)
+        entry = self._frames.get(name)
+        if entry is None or entry[0] != full_key:
+            convert = pygame.display.get_surface() is not None
+            frames = []
+            for k in range(ENTRANCE_FRAMES):
+                frame = pygame.Surface(size, pygame.SRCALPHA)
+                build(frame, k / (ENTRANCE_FRAMES - 1))
+                frames.append(frame.convert_alpha() if convert else frame)
+            entry = self._frames[name] = (full_key, frames)
+            self.builds += 1
+        return entry[1]
+
+    def blit(self, surface, name, build, size, pos, ease, key=()):
+        """Blit the frame of `name` for eased progress `ease` (0..1) at `pos`. Returns the frame."""
+        frames = self.get(name, build, size, key)
+        frame = frames[int(max(0.0, min(1.0, ease)) * (len(frames) - 1))]
+        surface.blit(frame, pos)
+        self.blits += 1
+        return frame
+
+    def stats(self):
+        return {'animations': len(self._frames), 'builds': self.builds, 'blits': self.blits}
+
+ENTRANCES = EntranceFrames()
+
+# Translucent effects (title glow, input-box corners, instructions glow) are drawn into small
+# SRCALPHA overlays kept per effect and sized to the effect's bounds, instead of a new
+# full-screen surface each frame. An overlay only grows (in OVERLAY_GRAIN steps); each frame
+# clears just the pixels painted the frame before and blits just the pixels painted now (an
+# outline is tracked as its four edges, so the inside of a glow frame is never composited).
+OVERLAY_GRAIN = 32
+
+def _disjoint_rects(rects):
+    """Split overlapping rects into non-overlapping ones covering the same pixels (row bands)."""
+    ys = sorted({y for r in rects for y in (r.top, r.bottom)})
+    out = []
+    open_bands = {}  # (x0, x1) -> Rect still growing downwards
+    for y0, y1 in zip(ys, ys[1:]):
+        spans = sorted((r.left, r.right) for r in rects if r.top <= y0 and r.bottom >= y1)
+        merged = []
+        for x0, x1 in spans:
+            if merged and x0 <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], x1)
+            else:
+                merged.append([x0, x1])
+        bands = {}
+        for x0, x1 in merged:
+            band = open_bands.pop((x0, x1), None)
+            if band is not None and band.bottom == y0:
+                band.h += y1 - y0
+            else:
+                band = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+                out.append(band)
+            bands[(x0, x1)] = band
+        open_bands = bands
+    return out
+
+class Overlay:
+    """A pooled SRCALPHA surface placed at `origin`; rect() takes screen coordinates."""
+    def __init__(self, size):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.origin = (0, 0)
+        self.painted = []
+
+    def rect(self, color, rect, width=0):
+        """pygame.draw.rect onto the overlay, with `rect` in screen coordinates."""
+        local = pygame.Rect(rect).move(-self.origin[0], -self.origin[1])
+        drawn = pygame.draw.rect(self.surface, color, local, width)
+        if width > 0 and local.w > 2 * width and local.h > 2 * width:
+            self.painted += [pygame.Rect(local.x, local.y, local.w, width),
+                             pygame.Rect(local.x, local.bottom - width, local.w, width),
+                             pygame.Rect(local.x, local.y + width, width, local.h - 2 * width),
+                             pygame.Rect(local.right - width, local.y + width, width, local.h - 2 * width)]
         else:
-            arr = wave.reshape(-1, 1)
-        arr = (arr * 32767).astype(np.int16)
-        arr = np.ascontiguousarray(arr)
-        return pygame.sndarray.make_sound(arr)
-    except Exception as e:
-        print(f"Error generating sound: {e}")
-        return None
+            self.painted.append(drawn)
+        return drawn
 
-def _tone_bytes(frequency, duration, volume=0.5, sample_rate=22050, channels=1, waveform="sine"):
-    """Create raw PCM bytes for a tone. Uses numpy if available, else pure Python math.
-    Returns bytes suitable for pygame.mixer.Sound(buffer=...).
+class OverlayPool:
+    """name -> Overlay; begin() hands out a cleared overlay covering `bounds`, end() composites it."""
+    def __init__(self):
+        self._overlays = {}
+        self.allocations = 0
+        self.reuses = 0
+        self.blit_px = 0
+
+    def begin(self, name, bounds):
+        bounds = pygame.Rect(bounds)
+        overlay = self._overlays.get(name)
+        w, h = overlay.surface.get_size() if overlay is not None else (0, 0)
+        if bounds.w > w or bounds.h > h:
+            grow = lambda n: -(-n // OVERLAY_GRAIN) * OVERLAY_GRAIN
+            overlay = self._overlays[name] = Overlay((grow(max(bounds.w, w)), grow(max(bounds.h, h))))
+            self.allocations += 1
+        else:
+            for area in overlay.painted:
+                overlay.surface.fill((0, 0, 0, 0), area)
+            self.reuses += 1
+        overlay.origin = bounds.topleft
+        overlay.painted = []
+        return overlay
+
+    def end(self, surface, overlay):
+        """Blit the painted pixels of `overlay` onto `surface` (each pixel once)."""
+        clip = overlay.surface.get_rect()
+        areas = [r for r in (a.clip(clip) for a in _disjoint_rects(overlay.painted)) if r.w and r.h]
+        overlay.painted = areas
+        ox, oy = overlay.origin
+        surface.blits([(overlay.surface, (ox + a.x, oy + a.y), a) for a in areas], doreturn=False)
+        self.blit_px += sum(a.w * a.h for a in areas)
+
+    def stats(self):
+        return {'overlays': len(self._overlays), 'allocations': self.allocations, 'reuses': self.reuses,
+                'bytes': sum(o.surface.get_width() * o.surface.get_height() * 4 for o in self._overlays.values()),
+                'blit_px': self.blit_px}
+
+OVERLAYS = OverlayPool()
+
+# Dirty-rectangle presentation for the gameplay screen: instead of repainting and flipping the
+# whole window every frame, each drawn element is declared up front as (name, rect, version).
+# Elements whose rect or version changed, and unchanged elements overlapping an erased area,
+# are restored from the cached background layer and redrawn; only those rects are pushed with
+# pygame.display.update(rects). A version of None means "redraw every frame" (animations).
+DIRTY_RECTS = os.environ.get('RT_DIRTY_RECTS', '') != '0'
+DIRTY_RECTS_DEBUG = os.environ.get('RT_DIRTY_DEBUG', '') == '1'
+DIRTY_DEBUG_COLOR = (255, 0, 255)
+
+class DirtyRects:
+    """Tracks drawn elements between frames: begin() restores what must change and returns the
+    names to draw, present() pushes the touched rects (or the whole window after invalidate()).
     """
-    frames = int(duration * sample_rate)
-    if frames <= 0:
-        return b""
-
-    if NUMPY_AVAILABLE:
-        t = np.linspace(0, duration, frames, endpoint=False)
-        if waveform == "square":
-            wave = np.sign(np.sin(2 * np.pi * frequency * t)) * volume
+    def __init__(self, enabled=DIRTY_RECTS, debug=DIRTY_RECTS_DEBUG):
+        self.enabled = enabled
+        self.debug = debug
+        self._elements = {}
+        self._layer = None
+        self._push = None
+        self._full = True
+        self.frames = 0
+        self.full_frames = 0
+        self.pixels = 0
+        self.last_pixels = 0
+
+    def invalidate(self):
+        """Repaint and push the whole window on the next frame (screen entered, frame abandoned)."""
+        self._full = True
+
+    def begin(self, surface, layer, elements):
+        """Prepare `surface` for a frame over background `layer`; returns the set of element names to draw."""
+        current = {name: (pygame.Rect(rect) if rect else None, version) for name, rect, version in elements}
+        previous, self._elements = self._elements, current
+        if not self.enabled or self._full or layer is not self._layer:
+            surface.blit(layer, (0, 0))
+            self._layer = layer
+            self._full = True
+            self._push = None
+            return set(current)
+        erase = []
+        draw = set()
+        for name, (rect, version) in current.items():
+            old = previous.get(name)
+            if old is None or version is None or old != (rect, version):
+                if old is not None and old[0]:
+                    erase.append(old[0])
+                if rect:
+                    erase.append(rect)
+                    draw.add(name)
+        for name, (rect, _) in previous.items():
+            if name not in current and rect:
+                erase.append(rect)
+        # unchanged elements under an erased area lose pixels and must be drawn again
+        grew = True
+        while grew:
+            grew = False
+            for name, (rect, _) in current.items():
+                if rect and name not in draw and rect.collidelist(erase) != -1:
+                    draw.add(name)
+                    erase.append(rect)
+                    grew = True
+        bounds = surface.get_rect()
+        self._push = [r for r in (rect.clip(bounds) for rect in erase) if r.w and r.h]
+        for rect in self._push:
+            surface.blit(layer, rect, rect)
+        return draw
+
+    def present(self, surface):
+        """Push this frame to the display and count the pixels sent."""
+        if self._push is None:
+            pygame.display.update()
+            pixels = surface.get_width() * surface.get_height()
+            self.full_frames += 1
         else:
-            wave = np.sin(2 * np.pi * frequency * t) * volume
-        wave_i16 = (wave * 32767).astype(np.int16)
-        if channels == 2:
-            wave_i16 = np.repeat(wave_i16[:, None], 2, axis=1).ravel()
+            if self.debug:
+                # outlines stay on screen until their region is repainted
+                for rect in self._push:
+                    pygame.draw.rect(surface, DIRTY_DEBUG_COLOR, rect, 1)
+            if self._push:
+                pygame.display.update(self._push)
+            pixels = sum(rect.w * rect.h for rect in self._push)
+        self._full = False
+        self.frames += 1
+        self.pixels += pixels
+        self.last_pixels = pixels
+
+    def stats(self):
+        full = SCREEN_WIDTH * SCREEN_HEIGHT
+        per_frame = self.pixels / self.frames if self.frames else 0.0
+        return {'enabled': self.enabled, 'frames': self.frames, 'full_frames': self.full_frames,
+                'px_per_frame': int(per_frame), 'full_px': full, 'ratio': round(per_frame / full, 4)}
+
+DIRTY = DirtyRects()
+
+# Frame pacing shared by every screen loop: each loop calls PACER.tick() once per frame, which
+# waits for the next frame deadline (sleep most of the way, then spin the rest, since sleep()
+# alone overshoots by a scheduler tick on some systems) and records the frame time. The spin
+# margin starts at FRAME_SPIN and follows the measured sleep overshoot, so systems with precise
+# sleeps spin for a fraction of a millisecond. RT_FPS sets the default target (0 = uncapped); the settings screen can change it.
+# RT_VSYNC=1 asks for a vsynced window; when the display's refresh already paces the frames the
+# pacer only measures.
+def _env_frame_rate(default=60):
+    value = os.environ.get('RT_FPS', '').strip().lower()
+    if value in ('0', 'uncapped', 'off'):
+        return 0
+    try:
+        return max(0, int(value)) if value else default
+    except ValueError:
+        return default
+
+FRAME_RATE = _env_frame_rate()
+FRAME_RATE_CHOICES = (60, 120, 0)
+FRAME_VSYNC = os.environ.get('RT_VSYNC', '') == '1'
+FRAME_SPIN = 0.002
+FRAME_SPIN_MIN = 0.0003
+FRAME_SPIN_MAX = 0.004
+FRAME_HISTORY = 600
+IDLE_WAIT_MS = 500  # longest a static screen blocks in pygame.event.wait
+
+class FramePacer:
+    """Hybrid sleep-then-spin frame limiter with frame-time statistics."""
+    def __init__(self, fps=FRAME_RATE, spin=FRAME_SPIN):
+        self.spin = spin
+        self.vsync_rate = 0  # refresh rate of a vsynced window, 0 without vsync
+        self.set_target(fps)
+        self._deadline = None
+        self._last = None
+        self.times = collections.deque(maxlen=FRAME_HISTORY)
+        self.frames = 0
+        self.late = 0
+        self.slept = 0.0
+        self.spun = 0.0
+
+    def set_target(self, fps):
+        """Target frame rate; 0 (or None) runs uncapped."""
+        self.fps = int(fps or 0)
+        self.period = 1.0 / self.fps if self.fps > 0 else 0.0
+        self._deadline = None
+
+    def idle(self):
+        """The loop is about to block on input: restart the cadence so the wait is not counted as a frame."""
+        self._deadline = None
+        self._last = None
+
+    def set_vsync(self, refresh_rate):
+        self.vsync_rate = refresh_rate or 60
+
+    def _paced_by_display(self):
+        return self.vsync_rate and (not self.fps or self.fps >= self.vsync_rate)
+
+    def tick(self):
+        """Wait for the next frame deadline; returns the time since the previous tick (seconds)."""
+        now = time.perf_counter()
+        if self.period and not self._paced_by_display():
+            if self._deadline is None or now > self._deadline + self.period:
+                # first frame, or too far behind to catch up: restart the cadence from here
+                self._deadline = now
+            else:
+                remaining = self._deadline - now
+                if remaining > self.spin:
+                    t_sleep = time.perf_counter()
+                    time.sleep(remaining - self.spin)
+                    slept = time.perf_counter() - t_sleep
+                    self.slept += slept
+                    # grow the margin at once on a large overshoot, shrink it slowly otherwise
+                    wanted = min(FRAME_SPIN_MAX, max(FRAME_SPIN_MIN, 1.5 * (slept - (remaining - self.spin))))
+                    self.spin = wanted if wanted > self.spin else self.spin + 0.05 * (wanted - self.spin)
+                t_spin = time.perf_counter()
+                while time.perf_counter() < self._deadline:
+                    pass
+                self.spun += time.perf_counter() - t_spin
+            self._deadline += self.period
+            now = time.perf_counter()
+        dt = now - self._last if self._last is not None else 0.0
+        self._last = now
+        if dt:
+            self.times.append(dt)
+            self.frames += 1
+            if self.period and dt > self.period * 1.5:
+                self.late += 1
+        return dt
+
+    def stats(self):
+        if not self.times:
+            return {'target_fps': self.fps or 'uncapped', 'frames': 0}
+        ordered = sorted(self.times)
+        mean = sum(ordered) / len(ordered)
+        jitter = math.sqrt(sum((t - mean) ** 2 for t in ordered) / len(ordered))
+        return {'target_fps': self.fps or 'uncapped', 'vsync': bool(self.vsync_rate), 'frames': self.frames,
+                'fps': round(1.0 / mean, 1), 'mean_ms': round(mean * 1000, 3),
+                'p99_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3),
+                'max_ms': round(ordered[-1] * 1000, 3), 'jitter_ms': round(jitter * 1000, 3),
+                'late': self.late, 'slept_s': round(self.slept, 2), 'spun_s': round(self.spun, 2),
+                'spin_ms': round(self.spin * 1000, 2)}
+
+PACER = FramePacer()
+
+# Particles live in preallocated parallel arrays (NumPy when available, array('d') otherwise)
+# indexed by slot; freed slots go back on a free list. update() integrates every live particle
+# in one pass and draw() blits them all with one Surface.blits call from a cache of small
+# sprites, one per (color, size, alpha level) with alpha quantized to PARTICLE_ALPHA_LEVELS.
+# The sprite key packs the three into one integer (so NumPy can group particles by sprite), with
+# room for sizes up to PARTICLE_MAX_SIZE; spawn() clamps larger sizes so keys never collide.
+PARTICLE_CAPACITY = 4096
+PARTICLE_ALPHA_LEVELS = 16
+PARTICLE_MAX_SIZE = 63
+_PARTICLE_SIZE_SLOTS = PARTICLE_MAX_SIZE + 1
+
+class ParticleSystem:
+    """Fixed-capacity particle pool.
+
+    mode 'fade': alpha falls from 255 to 0 over each particle's life.
+    mode 'twinkle': particles never expire; alpha follows 90 + 80 * (0.5 + 0.5 * sin(2t + phase)),
+    capped at 170 (the title screen's stars).
+    """
+    FIELDS = ('x', 'y', 'vx', 'vy', 'age', 'life', 'phase')
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, mode='fade', use_numpy=None):
+        self.capacity = capacity
+        self.mode = mode
+        self.use_numpy = _load_numpy() if use_numpy is None else (use_numpy and _load_numpy())
+        if self.use_numpy:
+            for name in self.FIELDS:
+                setattr(self, name, np.zeros(capacity))
+            self.size = np.zeros(capacity, dtype=np.int32)
+            self.color = np.zeros(capacity, dtype=np.int32)
+            self.alive = np.zeros(capacity, dtype=bool)
         else:
-            # mono
-            pass
-        return wave_i16.tobytes()
-    else:
-        import math
-        from array import array
-        buf = array('h')
-        two_pi_f = 2.0 * math.pi * float(frequency)
-        for i in range(frames):
-            t = i / float(sample_rate)
-            if waveform == "square":
-                s = volume if math.sin(two_pi_f * t) >= 0 else -volume
+            from array import array
+            for name in self.FIELDS:
+                setattr(self, name, array('d', bytes(8 * capacity)))
+            self.size = array('i', bytes(4 * capacity))
+            self.color = array('i', bytes(4 * capacity))
+            self.alive = bytearray(capacity)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._high = 0  # slots at and above this index have never been used since the last reset
+        self._palette = []
+        self._sprites = {}
+        self.count = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self.count
+
+    def _color_index(self, color):
+        color = tuple(color)
+        if color not in self._palette:
+            self._palette.append(color)
+        return self._palette.index(color)
+
+    def spawn(self, x, y, vx, vy, life, size, color, phase=0.0):
+        """Add one particle; returns its slot, or -1 (counted in `dropped`) when the pool is full."""
+        if not self._free:
+            self.dropped += 1
+            return -1
+        i = self._free.pop()
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+        self.age[i], self.life[i], self.phase[i] = 0.0, life, phase
+        self.size[i] = max(0, min(PARTICLE_MAX_SIZE, int(size)))  # sprite keys assume this range
+        self.color[i] = self._color_index(color)
+        self.alive[i] = True
+        self.count += 1
+        self._high = max(self._high, i + 1)
+        return i
+
+    def clear(self):
+        for i in range(self._high):
+            self.alive[i] = False
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self._high = 0
+        self.count = 0
+
+    def update(self, dt, gravity=0.0):
+        """Advance every live particle by dt (gravity adds to vy); fade particles past their life are freed."""
+        n = self._high
+        if not self.count:
+            return
+        if self.use_numpy:
+            live = self.alive[:n]
+            self.age[:n][live] += dt
+            self.x[:n][live] += self.vx[:n][live] * dt
+            self.y[:n][live] += self.vy[:n][live] * dt
+            if gravity:
+                self.vy[:n][live] += gravity * dt
+            if self.mode == 'fade':
+                dead = np.flatnonzero(live & (self.age[:n] > self.life[:n]))
+                if len(dead):
+                    live[dead] = False
+                    self._free.extend(dead.tolist())
+                    self.count -= len(dead)
+        else:
+            x, y, vx, vy, age, life, alive = self.x, self.y, self.vx, self.vy, self.age, self.life, self.alive
+            fade = self.mode == 'fade'
+            for i in range(n):
+                if not alive[i]:
+                    continue
+                age[i] += dt
+                if fade and age[i] > life[i]:
+                    alive[i] = False
+                    self._free.append(i)
+                    self.count -= 1
+                    continue
+                x[i] += vx[i] * dt
+                y[i] += vy[i] * dt
+                vy[i] += gravity * dt
+        if not self.count:
+            self.clear()
+
+    def wrap(self, width, bottom, reseed_x):
+        """Title-star wrap: past `bottom` a particle restarts at the top at x = reseed_x(); x wraps at the sides."""
+        for i in self._live_indices():
+            if self.y[i] > bottom:
+                self.y[i] = -2
+                self.x[i] = reseed_x()
+            if self.x[i] < -2:
+                self.x[i] = width + 2
+            elif self.x[i] > width + 2:
+                self.x[i] = -2
+
+    def _live_indices(self):
+        if self.use_numpy:
+            return np.flatnonzero(self.alive[:self._high]).tolist()
+        return [i for i in range(self._high) if self.alive[i]]
+
+    def _levels(self, idx, now):
+        """Quantized alpha level (0..PARTICLE_ALPHA_LEVELS-1) for each live slot in idx."""
+        top = PARTICLE_ALPHA_LEVELS - 1
+        if self.use_numpy:
+            if self.mode == 'fade':
+                alpha = np.clip(255.0 * (1.0 - self.age[idx] / self.life[idx]), 0, 255).astype(np.int32)
             else:
-                s = volume * math.sin(two_pi_f * t)
-            sample = int(max(-1.0, min(1.0, s)) * 32767)
-            if channels == 2:
-                buf.append(sample)
-                buf.append(sample)
+                alpha = np.clip(90 + (80 * (0.5 + 0.5 * np.sin(2.0 * now + self.phase[idx]))).astype(np.int32), 0, 170)
+            return (alpha * top + 127) // 255
+        levels = []
+        for i in idx:
+            if self.mode == 'fade':
+                alpha = max(0, min(255, int(255 * (1.0 - self.age[i] / self.life[i]))))
             else:
-                buf.append(sample)
-        return buf.tobytes()
-
-def create_simple_beep_sound(frequency, duration, volume=0.4):
-    """Create a simple beep as a pygame Sound without requiring numpy."""
-    try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
-        pcm = _tone_bytes(frequency, duration, volume=volume, sample_rate=sample_rate, channels=channels, waveform="square")
-        if not pcm:
+                alpha = max(0, min(170, 90 + int(80 * (0.5 + 0.5 * math.sin(2.0 * now + self.phase[i])))))
+            levels.append((alpha * top + 127) // 255)
+        return levels
+
+    def _sprite(self, key):
+        """Sprite for key = (color_index * _PARTICLE_SIZE_SLOTS + size) * PARTICLE_ALPHA_LEVELS + level."""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            rest, level = divmod(key, PARTICLE_ALPHA_LEVELS)
+            color_index, size = divmod(rest, _PARTICLE_SIZE_SLOTS)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            sprite.fill((*self._palette[color_index], level * 255 // (PARTICLE_ALPHA_LEVELS - 1)))
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, surface, now=0.0):
+        """Blit every live particle onto `surface` in one Surface.blits call."""
+        if not self.count:
+            return
+        if self.use_numpy:
+            idx = np.flatnonzero(self.alive[:self._high])
+            levels = self._levels(idx, now)
+            visible = levels > 0
+            idx, levels = idx[visible], levels[visible]
+            keys = (self.color[idx] * _PARTICLE_SIZE_SLOTS + self.size[idx]) * PARTICLE_ALPHA_LEVELS + levels
+            # one sprite lookup per distinct key, then the blit list is built without a Python loop
+            unique, inverse = np.unique(keys, return_inverse=True)
+            table = [self._sprite(key) for key in unique.tolist()]
+            positions = zip(self.x[idx].astype(np.int32).tolist(), self.y[idx].astype(np.int32).tolist())
+            surface.blits(list(zip(map(table.__getitem__, inverse.tolist()), positions)), doreturn=False)
+            return
+        idx = self._live_indices()
+        blits = []
+        for i, level in zip(idx, self._levels(idx, now)):
+            if level:
+                key = (self.color[i] * _PARTICLE_SIZE_SLOTS + self.size[i]) * PARTICLE_ALPHA_LEVELS + level
+                blits.append((self._sprites.get(key) or self._sprite(key), (int(self.x[i]), int(self.y[i]))))
+        surface.blits(blits, doreturn=False)
+
+    def bounds(self, pad=3):
+        """Rect covering every live particle (sprites up to `pad` px), or None when empty."""
+        if not self.count:
             return None
-        snd = pygame.mixer.Sound(buffer=pcm)
-        snd.set_volume(min(1.0, max(0.0, volume)))
-        return snd
-    except Exception as e:
-        print(f"Error creating simple beep: {e}")
-        return None
-
-def create_success_sound():
-    """Create a pleasant success sound distinct from combo: a short chiming tone
-    with a subtle harmonic and a gentle fade-out. Works with and without numpy.
+        if self.use_numpy:
+            live = self.alive[:self._high]
+            xs, ys = self.x[:self._high][live], self.y[:self._high][live]
+            x0, y0, x1, y1 = int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
+        else:
+            idx = self._live_indices()
+            x0, x1 = int(min(self.x[i] for i in idx)), int(max(self.x[i] for i in idx))
+            y0, y1 = int(min(self.y[i] for i in idx)), int(max(self.y[i] for i in idx))
+        return pygame.Rect(x0, y0, x1 - x0 + pad, y1 - y0 + pad)
+
+    def stats(self):
+        return {'live': self.count, 'capacity': self.capacity, 'dropped': self.dropped,
+                'sprites': len(self._sprites), 'backend': 'numpy' if self.use_numpy else 'array'}
+
+# Persistent PCM cache for synthesized sounds (content-addressed by mixer format + generator parameters)
+PCM_CACHE_ENABLED = True
+PCM_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.reaction_mini', 'pcm_cache')
+PCM_CACHE_VERSION = 2  # bump when a renderer changes its output for the same parameters
+
+def _pcm_cache_key(name, params):
+    """Hash of everything that determines a sound's PCM: name, mixer format, synthesis path and parameters."""
+    mi = pygame.mixer.get_init()
+    desc = {
+        'name': name,
+        'format': list(mi) if mi else None,
+        'engine': 'numpy' if NUMPY_AVAILABLE else 'python',
+        'version': PCM_CACHE_VERSION,
+        'params': params,
+    }
+    blob = json.dumps(desc, sort_keys=True, default=repr)
+    return hashlib.sha1(blob.encode('utf-8')).hexdigest()[:20]
+
+@contextlib.contextmanager
+def _cached_pcm(name, params, render):
+    """Yield raw int16 PCM for `name` as a buffer: a read-only memory map of the cache file when
+    the key matches, otherwise the result of render() (stored to disk, stale entries pruned).
+    The buffer is only valid inside the with-block.
     """
+    if not PCM_CACHE_ENABLED:
+        yield render()
+        return
+    key = _pcm_cache_key(name, params)
+    path = os.path.join(PCM_CACHE_DIR, f"{name}-{key}.pcm")
+    mm = None
     try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
-        duration = 0.18
-        f1 = 784.0   # G5
-        f2 = 1568.0  # 2nd harmonic (subtle)
-        frames = int(duration * sample_rate)
-        if frames <= 0:
-            return None
-
-        if NUMPY_AVAILABLE:
-            t = np.linspace(0.0, duration, frames, endpoint=False)
-            # Simple linear envelope: 10ms attack, 60ms release
-            attack = int(0.010 * sample_rate)
-            release = int(0.060 * sample_rate)
-            env = np.ones(frames, dtype=np.float32)
-            if attack > 0:
-                env[:attack] = np.linspace(0.0, 1.0, attack, endpoint=False)
-            if release > 0:
-                env[-release:] = np.linspace(1.0, 0.0, release, endpoint=False)
-            wave = (0.85 * np.sin(2 * np.pi * f1 * t) + 0.25 * np.sin(2 * np.pi * f2 * t)) * env
-            wave_i16 = (wave * 32767).astype(np.int16)
-            if channels == 2:
-                pcm = np.repeat(wave_i16[:, None], 2, axis=1).ravel().tobytes()
-            else:
-                pcm = wave_i16.tobytes()
-        else:
-            import math
-            from array import array
-            buf = array('h')
-            attack = int(0.010 * sample_rate)
-            release = int(0.060 * sample_rate)
-            two_pi_f1 = 2.0 * math.pi * f1
-            two_pi_f2 = 2.0 * math.pi * f2
-            for i in range(frames):
-                t = i / float(sample_rate)
-                # Envelope
-                if i < attack:
-                    env = i / float(max(1, attack))
-                elif i >= frames - release:
-                    env = (frames - i) / float(max(1, release))
-                else:
-                    env = 1.0
-                s = (0.85 * math.sin(two_pi_f1 * t) + 0.25 * math.sin(two_pi_f2 * t)) * env
-                sample = int(max(-1.0, min(1.0, s)) * 32767)
-                if channels == 2:
-                    buf.append(sample)
-                    buf.append(sample)
-                else:
-                    buf.append(sample)
-            pcm = buf.tobytes()
-
-        snd = pygame.mixer.Sound(buffer=pcm)
-        # Volume will be normalized later; set a reasonable default
-        snd.set_volume(SFX_VOL_SUCCESS)
-        return snd
+        if os.path.isfile(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except Exception as e:
-        print(f"Error generating success sound: {e}")
-        return None
+        print(f"[Audio] PCM cache read failed for {name}: {e}")
+    if mm is not None:
+        try:
+            yield mm
+        finally:
+            mm.close()
+        return
+    pcm = render()
+    try:
+        os.makedirs(PCM_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(memoryview(pcm).cast('B'))
+        os.replace(tmp, path)
+        # Parameters or mixer format changed: drop older entries for this sound
+        for fname in os.listdir(PCM_CACHE_DIR):
+            if fname.startswith(f"{name}-") and fname.endswith('.pcm') and fname != os.path.basename(path):
+                try: os.remove(os.path.join(PCM_CACHE_DIR, fname))
+                except Exception: pass
+    except Exception as e:
+        print(f"[Audio] PCM cache write failed for {name}: {e}")
+    yield pcm
+
+def _cached_sound(name, params, render):
+    """Return a pygame Sound for `name` built from _cached_pcm (Sound copies the buffer)."""
+    with _cached_pcm(name, params, render) as pcm:
+        return pygame.mixer.Sound(buffer=pcm)
+
+# Wavetable oscillators for the pure-Python (no numpy) synthesis path.
+# One cycle of each waveform is precomputed; oscillators step through it with a 16.16
+# fixed-point phase accumulator, so a sample costs an integer add/shift/mask and a list index
+# instead of math.sin() and float clamping.
+WAVETABLE_BITS = 14
+WAVETABLE_SIZE = 1 << WAVETABLE_BITS
+_WT_FRAC = 16
+_WT_MASK = WAVETABLE_SIZE - 1
+_WAVETABLES = {}
+
+def _wavetable(wave):
+    """Return the cached one-cycle table for 'sine' or 'square' (sign of sine)."""
+    table = _WAVETABLES.get(wave)
+    if table is None:
+        sine = [math.sin(2.0 * math.pi * k / WAVETABLE_SIZE) for k in range(WAVETABLE_SIZE)]
+        if wave == 'square':
+            table = [1.0 if s > 0 else (-1.0 if s < 0 else 0.0) for s in sine]
+            table[WAVETABLE_SIZE // 2] = 0.0
+        else:
+            table = sine
+        _WAVETABLES[wave] = table
+    return table
+
+def _wt_phase(cycles):
+    """Fixed-point table phase for a (possibly huge) number of elapsed cycles."""
+    return int((cycles % 1.0) * (WAVETABLE_SIZE << _WT_FRAC))
+
+def _wt_increment(freq, seconds_per_sample):
+    """Fixed-point phase increment per sample for `freq` Hz."""
+    return int(round(freq * seconds_per_sample * (WAVETABLE_SIZE << _WT_FRAC)))
+
+def _wt_osc(table, phase, inc, n):
+    """n samples of `table` starting at fixed-point `phase`, advancing `inc` per sample."""
+    frac, mask = _WT_FRAC, _WT_MASK
+    return [table[(p >> frac) & mask] for p in range(phase, phase + n * inc, inc)] if inc else [table[(phase >> frac) & mask]] * n
+
+def _wt_envelope(n, a, d, sus, r):
+    """Whole-note ADSR envelope as a list (attack, decay, sustain, release; release wins over decay)."""
+    env = [sus] * n
+    for i in range(max(0, n - r), n):
+        env[i] = sus * (n - i) / float(max(1, r))
+    for i in range(a, min(a + d, max(0, n - r))):
+        env[i] = 1.0 - (1.0 - sus) * (i - a) / float(d)
+    for i in range(min(a, n)):
+        env[i] = i / float(max(1, a))
+    return env
+
+def _pcm_from_floats(samples, channels, full_scale=1.0):
+    """Clip float samples to [-full_scale, full_scale], scale to int16 and pack them into an
+    array('h') in one go. Mixing directly in int16 units (full_scale=32767) skips the multiply.
+    """
+    from array import array
+    gain = 32767.0 / full_scale
+    if samples and (max(samples) >= full_scale or min(samples) <= -full_scale):
+        samples = [full_scale if s >= full_scale else (-full_scale if s <= -full_scale else s) for s in samples]
+    if gain != 1.0:
+        samples = [s * gain for s in samples]
+    pcm = array('h', map(int, samples))
+    if channels == 2:
+        stereo = array('h', bytes(4 * len(pcm)))
+        stereo[0::2] = pcm
+        stereo[1::2] = pcm
+        return stereo
+    return pcm
+
+# Sound patches: every SFX is a data entry rendered by the patch engine below.
+# Patch fields:
+#   notes     - list of (frequency Hz, duration s, level); frequency None (or level 0) is a gap
+#   wave      - 'sine' or 'square'
+#   harmonics - list of (frequency multiple, amplitude) summed per note; default [(1, 1.0)]
+#   adsr      - (attack s, decay s, sustain level, release s) applied to every note; default flat
+#   level     - overall gain applied after harmonics/envelope
+#   volume    - base gain of the resulting Sound (scaled by its bus and master volume)
+#   bus       - SoundBank mixing bus: 'sfx' (default) or 'ui'
+#   group     - CHANNEL_GROUPS entry it plays on; default 'feedback' ('ui' for the ui bus)
+SOUND_PATCHES = {
+    # Success chime: G5 with a subtle 2nd harmonic, 10ms attack / 60ms release
+    'success': {'notes': [(784.0, 0.18, 1.0)], 'harmonics': [(1, 0.85), (2, 0.25)],
+                'adsr': (0.010, 0.0, 1.0, 0.060), 'volume': SFX_VOL_SUCCESS},
+    # G3 slightly lower than 220Hz to differentiate
+    'error': {'notes': [(196.0, 0.25, 0.35)], 'volume': SFX_VOL_ERROR},
+    # Two descending disappointed tones
+    'miss': {'notes': [(349, 0.15, 0.30), (None, 0.05, 0.0), (294, 0.20, 0.25)], 'volume': SFX_VOL_MISS},
+    # Two short pleasant tones
+    'combo': {'notes': [(523, 0.10, 0.25), (None, 0.05, 0.0), (659, 0.10, 0.25)], 'volume': SFX_VOL_COMBO},
+    # Navigation: short mid tone with tiny decay-like effect via two segments
+    'ui_nav': {'notes': [(660, 0.05, 0.22), (660, 0.03, 0.14)], 'volume': UI_VOL_NAV, 'bus': 'ui'},
+    # Key tap: very short high tone
+    'ui_key_tap': {'notes': [(1500, 0.03, 0.20)], 'volume': UI_VOL_KEY_TAP, 'bus': 'ui'},
+    # Backspace: slightly lower short tone
+    'ui_key_backspace': {'notes': [(600, 0.04, 0.22)], 'volume': UI_VOL_KEY_BACKSPACE, 'bus': 'ui'},
+    # Enter: small upward two-tone
+    'ui_key_enter': {'notes': [(880, 0.05, 0.20), (None, 0.02, 0.0), (1175, 0.06, 0.20)], 'volume': UI_VOL_KEY_ENTER, 'bus': 'ui'},
+    # Game Start: rising triad (C5, E5, G5)
+    'start': {'notes': [(523.25, 0.12, 0.22), (None, 0.03, 0.0), (659.25, 0.12, 0.22), (None, 0.03, 0.0),
+                        (783.99, 0.16, 0.22)], 'volume': SFX_VOL_START},
+    # Game Over: descending minor-ish (E5, C5, A4) and longer
+    'gameover': {'notes': [(659.25, 0.30, 0.22), (None, 0.06, 0.0), (523.25, 0.30, 0.22), (None, 0.06, 0.0),
+                           (440.00, 0.32, 0.22)], 'volume': SFX_VOL_GAMEOVER},
+    # Countdown 3-2-1: a soft mid-high sine blip
+    'countdown': {'notes': [(800.0, 0.09, 0.22)], 'volume': UI_VOL_COUNTDOWN, 'bus': 'ui',
+                  'group': 'countdown'},
+}
+# Pre-mixed composites: patches that always sound together, summed into one buffer so they
+# take one channel. Entries are (patch name, level relative to that patch's own volume).
+SOUND_COMPOSITES = {
+    # Perfect hit: the success chime with the combo tones softly underneath
+    'perfect': [('success', 1.0), ('combo', 0.6)],
+}
+_WAVE_CODES = {'sine': 0, 'square': 1}
 
-def create_combo_sound():
-    """Create combo sound effect - two short pleasant tones.
-    Uses numpy if available; else builds bytes manually.
+def _patch_notes(patches, sample_rate):
+    """Flatten patches into per-note rows and the bank layout.
+    Returns (rows, layout): rows are (frames, freq, level, wave, harmonics, adsr_frames, sustain, step)
+    where step is the note's time step (duration / frames, like np.linspace(0, duration, frames));
+    layout maps patch name -> (first frame, frame count) inside the bank buffer.
     """
-    try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
+    rows = []
+    layout = {}
+    pos = 0
+    for name in sorted(patches):
+        patch = patches[name]
+        start = pos
+        harmonics = patch.get('harmonics', [(1, 1.0)])
+        attack, decay, sustain, release = patch.get('adsr', (0.0, 0.0, 1.0, 0.0))
+        adsr_frames = (int(attack * sample_rate), int(decay * sample_rate), int(release * sample_rate))
+        wave = _WAVE_CODES.get(patch.get('wave', 'sine'), 0)
+        level = float(patch.get('level', 1.0))
+        for (freq, dur, note_level) in patch['notes']:
+            frames = int(dur * sample_rate)
+            if frames <= 0:
+                continue
+            gain = 0.0 if freq is None else level * note_level
+            rows.append((frames, freq or 0.0, gain, wave, harmonics, adsr_frames, sustain, dur / frames))
+            pos += frames
+        layout[name] = (start, pos - start)
+    return rows, layout
+
+def _render_patch_bank_numpy(rows, total, sample_rate, channels):
+    """Synthesize every note of every patch in one vectorized pass into one int16 buffer."""
+    n_notes = len(rows)
+    frames = np.array([r[0] for r in rows], dtype=np.int64)
+    note_id = np.repeat(np.arange(n_notes), frames)
+    note_start = np.cumsum(frames) - frames
+    i = np.arange(total, dtype=np.int64) - note_start[note_id]
+    t = i * np.array([r[7] for r in rows])[note_id]
+    n = frames[note_id]
+
+    # Oscillators: harmonics padded to a common count (zero amplitude for unused slots)
+    max_h = max(len(r[4]) for r in rows)
+    mult = np.zeros((n_notes, max_h))
+    amp = np.zeros((n_notes, max_h))
+    for k, r in enumerate(rows):
+        for h, (m, a) in enumerate(r[4]):
+            mult[k, h] = m
+            amp[k, h] = a
+    freq = np.array([r[1] for r in rows])[note_id]
+    square = np.array([r[3] == 1 for r in rows])[note_id]
+    wave = np.zeros(total)
+    for h in range(max_h):
+        osc = np.sin(2 * np.pi * (mult[note_id, h] * freq) * t)
+        osc = np.where(square, np.sign(osc), osc)
+        wave += amp[note_id, h] * osc
+
+    # ADSR envelope per note (flat 1.0 when all stages are zero)
+    a = np.array([r[5][0] for r in rows])[note_id]
+    d = np.array([r[5][1] for r in rows])[note_id]
+    rel = np.array([r[5][2] for r in rows])[note_id]
+    sus = np.array([r[6] for r in rows])[note_id]
+    env = sus.astype(np.float64)
+    in_decay = (i >= a) & (i < a + d)
+    env[in_decay] = 1.0 - (1.0 - sus[in_decay]) * (i[in_decay] - a[in_decay]) / d[in_decay]
+    in_release = i >= n - rel
+    env[in_release] = sus[in_release] * (n[in_release] - i[in_release]) / np.maximum(1, rel[in_release])
+    in_attack = i < a
+    env[in_attack] = i[in_attack] / np.maximum(1, a[in_attack])
+
+    gain = np.array([r[2] for r in rows])[note_id]
+    out = np.empty((total, channels), dtype=np.int16)
+    out[:] = (np.clip(wave * env * gain, -1.0, 1.0) * 32767).astype(np.int16)[:, None]
+    return out
+
+def _render_patch_bank_python(rows, total, sample_rate, channels):
+    """Pure-Python fallback for _render_patch_bank_numpy: wavetable oscillators and
+    whole-note envelopes, packed into one int16 array at the end.
+    """
+    samples = []
+    for (frames, freq, gain, wave, harmonics, (a, d, r), sus, step) in rows:
+        if gain == 0.0:
+            samples.extend([0.0] * frames)
+            continue
+        table = _wavetable('square' if wave == 1 else 'sine')
+        note = [0.0] * frames
+        for (m, amp) in harmonics:
+            osc = _wt_osc(table, 0, _wt_increment(m * freq, step), frames)
+            note = [acc + amp * o for acc, o in zip(note, osc)]
+        env = _wt_envelope(frames, a, d, sus, r)
+        samples.extend([s * e * gain for s, e in zip(note, env)])
+    return _pcm_from_floats(samples, channels)
+
+def _mix_pcm(layers):
+    """Sum int16 PCM buffers [(bytes, gain)] into one int16 buffer as long as the longest, clipping."""
+    if NUMPY_AVAILABLE:
+        acc = np.zeros(max(len(pcm) for pcm, _ in layers) // 2, dtype=np.float64)
+        for pcm, gain in layers:
+            x = np.frombuffer(pcm, dtype=np.int16)
+            acc[:x.size] += x * gain
+        return np.clip(acc, -32767, 32767).astype(np.int16).tobytes()
+    from array import array
+    acc = [0.0] * (max(len(pcm) for pcm, _ in layers) // 2)
+    for pcm, gain in layers:
+        x = array('h')
+        x.frombytes(pcm)
+        for i, v in enumerate(x):
+            acc[i] += v * gain
+    return _pcm_from_floats(acc, 1, full_scale=32767.0).tobytes()
+
+def render_patch_bank(patches=None, cache_name='sfx_bank'):
+    """Render all patches (default SOUND_PATCHES) into one buffer and return {name: Sound}.
+    The bank goes through the PCM cache as a single entry (skipped when cache_name is None);
+    each Sound is built from a memoryview slice of that buffer, so no per-sound PCM copies
+    are made on our side.
+    """
+    patches = SOUND_PATCHES if patches is None else patches
+    _load_numpy()
+    mi = pygame.mixer.get_init() or (22050, -16, 1)
+    sample_rate, _, channels = mi
+    rows, layout = _patch_notes(patches, sample_rate)
+    total = sum(r[0] for r in rows)
+    if total <= 0:
+        return {}
+
+    def render():
         if NUMPY_AVAILABLE:
-            # Build two short sine beeps with a small gap
-            part1 = _tone_bytes(523, 0.10, volume=0.25, sample_rate=sample_rate, channels=channels, waveform="sine")
-            gap = _tone_bytes(523, 0.05, volume=0.0, sample_rate=sample_rate, channels=channels, waveform="sine")
-            part2 = _tone_bytes(659, 0.10, volume=0.25, sample_rate=sample_rate, channels=channels, waveform="sine")
-            pcm = part1 + gap + part2
-        else:
-            # Pure-Python fallback: use sine to reduce harshness
-            part1 = _tone_bytes(523, 0.10, volume=0.25, sample_rate=sample_rate, channels=channels, waveform="sine")
-            gap = _tone_bytes(523, 0.05, volume=0.0, sample_rate=sample_rate, channels=channels, waveform="sine")
-            part2 = _tone_bytes(659, 0.10, volume=0.25, sample_rate=sample_rate, channels=channels, waveform="sine")
-            pcm = part1 + gap + part2
-        snd = pygame.mixer.Sound(buffer=pcm)
-        snd.set_volume(0.6)
-        return snd
-    except Exception as e:
-        print(f"Error generating combo sound: {e}")
-        return None
+            return _render_patch_bank_numpy(rows, total, sample_rate, channels)
+        return _render_patch_bank_python(rows, total, sample_rate, channels)
+
+    bank = {}
+    frame_bytes = 2 * channels
+    cached = _cached_pcm(cache_name, patches, render) if cache_name else contextlib.nullcontext(render())
+    with cached as pcm:
+        view = memoryview(pcm).cast('B')
+        try:
+            for name, (start, frames) in layout.items():
+                if frames <= 0:
+                    continue
+                snd = pygame.mixer.Sound(buffer=view[start * frame_bytes:(start + frames) * frame_bytes])
+                snd.set_volume(patches[name].get('volume', SFX_TARGET_VOLUME))
+                bank[name] = snd
+        finally:
+            view.release()
+    return bank
 
-def create_miss_sound():
-    """Create miss sound effect - two descending disappointed tones."""
-    try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
-        part1 = _tone_bytes(349, 0.15, volume=0.30, sample_rate=sample_rate, channels=channels, waveform="sine")
-        gap = _tone_bytes(349, 0.05, volume=0.0, sample_rate=sample_rate, channels=channels, waveform="sine")
-        part2 = _tone_bytes(294, 0.20, volume=0.25, sample_rate=sample_rate, channels=channels, waveform="sine")
-        pcm = part1 + gap + part2
-        snd = pygame.mixer.Sound(buffer=pcm)
-        snd.set_volume(0.6)
-        return snd
-    except Exception as e:
-        print(f"Error generating miss sound: {e}")
-        return None
+_PATCH_SOUNDS = None
+
+def _patch_sound(name):
+    """Return the Sound rendered for patch `name` (renders the whole bank on first use)."""
+    global _PATCH_SOUNDS
+    if _PATCH_SOUNDS is None:
+        _PATCH_SOUNDS = render_patch_bank()
+    return _PATCH_SOUNDS.get(name)
 
 def create_ui_sounds():
     """Create UI sounds: page navigation and keyboard typing clicks.
@@ -440,35 +1499,8 @@ def create_ui_sounds():
     if not SOUND_ENABLED:
         return None, None, None, None
     try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
-
-        # Navigation sound: short mid tone with tiny decay-like effect via two segments
-        nav_p1 = _tone_bytes(660, 0.05, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        nav_p2 = _tone_bytes(660, 0.03, volume=0.14, sample_rate=sample_rate, channels=channels, waveform="sine")
-        nav_pcm = nav_p1 + nav_p2
-        nav = pygame.mixer.Sound(buffer=nav_pcm)
-        nav.set_volume(UI_VOL_NAV)
-
-        # Key tap: very short high tone
-        tap_pcm = _tone_bytes(1500, 0.03, volume=0.20, sample_rate=sample_rate, channels=channels, waveform="sine")
-        tap = pygame.mixer.Sound(buffer=tap_pcm)
-        tap.set_volume(UI_VOL_KEY_TAP)
-
-        # Backspace: slightly lower short tone
-        back_pcm = _tone_bytes(600, 0.04, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        back = pygame.mixer.Sound(buffer=back_pcm)
-        back.set_volume(UI_VOL_KEY_BACKSPACE)
-
-        # Enter: small upward two-tone
-        ent_p1 = _tone_bytes(880, 0.05, volume=0.20, sample_rate=sample_rate, channels=channels, waveform="sine")
-        ent_gap = _tone_bytes(880, 0.02, volume=0.0, sample_rate=sample_rate, channels=channels, waveform="sine")
-        ent_p2 = _tone_bytes(1175, 0.06, volume=0.20, sample_rate=sample_rate, channels=channels, waveform="sine")
-        ent_pcm = ent_p1 + ent_gap + ent_p2
-        enter = pygame.mixer.Sound(buffer=ent_pcm)
-        enter.set_volume(UI_VOL_KEY_ENTER)
-
-        return nav, tap, enter, back
+        return (_patch_sound('ui_nav'), _patch_sound('ui_key_tap'),
+                _patch_sound('ui_key_enter'), _patch_sound('ui_key_backspace'))
     except Exception as e:
         print(f"[Audio] UI sound generation failed: {e}")
         return None, None, None, None
@@ -478,28 +1510,7 @@ def create_event_sounds():
     if not SOUND_ENABLED:
         return None, None
     try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
-
-        # Game Start: rising triad (C5, E5, G5)
-        s1 = _tone_bytes(523.25, 0.12, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        gap = _tone_bytes(440.00, 0.03, volume=0.0, sample_rate=sample_rate, channels=channels, waveform="sine")
-        s2 = _tone_bytes(659.25, 0.12, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        s3 = _tone_bytes(783.99, 0.16, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        start_pcm = s1 + gap + s2 + gap + s3
-        start_snd = pygame.mixer.Sound(buffer=start_pcm)
-        start_snd.set_volume(SFX_VOL_START)
-
-        # Game Over: descending minor-ish (E5, C5, A4) and longer
-        g1 = _tone_bytes(659.25, 0.30, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        ggap = _tone_bytes(440.00, 0.06, volume=0.0, sample_rate=sample_rate, channels=channels, waveform="sine")
-        g2 = _tone_bytes(523.25, 0.30, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        g3 = _tone_bytes(440.00, 0.32, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        gameover_pcm = g1 + ggap + g2 + ggap + g3
-        gameover_snd = pygame.mixer.Sound(buffer=gameover_pcm)
-        gameover_snd.set_volume(SFX_VOL_GAMEOVER)
-
-        return start_snd, gameover_snd
+        return _patch_sound('start'), _patch_sound('gameover')
     except Exception as e:
         print(f"[Audio] Event sound generation failed: {e}")
         return None, None
@@ -509,68 +1520,526 @@ def create_countdown_beep():
     if not SOUND_ENABLED:
         return None
     try:
-        mi = pygame.mixer.get_init() or (22050, -16, 1)
-        sample_rate, _, channels = mi
-        # A soft mid-high sine blip
-        pcm = _tone_bytes(800.0, 0.09, volume=0.22, sample_rate=sample_rate, channels=channels, waveform="sine")
-        snd = pygame.mixer.Sound(buffer=pcm)
-        snd.set_volume(UI_VOL_COUNTDOWN)
-        return snd
+        return _patch_sound('countdown')
     except Exception as e:
         print(f"[Audio] Countdown beep generation failed: {e}")
         return None
 
 def create_game_sounds():
-    """Create game sound effects with robust fallbacks."""
+    """Create game sound effects (success, error, miss, combo) from their patches."""
     if not SOUND_ENABLED:
         print("[Audio] disabled – running without sound effects")
         return None, None, None, None
+    try:
+        return (_patch_sound('success'), _patch_sound('error'),
+                _patch_sound('miss'), _patch_sound('combo'))
+    except Exception as e:
+        print(f"[Audio] sound patch rendering failed: {e}")
+        return None, None, None, None
 
-    # Prefer smoother sine tones via numpy when available
-    if NUMPY_AVAILABLE:
-        try:
-            success_sound = create_success_sound()
-            error_sound = generate_sound(196, 0.25, 0.35)   # G3 slightly lower than 220Hz to differentiate
-            miss_sound = create_miss_sound()
-            combo_sound = create_combo_sound()
-            if success_sound and error_sound and miss_sound and combo_sound:
-                # Normalize volumes with fine-tuned per-sound targets
-                success_sound.set_volume(SFX_VOL_SUCCESS)
-                error_sound.set_volume(SFX_VOL_ERROR)
-                miss_sound.set_volume(SFX_VOL_MISS)
-                combo_sound.set_volume(SFX_VOL_COMBO)
-                return success_sound, error_sound, miss_sound, combo_sound
+# Background music arrangement (shared by the scalar and NumPy renderers)
+BGM_BPM = 120.0              # tempo
+BGM_MEASURE_BEATS = 4        # 4/4 measures
+# Chord progression (A minor-ish): Am | F | C | G (loop)
+# Arp notes per chord (triad, middle octave)
+BGM_CHORDS = [
+    [440.00, 523.25, 659.25],  # Am: A4, C5, E5
+    [349.23, 440.00, 523.25],  # F:  F4, A4, C5
+    [261.63, 329.63, 392.00],  # C:  C4, E4, G4
+    [392.00, 493.88, 587.33],  # G:  G4, B4, D5
+]
+# Bass roots (lower octave)
+BGM_BASS = [110.00, 87.31, 65.41, 98.00]  # A2, F2, C2, G2
+# Arpeggio pattern varies by measure parity
+# Even measures: 0-1-2-1; odd measures: 0-2-1-2
+BGM_ARP_PATTERNS = ([0, 1, 2, 1], [0, 2, 1, 2])
+# Envelopes and voice levels
+BGM_ATTACK_S = 0.010
+BGM_RELEASE_S = 0.060
+BGM_KICK_LEN = 0.11
+BGM_SNARE_LEN = 0.045
+BGM_HAT_LEN = 0.020
+BGM_ARP_LEVEL = 0.13
+BGM_BASS_LEVEL = 0.10
+BGM_KICK_LEVEL = 0.20
+BGM_SNARE_LEVEL = 0.16
+BGM_HAT_LEVEL = 0.08
+# Voices the loop can be split into (adaptive music plays each one on its own channel)
+BGM_STEM_NAMES = ('arp', 'bass', 'drums')
+# Simple PRNG for noise (hats/snare); LCG parameters
+BGM_NOISE_SEED = 1234567
+_LCG_A = 1103515245
+_LCG_C = 12345
+_LCG_MASK = 0x7fffffff
+
+def _render_bgm_scalar(sample_rate, frames, channels=1):
+    """Render the BGM loop one sample at a time (pure Python). Returns int16 PCM bytes.
+    Reference implementation: the game uses _render_bgm_numpy or _render_bgm_wavetable,
+    tools/bench_bgm.py checks both against this loop.
+    """
+    import math
+    from array import array
+
+    duration = frames / float(sample_rate)
+    beat_len = 60.0 / BGM_BPM  # seconds per quarter
+    step_len = beat_len / 2.0  # 8th notes grid
+    steps = int(duration / step_len)
+    measure_len = beat_len * BGM_MEASURE_BEATS  # length of a 4/4 measure
+
+    def env_linear(i, total, a_samples, r_samples):
+        # 0..1 envelope with attack then release
+        if i < a_samples:
+            return i / float(max(1, a_samples))
+        if i >= total - r_samples:
+            return (total - i) / float(max(1, r_samples))
+        return 1.0
+
+    buf = array('h')
+    # Precompute constants
+    two_pi = 2.0 * math.pi
+    step_samples = int(step_len * sample_rate)
+    a_samp = int(BGM_ATTACK_S * sample_rate)
+    r_samp = int(BGM_RELEASE_S * sample_rate)
+
+    noise_state = BGM_NOISE_SEED
+    def next_noise():
+        nonlocal noise_state
+        noise_state = (_LCG_A * noise_state + _LCG_C) & _LCG_MASK
+        return (noise_state / 1073741824.0) - 1.0  # roughly [-1, 1]
+
+    for n in range(frames):
+        t = n / float(sample_rate)
+        # Measure info
+        measure_idx = int((t // measure_len))
+        t_in_measure = t - measure_idx * measure_len
+        # Which chord of the progression (4-chord loop)
+        chord_idx = measure_idx % 4
+        chord = BGM_CHORDS[chord_idx]
+        bass_freq = BGM_BASS[chord_idx]
+
+        # Step index and position within step
+        step_idx = int(t / step_len)
+        within_step = n - step_idx * step_samples
+        if step_idx >= steps:
+            step_idx = steps - 1
+            within_step = step_samples - 1
+
+        pat = BGM_ARP_PATTERNS[measure_idx % 2]
+        pat_note = pat[step_idx % len(pat)]
+        arp_freq = chord[pat_note]
+
+        # Mild LFO for arp level to add movement (0.08 Hz)
+        lfo = 0.5 + 0.5 * math.sin(two_pi * 0.08 * t)
+
+        # Arp voice (with per-step envelope)
+        env = env_linear(within_step, step_samples, a_samp, r_samp)
+        arp = BGM_ARP_LEVEL * lfo * math.sin(two_pi * arp_freq * t) * env
+
+        # Bass voice (odd harmonics for warmth)
+        bass = BGM_BASS_LEVEL * (math.sin(two_pi * bass_freq * t) + 0.33 * math.sin(3 * two_pi * bass_freq * t))
+
+        # Kick: on beats 1 and 3 (every measure), short decaying low thump
+        # Beats inside measure happen at multiples of beat_len
+        kick = 0.0
+        for beat in (0, 2):
+            rel = t_in_measure - beat * beat_len
+            if 0.0 <= rel < BGM_KICK_LEN:
+                k_env = 1.0 - (rel / BGM_KICK_LEN)
+                kick += BGM_KICK_LEVEL * math.sin(two_pi * 60.0 * t) * (k_env ** 2)
+
+        # Snare: on beats 2 and 4 (noise burst)
+        snare = 0.0
+        for beat in (1, 3):
+            rel = t_in_measure - beat * beat_len
+            if 0.0 <= rel < BGM_SNARE_LEN:
+                s_env = 1.0 - (rel / BGM_SNARE_LEN)
+                # White noise burst (slight band-pass by mixing with 200Hz sine)
+                noise = next_noise()
+                snare += BGM_SNARE_LEVEL * (0.6 * noise + 0.4 * math.sin(two_pi * 200.0 * t)) * (s_env ** 1.5)
+
+        # Hi-hat: on every 8th-note (grid), very short noise tick
+        hat = 0.0
+        grid_pos = t % step_len
+        if grid_pos < BGM_HAT_LEN:
+            h_env = 1.0 - (grid_pos / BGM_HAT_LEN)
+            noise = next_noise()
+            # Simple high-pass feel: subtract a tiny smoothed component
+            hat += BGM_HAT_LEVEL * (noise - 0.1 * math.sin(two_pi * 80.0 * t)) * (h_env ** 2)
+
+        s = arp + bass + kick + snare + hat
+        # Soft clip
+        if s > 1.0:
+            s = 1.0
+        elif s < -1.0:
+            s = -1.0
+        sample = int(s * 32767)
+        if channels == 2:
+            buf.append(sample)
+            buf.append(sample)
+        else:
+            buf.append(sample)
+
+    return buf.tobytes()
+
+def _render_bgm_wavetable(sample_rate, frames, channels=1):
+    """Render the BGM loop without numpy using wavetable oscillators.
+    Same arrangement and noise sequence as _render_bgm_scalar, but tonal voices are built a
+    whole 8th-note step at a time and drums only touch the samples inside their windows.
+    Differs from the scalar loop only by wavetable quantization (a few LSB).
+    """
+    duration = frames / float(sample_rate)
+    beat_len = 60.0 / BGM_BPM
+    step_len = beat_len / 2.0
+    steps = int(duration / step_len)
+    measure_len = beat_len * BGM_MEASURE_BEATS
+    step_samples = int(step_len * sample_rate)
+    a_samp = int(BGM_ATTACK_S * sample_rate)
+    r_samp = int(BGM_RELEASE_S * sample_rate)
+    dt = 1.0 / float(sample_rate)
+    sine = _wavetable('sine')
+    # Bass timbre (fundamental + 0.33 x 3rd harmonic) baked into its own table
+    bass_table = [sine[k] + 0.33 * sine[(3 * k) & _WT_MASK] for k in range(WAVETABLE_SIZE)]
+    lfo_table = [0.5 + 0.5 * s for s in sine]
+
+    def step_of(n):
+        return int((n / float(sample_rate)) / step_len)
+
+    # Per-step envelope depends only on the position inside the step (which drifts past
+    # step_samples on later steps, as in the scalar loop): tabulate it once, grow on demand
+    env_table = []
+    def env_slice(w0, length):
+        for w in range(len(env_table), w0 + length):
+            if w < a_samp:
+                env_table.append(w / float(max(1, a_samp)))
+            elif w >= step_samples - r_samp:
+                env_table.append((step_samples - w) / float(max(1, r_samp)))
             else:
-                print("[Audio] numpy path incomplete, falling back to pure-Python beeps")
-        except Exception as e:
-            print(f"[Audio] numpy sound path failed: {e}")
+                env_table.append(1.0)
+        return env_table[w0:w0 + length]
+
+    # Voices are mixed directly in int16 units
+    arp_level = BGM_ARP_LEVEL * 32767.0
+    bass_level = BGM_BASS_LEVEL * 32767.0
+    frac, mask = _WT_FRAC, _WT_MASK
+    mix = []
+    lfo_inc = _wt_increment(0.08, dt)
+    n = 0
+    while n < frames:
+        k = step_of(n)
+        # Step segment [n, end): same chord, arp note and envelope shape throughout
+        end = min(frames, int((k + 1) * step_len * sample_rate) + 2)
+        while end > n + 1 and step_of(end - 1) > k:
+            end -= 1
+        length = end - n
+        measure_idx = int((n / float(sample_rate)) // measure_len)
+        chord_idx = measure_idx % 4
+        pat = BGM_ARP_PATTERNS[measure_idx % 2]
+        if k >= steps:
+            k_pat, env_seg = steps - 1, env_slice(step_samples - 1, 1) * length
+        else:
+            k_pat, env_seg = k, env_slice(n - k * step_samples, length)
+        arp_freq = BGM_CHORDS[chord_idx][pat[k_pat % len(pat)]]
+        bass_freq = BGM_BASS[chord_idx]
+        t0 = n * dt
+        # One fused pass per step: three phase accumulators (arp, lfo, bass) + envelope
+        arp_inc = _wt_increment(arp_freq, dt)
+        bass_inc = _wt_increment(bass_freq, dt)
+        pa = _wt_phase(arp_freq * t0)
+        pl = _wt_phase(0.08 * t0)
+        pb = _wt_phase(bass_freq * t0)
+        mix.extend([arp_level * lfo_table[(l >> frac) & mask] * sine[(a >> frac) & mask] * e
+                    + bass_level * bass_table[(b >> frac) & mask]
+                    for a, l, b, e in zip(range(pa, pa + length * arp_inc, arp_inc),
+                                          range(pl, pl + length * lfo_inc, lfo_inc),
+                                          range(pb, pb + length * bass_inc, bass_inc),
+                                          env_seg)])
+        n = end
+
+    def window(start_s, length_s):
+        # Sample range covering [start_s, start_s + length_s) with one sample of slack each side
+        lo = max(0, int(start_s * sample_rate) - 1)
+        return range(lo, min(frames, int((start_s + length_s) * sample_rate) + 2))
+
+    def table_sin(freq, t):
+        return sine[_wt_phase(freq * t) >> _WT_FRAC]
+
+    measures = int(math.ceil(duration / measure_len)) + 1
+    noise_events = []
+    for m in range(measures):
+        m0 = m * measure_len
+        # Kick: on beats 1 and 3
+        for beat in (0, 2):
+            for i in window(m0 + beat * beat_len, BGM_KICK_LEN):
+                t = i / float(sample_rate)
+                rel = (t - int(t // measure_len) * measure_len) - beat * beat_len
+                if 0.0 <= rel < BGM_KICK_LEN:
+                    k_env = 1.0 - (rel / BGM_KICK_LEN)
+                    mix[i] += BGM_KICK_LEVEL * 32767.0 * table_sin(60.0, t) * (k_env ** 2)
+        # Snare: on beats 2 and 4 (consumes noise)
+        for beat in (1, 3):
+            for i in window(m0 + beat * beat_len, BGM_SNARE_LEN):
+                t = i / float(sample_rate)
+                rel = (t - int(t // measure_len) * measure_len) - beat * beat_len
+                if 0.0 <= rel < BGM_SNARE_LEN:
+                    noise_events.append((i, 0, rel))
+    # Hi-hat: every 8th-note (consumes noise)
+    for k in range(steps + 1):
+        for i in window(k * step_len, BGM_HAT_LEN):
+            grid_pos = (i / float(sample_rate)) % step_len
+            if grid_pos < BGM_HAT_LEN:
+                noise_events.append((i, 1, grid_pos))
+
+    # Draw noise in sample order (snare before hat within a sample), like the scalar loop
+    noise_state = BGM_NOISE_SEED
+    seen = set()
+    for (i, kind, rel) in sorted(noise_events):
+        if (i, kind) in seen:
+            continue
+        seen.add((i, kind))
+        noise_state = (_LCG_A * noise_state + _LCG_C) & _LCG_MASK
+        noise = (noise_state / 1073741824.0) - 1.0
+        t = i / float(sample_rate)
+        if kind == 0:
+            s_env = 1.0 - (rel / BGM_SNARE_LEN)
+            mix[i] += BGM_SNARE_LEVEL * 32767.0 * (0.6 * noise + 0.4 * table_sin(200.0, t)) * (s_env ** 1.5)
+        else:
+            h_env = 1.0 - (rel / BGM_HAT_LEN)
+            mix[i] += BGM_HAT_LEVEL * 32767.0 * (noise - 0.1 * table_sin(80.0, t)) * (h_env ** 2)
 
-    # Pure-Python fallback tones (square/sine)
-    success_sound = create_success_sound()
-    error_sound = create_simple_beep_sound(196, 0.25, 0.45)
-    miss_sound = create_miss_sound()
-    combo_sound = create_combo_sound()
+    return _pcm_from_floats(mix, channels, full_scale=32767.0).tobytes()
 
-    # Normalize volumes if sounds exist (apply per-sound targets)
-    try:
-        if success_sound is not None:
-            success_sound.set_volume(SFX_VOL_SUCCESS)
-        if error_sound is not None:
-            error_sound.set_volume(SFX_VOL_ERROR)
-        if miss_sound is not None:
-            miss_sound.set_volume(SFX_VOL_MISS)
-        if combo_sound is not None:
-            combo_sound.set_volume(SFX_VOL_COMBO)
-    except Exception:
-        pass
-    return success_sound, error_sound, miss_sound, combo_sound
+def _lcg_noise_block(seed, count):
+    """Return the next `count` LCG noise values after `seed` as a float array.
+    Matches next_noise() in the scalar renderer draw for draw; the sequence is built
+    by repeated doubling with the jump-ahead affine map, so it needs ~log2(count) numpy ops.
+    """
+    if count <= 0:
+        return np.zeros(0, dtype=np.float64)
+    states = np.array([(_LCG_A * seed + _LCG_C) & _LCG_MASK], dtype=np.uint64)
+    mul, add = _LCG_A, _LCG_C  # affine map that advances the state by len(states)
+    while states.size < count:
+        nxt = (states * np.uint64(mul) + np.uint64(add)) & np.uint64(_LCG_MASK)
+        states = np.concatenate((states, nxt))
+        mul, add = (mul * mul) & _LCG_MASK, (mul * add + add) & _LCG_MASK
+    return states[:count].astype(np.float64) / 1073741824.0 - 1.0
+
+def _lcg_jump(state, count):
+    """Advance an LCG state by `count` draws in O(log count) (affine map squaring)."""
+    mul, add = 1, 0
+    step_mul, step_add = _LCG_A, _LCG_C
+    while count > 0:
+        if count & 1:
+            mul, add = (step_mul * mul) & _LCG_MASK, (step_mul * add + step_add) & _LCG_MASK
+        step_mul, step_add = (step_mul * step_mul) & _LCG_MASK, (step_mul * step_add + step_add) & _LCG_MASK
+        count >>= 1
+    return (mul * state + add) & _LCG_MASK
+
+def _bgm_noise_gates(t, t_in_measure, step_len):
+    """Sample masks of the two noise voices: [(on, rel)] per snare beat, and (hat_on, grid_pos)."""
+    beat_len = 60.0 / BGM_BPM
+    snare_on = []
+    for beat in (1, 3):
+        rel = t_in_measure - beat * beat_len
+        snare_on.append(((rel >= 0.0) & (rel < BGM_SNARE_LEN), rel))
+    grid_pos = t % step_len
+    return snare_on, (grid_pos < BGM_HAT_LEN, grid_pos)
+
+def _bgm_timebase(sample_rate, lo, hi):
+    """Absolute sample indices, time and time-in-measure for samples [lo, hi) of the loop."""
+    measure_len = (60.0 / BGM_BPM) * BGM_MEASURE_BEATS
+    n = np.arange(lo, hi, dtype=np.int64)
+    t = n / float(sample_rate)
+    measure_idx = (t // measure_len).astype(np.int64)
+    return n, t, measure_idx, t - measure_idx * measure_len
+
+def _bgm_noise_draws(sample_rate, lo, hi):
+    """Number of LCG draws the noise voices make over samples [lo, hi)."""
+    _, t, _, t_in_measure = _bgm_timebase(sample_rate, lo, hi)
+    snare_on, (hat_on, _) = _bgm_noise_gates(t, t_in_measure, 30.0 / BGM_BPM)
+    return int(sum(int(on.sum()) for on, _ in snare_on) + hat_on.sum())
+
+def _render_bgm_numpy(sample_rate, frames, channels=1, section=None, voices=BGM_STEM_NAMES):
+    """Render the BGM loop with whole-array NumPy voices. Returns int16 PCM bytes.
+    Follows _render_bgm_scalar operation for operation (same evaluation order and noise
+    sequence), so the output matches the scalar loop to within 1 LSB.
+    `section` = (lo, hi, noise_state) renders only samples [lo, hi) of the `frames`-long loop,
+    with the noise generator in the state it has after all draws before `lo`; every value is
+    derived from the absolute sample index, so stitched sections equal the whole-loop render.
+    `voices` picks the stems to mix (subset of BGM_STEM_NAMES); all of them give the full loop.
+    """
+    lo, hi, noise_state = section if section is not None else (0, frames, BGM_NOISE_SEED)
+    duration = frames / float(sample_rate)
+    beat_len = 60.0 / BGM_BPM
+    step_len = beat_len / 2.0
+    steps = int(duration / step_len)
+    two_pi = 2.0 * math.pi
+    step_samples = int(step_len * sample_rate)
+    a_samp = int(BGM_ATTACK_S * sample_rate)
+    r_samp = int(BGM_RELEASE_S * sample_rate)
+
+    n, t, measure_idx, t_in_measure = _bgm_timebase(sample_rate, lo, hi)
+    count = hi - lo
+    chord_idx = measure_idx % 4
+
+    step_idx = (t / step_len).astype(np.int64)
+    within_step = n - step_idx * step_samples
+    tail = step_idx >= steps
+    step_idx[tail] = steps - 1
+    within_step[tail] = step_samples - 1
+
+    # Arp voice: per-sample frequency lookup from (chord, pattern note)
+    patterns = np.array(BGM_ARP_PATTERNS, dtype=np.int64)
+    pat_note = patterns[measure_idx % 2, step_idx % patterns.shape[1]]
+    arp_freq = np.array(BGM_CHORDS, dtype=np.float64)[chord_idx, pat_note]
+    lfo = 0.5 + 0.5 * np.sin(two_pi * 0.08 * t)
+    env = np.ones(count, dtype=np.float64)
+    attack = within_step < a_samp
+    release = (~attack) & (within_step >= step_samples - r_samp)
+    env[attack] = within_step[attack] / float(max(1, a_samp))
+    env[release] = (step_samples - within_step[release]) / float(max(1, r_samp))
+    arp = BGM_ARP_LEVEL * lfo * np.sin(two_pi * arp_freq * t) * env
+
+    # Bass voice (odd harmonics for warmth)
+    bass_freq = np.array(BGM_BASS, dtype=np.float64)[chord_idx]
+    bass = BGM_BASS_LEVEL * (np.sin(two_pi * bass_freq * t) + 0.33 * np.sin(3 * two_pi * bass_freq * t))
+
+    mix = [v for name, v in (('arp', arp), ('bass', bass)) if name in voices]
+    if 'drums' not in voices:
+        return _bgm_pcm(mix, count, channels)
+
+    # Kick on beats 1 and 3
+    kick = np.zeros(count, dtype=np.float64)
+    for beat in (0, 2):
+        rel = t_in_measure - beat * beat_len
+        on = (rel >= 0.0) & (rel < BGM_KICK_LEN)
+        k_env = 1.0 - (rel[on] / BGM_KICK_LEN)
+        kick[on] += BGM_KICK_LEVEL * np.sin(two_pi * 60.0 * t[on]) * (k_env ** 2)
+
+    # Noise draws happen in sample order, snare before hat within a sample
+    snare_on, (hat_on, grid_pos) = _bgm_noise_gates(t, t_in_measure, step_len)
+    snare_draws = np.zeros(count, dtype=np.int64)
+    for on, _ in snare_on:
+        snare_draws += on
+    draws = snare_draws + hat_on
+    first_draw = np.cumsum(draws) - draws
+    noise = _lcg_noise_block(noise_state, int(draws.sum()))
+
+    # Snare on beats 2 and 4 (noise burst)
+    snare = np.zeros(count, dtype=np.float64)
+    taken = np.zeros(count, dtype=np.int64)
+    for on, rel in snare_on:
+        s_env = 1.0 - (rel[on] / BGM_SNARE_LEN)
+        nz = noise[first_draw[on] + taken[on]]
+        snare[on] += BGM_SNARE_LEVEL * (0.6 * nz + 0.4 * np.sin(two_pi * 200.0 * t[on])) * (s_env ** 1.5)
+        taken += on
+
+    # Hi-hat on every 8th-note
+    hat = np.zeros(count, dtype=np.float64)
+    h_env = 1.0 - (grid_pos[hat_on] / BGM_HAT_LEN)
+    nz = noise[first_draw[hat_on] + taken[hat_on]]
+    hat[hat_on] += BGM_HAT_LEVEL * (nz - 0.1 * np.sin(two_pi * 80.0 * t[hat_on])) * (h_env ** 2)
+
+    return _bgm_pcm(mix + [kick, snare, hat], count, channels)
+
+def _bgm_pcm(voices, count, channels):
+    """Sum voice arrays left to right (the scalar loop's order), clip, and pack as int16 PCM bytes."""
+    s = np.zeros(count, dtype=np.float64)
+    for v in voices:
+        s = s + v
+    wave_i16 = (np.clip(s, -1.0, 1.0) * 32767).astype(np.int16)
+    if channels == 2:
+        wave_i16 = np.repeat(wave_i16[:, None], 2, axis=1).ravel()
+    return wave_i16.tobytes()
+
+# Sectioned BGM rendering (opt-in): the loop is cut at measure boundaries and the sections are
+# rendered in worker processes, then concatenated. RT_BGM_WORKERS=N sets the process count; the
+# default (1) renders in-process, which is as fast on most machines once pool start-up is paid.
+# Workers are started with 'forkserver' (or 'spawn'), never forked from the running game, whose
+# SDL audio/video threads make fork() unsafe; importing this module has no side effects, so a
+# fresh worker only loads the synthesis code. Needs numpy.
+BGM_RENDER_WORKERS = max(1, int(os.environ.get('RT_BGM_WORKERS', '1') or 1))
+# Run in each fresh worker before it unpickles a job, so jobs can refer to this module by the
+# name it was loaded under (tools load it from its path; it has no importable name).
+_BGM_WORKER_BOOT = (
+    "import importlib.util, os, sys\n"
+    "os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')\n"
+    "spec = importlib.util.spec_from_file_location(name, path)\n"
+    "module = importlib.util.module_from_spec(spec)\n"
+    "sys.modules[name] = module\n"
+    "spec.loader.exec_module(module)\n"
+)
+BGM_MIN_SECTION_MEASURES = 2  # don't bother with sections shorter than this
 
-def create_background_music():
+def _bgm_sections(sample_rate, frames, count):
+    """Split the loop into `count` measure-aligned sections: [(lo, hi, noise_state)].
+    Each section's noise state is the seed jumped ahead by the draws of all earlier sections.
+    """
+    measure_len = (60.0 / BGM_BPM) * BGM_MEASURE_BEATS
+    measures = int(math.ceil(frames / (measure_len * sample_rate)))
+    count = max(1, min(count, measures // BGM_MIN_SECTION_MEASURES))
+    bounds = [min(frames, int(round(measures * k // count * measure_len * sample_rate))) for k in range(count)]
+    bounds.append(frames)
+    sections = []
+    state = BGM_NOISE_SEED
+    for lo, hi in zip(bounds, bounds[1:]):
+        if hi <= lo:
+            continue
+        if sections:
+            prev_lo, prev_hi, _ = sections[-1]
+            state = _lcg_jump(state, _bgm_noise_draws(sample_rate, prev_lo, prev_hi))
+        sections.append((lo, hi, state))
+    return sections
+
+def _render_bgm_section(job):
+    """Process-pool entry point: job = (sample_rate, frames, channels, section, voices)."""
+    sample_rate, frames, channels, section, voices = job
+    _load_numpy()  # a fresh worker has only imported the module
+    return _render_bgm_numpy(sample_rate, frames, channels, section, voices)
+
+def _render_bgm_sectioned(sample_rate, frames, channels=1, workers=None, voices=BGM_STEM_NAMES):
+    """Render the BGM loop section by section across `workers` processes (int16 PCM bytes).
+    Byte-identical to _render_bgm_numpy(sample_rate, frames, channels, voices=voices).
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    workers = workers or BGM_RENDER_WORKERS
+    sections = _bgm_sections(sample_rate, frames, workers)
+    jobs = [(sample_rate, frames, channels, sec, voices) for sec in sections]
+    if len(jobs) < 2:
+        return b''.join(map(_render_bgm_section, jobs))
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    boot = {}
+    if __name__ != '__main__':  # multiprocessing itself re-imports the main script in workers
+        boot = {'initializer': exec,
+                'initargs': (_BGM_WORKER_BOOT, {'name': __name__, 'path': os.path.abspath(__file__)})}
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=ctx, **boot) as pool:
+        return b''.join(pool.map(_render_bgm_section, jobs))
+
+def _bgm_params(duration):
+    """Everything that shapes the rendered BGM, used as its PCM cache key."""
+    return {
+        'length': duration,
+        'bpm': BGM_BPM,
+        'measure_beats': BGM_MEASURE_BEATS,
+        'chords': BGM_CHORDS,
+        'bass': BGM_BASS,
+        'arp_patterns': BGM_ARP_PATTERNS,
+        'envelope': (BGM_ATTACK_S, BGM_RELEASE_S, BGM_KICK_LEN, BGM_SNARE_LEN, BGM_HAT_LEN),
+        'levels': (BGM_ARP_LEVEL, BGM_BASS_LEVEL, BGM_KICK_LEVEL, BGM_SNARE_LEVEL, BGM_HAT_LEVEL),
+        'noise_seed': BGM_NOISE_SEED,
+    }
+
+def create_background_music(voices=None):
     """Create a longer electronic-style looping BGM (bass + arp + drums) with variation.
     Loop length ~BGM_LENGTH seconds to reduce repetitiveness. No external files needed.
+    Uses the vectorized NumPy renderer when available, else the wavetable renderer.
+    `voices` (subset of BGM_STEM_NAMES) renders just those stems; that needs numpy.
     """
     if not SOUND_ENABLED or not BGM_ENABLED:
         return None
+    if voices is not None and not _load_numpy():
+        return None
     try:
         mi = pygame.mixer.get_init() or (22050, -16, 1)
         sample_rate, _, channels = mi
@@ -579,218 +2048,899 @@ def create_background_music():
         if frames <= 0:
             return None
 
-        import math
-        from array import array
-
-        # Musical grid and progression
-        bpm = 120.0            # tempo
-        beat_len = 60.0 / bpm  # seconds per quarter
-        step_len = beat_len / 2.0  # 8th notes grid
-        steps = int(duration / step_len)
-        measure_beats = 4
-        measure_len = beat_len * measure_beats  # length of a 4/4 measure
-
-        # Chord progression (A minor-ish): Am | F | C | G (loop)
-        # Arp notes per chord (triad, middle octave)
-        CHORDS = [
-            [440.00, 523.25, 659.25],  # Am: A4, C5, E5
-            [349.23, 440.00, 523.25],  # F:  F4, A4, C5
-            [261.63, 329.63, 392.00],  # C:  C4, E4, G4
-            [392.00, 493.88, 587.33],  # G:  G4, B4, D5
-        ]
-        # Bass roots (lower octave)
-        BASS = [110.00, 87.31, 65.41, 98.00]  # A2, F2, C2, G2
-
-        # Envelopes and voice levels
-        attack_s = 0.010
-        release_s = 0.060
-        kick_len = 0.11
-        snare_len = 0.045
-        hat_len = 0.020
-        arp_level = 0.13
-        bass_level = 0.10
-        kick_level = 0.20
-        snare_level = 0.16
-        hat_level = 0.08
-
-        def env_linear(i, total, a_samples, r_samples):
-            # 0..1 envelope with attack then release
-            if i < a_samples:
-                return i / float(max(1, a_samples))
-            if i >= total - r_samples:
-                return (total - i) / float(max(1, r_samples))
-            return 1.0
-
-        buf = array('h')
-        # Precompute constants
-        two_pi = 2.0 * math.pi
-        step_samples = int(step_len * sample_rate)
-        a_samp = int(attack_s * sample_rate)
-        r_samp = int(release_s * sample_rate)
-        kick_samples = int(kick_len * sample_rate)
-        snare_samples = int(snare_len * sample_rate)
-        hat_samples = int(hat_len * sample_rate)
-
-        # Simple PRNG for noise (hats/snare); LCG parameters
-        noise_state = 1234567
-        def next_noise():
-            nonlocal noise_state
-            noise_state = (1103515245 * noise_state + 12345) & 0x7fffffff
-            return (noise_state / 1073741824.0) - 1.0  # roughly [-1, 1]
-
-        for n in range(frames):
-            t = n / float(sample_rate)
-            # Measure info
-            measure_idx = int((t // measure_len))
-            t_in_measure = t - measure_idx * measure_len
-            # Which chord of the progression (4-chord loop)
-            chord_idx = measure_idx % 4
-            chord = CHORDS[chord_idx]
-            bass_freq = BASS[chord_idx]
-
-            # Step index and position within step
-            step_idx = int(t / step_len)
-            within_step = n - step_idx * step_samples
-            if step_idx >= steps:
-                step_idx = steps - 1
-                within_step = step_samples - 1
-
-            # Arpeggio pattern varies by measure parity
-            # Even measures: 0-1-2-1; odd measures: 0-2-1-2
-            pat_even = [0, 1, 2, 1]
-            pat_odd = [0, 2, 1, 2]
-            pat = pat_even if (measure_idx % 2 == 0) else pat_odd
-            pat_note = pat[step_idx % len(pat)]
-            arp_freq = chord[pat_note]
-
-            # Mild LFO for arp level to add movement (0.08 Hz)
-            lfo = 0.5 + 0.5 * math.sin(two_pi * 0.08 * t)
-
-            # Arp voice (with per-step envelope)
-            env = env_linear(within_step, step_samples, a_samp, r_samp)
-            arp = arp_level * lfo * math.sin(two_pi * arp_freq * t) * env
-
-            # Bass voice (odd harmonics for warmth)
-            bass = bass_level * (math.sin(two_pi * bass_freq * t) + 0.33 * math.sin(3 * two_pi * bass_freq * t))
-
-            # Kick: on beats 1 and 3 (every measure), short decaying low thump
-            # Beats inside measure happen at multiples of beat_len
-            kick = 0.0
-            for beat in (0, 2):
-                rel = t_in_measure - beat * beat_len
-                if 0.0 <= rel < kick_len:
-                    k_env = 1.0 - (rel / kick_len)
-                    kick += kick_level * math.sin(two_pi * 60.0 * t) * (k_env ** 2)
-
-            # Snare: on beats 2 and 4 (noise burst)
-            snare = 0.0
-            for beat in (1, 3):
-                rel = t_in_measure - beat * beat_len
-                if 0.0 <= rel < snare_len:
-                    s_env = 1.0 - (rel / snare_len)
-                    # White noise burst (slight band-pass by mixing with 200Hz sine)
-                    noise = next_noise()
-                    snare += snare_level * (0.6 * noise + 0.4 * math.sin(two_pi * 200.0 * t)) * (s_env ** 1.5)
-
-            # Hi-hat: on every 8th-note (grid), very short noise tick
-            hat = 0.0
-            grid_pos = t % step_len
-            if grid_pos < hat_len:
-                h_env = 1.0 - (grid_pos / hat_len)
-                noise = next_noise()
-                # Simple high-pass feel: subtract a tiny smoothed component
-                hat += hat_level * (noise - 0.1 * math.sin(two_pi * 80.0 * t)) * (h_env ** 2)
-
-            s = arp + bass + kick + snare + hat
-            # Soft clip
-            if s > 1.0:
-                s = 1.0
-            elif s < -1.0:
-                s = -1.0
-            sample = int(s * 32767)
-            if channels == 2:
-                buf.append(sample)
-                buf.append(sample)
-            else:
-                buf.append(sample)
-
-        pcm = buf.tobytes()
-        snd = pygame.mixer.Sound(buffer=pcm)
+        def render_numpy(stems):
+            if BGM_RENDER_WORKERS > 1:
+                try:
+                    return _render_bgm_sectioned(sample_rate, frames, channels, voices=stems)
+                except Exception as e:
+                    print(f"[Audio] sectioned BGM render failed, rendering in-process: {e}")
+            return _render_bgm_numpy(sample_rate, frames, channels, voices=stems)
+
+        def render():
+            if voices is not None:
+                return render_numpy(voices)
+            if NUMPY_AVAILABLE:
+                try:
+                    return render_numpy(BGM_STEM_NAMES)
+                except Exception as e:
+                    print(f"[Audio] numpy BGM path failed, using wavetable renderer: {e}")
+            return _render_bgm_wavetable(sample_rate, frames, channels)
+        if voices is None:
+            snd = _cached_sound('bgm', _bgm_params(duration), render)
+        else:
+            params = dict(_bgm_params(duration), voices=tuple(voices))
+            snd = _cached_sound('bgm_' + '_'.join(voices), params, render)
         # We'll control bgm loudness via channel volume, not baked-in
         return snd
     except Exception as e:
         print(f"[Audio] background music generation failed: {e}")
         return None
 
-# Initialize sound effects
-try:
-    sounds = create_game_sounds()
-    if sounds and any(s is not None for s in sounds):
-        SUCCESS_SOUND, ERROR_SOUND, MISS_SOUND, COMBO_SOUND = sounds
-        print("✅ Sound effects ready:", {
-            'success': SUCCESS_SOUND is not None,
-            'error': ERROR_SOUND is not None,
-            'miss': MISS_SOUND is not None,
-            'combo': COMBO_SOUND is not None,
-        })
-    else:
-        SUCCESS_SOUND, ERROR_SOUND, MISS_SOUND, COMBO_SOUND = None, None, None, None
-        print("⚠️ Playing without audio effects")
-except Exception as e:
-    SUCCESS_SOUND, ERROR_SOUND, MISS_SOUND, COMBO_SOUND = None, None, None, None
-    print(f"⚠️ Sound initialization failed: {e}")
-
-# Initialize UI sounds (navigation and typing)
-try:
-    UI_NAV_SOUND, UI_KEY_TAP_SOUND, UI_KEY_ENTER_SOUND, UI_KEY_BACKSPACE_SOUND = create_ui_sounds()
-    print("✅ UI sounds ready:", {
-        'nav': UI_NAV_SOUND is not None,
-        'tap': UI_KEY_TAP_SOUND is not None,
-        'enter': UI_KEY_ENTER_SOUND is not None,
-        'backspace': UI_KEY_BACKSPACE_SOUND is not None,
-    })
-except Exception as e:
-    UI_NAV_SOUND, UI_KEY_TAP_SOUND, UI_KEY_ENTER_SOUND, UI_KEY_BACKSPACE_SOUND = None, None, None, None
-    print(f"⚠️ UI sound initialization failed: {e}")
-
-# Initialize event sounds (start and game over)
-try:
-    START_SOUND, GAMEOVER_SOUND = create_event_sounds()
-    print("✅ Event sounds ready:", {
-        'start': START_SOUND is not None,
-        'gameover': GAMEOVER_SOUND is not None,
-    })
-except Exception as e:
-    START_SOUND, GAMEOVER_SOUND = None, None
-    print(f"⚠️ Event sound initialization failed: {e}")
-
-# Initialize countdown beep sound
-try:
-    COUNTDOWN_BEEP_SOUND = create_countdown_beep()
-    print("✅ Countdown beep ready:", COUNTDOWN_BEEP_SOUND is not None)
-except Exception as e:
-    COUNTDOWN_BEEP_SOUND = None
-    print(f"⚠️ Countdown beep initialization failed: {e}")
-
-# Start background music (looping)
-if SOUND_ENABLED and BGM_ENABLED:
+def create_bgm_stems():
+    """Render the BGM loop as one Sound per BGM_STEM_NAMES voice: {name: Sound}, or None.
+    All stems share the loop's length and time base, so started together they stay phase-locked.
+    """
+    stems = {}
+    for name in BGM_STEM_NAMES:
+        snd = create_background_music(voices=(name,))
+        if snd is None:
+            return None
+        stems[name] = snd
+    return stems
+
+# Streaming BGM: measures are generated on the fly with arp/drum variations and fed to the
+# BGM channel through Channel.queue(), so there is no upfront synthesis and the music never loops.
+# Needs numpy (one measure must render well inside its own playback time); otherwise the
+# pre-rendered loop is used. Set RT_BGM_STREAM=1 to enable.
+BGM_STREAM = os.environ.get('RT_BGM_STREAM', '') == '1'
+BGM_STREAM_POLL = 0.05  # seconds between feeder checks of the channel queue
+# Arp patterns to pick from per measure (indices into the chord triad; 3 = root one octave up)
+BGM_STREAM_ARP_PATTERNS = [
+    [0, 1, 2, 1], [0, 2, 1, 2], [0, 1, 2, 3], [2, 1, 0, 1],
+    [0, 2, 3, 2], [3, 2, 1, 0], [0, 0, 2, 1], [1, 2, 3, 2],
+]
+# Drum variations as beat positions inside the 4/4 measure (0.5 = the "and" after a beat)
+BGM_STREAM_KICKS = [(0, 2), (0, 2), (0, 2, 2.5), (0, 1.5, 2), (0, 2, 3.5)]
+BGM_STREAM_SNARES = [(1, 3), (1, 3), (1, 3, 3.75), (1, 3, 3.5)]
+BGM_STREAM_FILL = (1, 2.5, 3, 3.25, 3.5, 3.75)  # snare fill on the last measure of each 8
+
+def _bgm_measure_spec(rng, measure_idx):
+    """Pick the chord, arp pattern and drum hits for one streamed measure."""
+    fill = measure_idx % 8 == 7
+    return {
+        'measure': measure_idx,
+        'chord': measure_idx % 4,
+        'arp': rng.choice(BGM_STREAM_ARP_PATTERNS),
+        'kicks': rng.choice(BGM_STREAM_KICKS),
+        'snares': BGM_STREAM_FILL if fill else rng.choice(BGM_STREAM_SNARES),
+        # Occasionally drop the hats on the last two 8ths for some breathing room
+        'hat_steps': 6 if (not fill and rng.random() < 0.2) else 8,
+        'noise_seed': rng.randrange(1, _LCG_MASK),
+    }
+
+def _render_bgm_measure(sample_rate, spec, channels=1):
+    """Render one streamed 4/4 measure (NumPy) to int16 PCM bytes.
+    Oscillators run on absolute time so phases stay continuous across measures.
+    """
+    beat_len = 60.0 / BGM_BPM
+    step_len = beat_len / 2.0
+    measure_len = beat_len * BGM_MEASURE_BEATS
+    two_pi = 2.0 * math.pi
+    idx = spec['measure']
+    # Measure boundaries from absolute time so fractional samples never accumulate drift
+    first = int(round(idx * measure_len * sample_rate))
+    frames = int(round((idx + 1) * measure_len * sample_rate)) - first
+    step_samples = int(step_len * sample_rate)
+    a_samp = int(BGM_ATTACK_S * sample_rate)
+    r_samp = int(BGM_RELEASE_S * sample_rate)
+
+    t = (first + np.arange(frames, dtype=np.float64)) / float(sample_rate)
+    t_in_measure = t - idx * measure_len
+    step = np.minimum((t_in_measure / step_len).astype(np.int64), 2 * BGM_MEASURE_BEATS - 1)
+    within_step = ((t_in_measure - step * step_len) * sample_rate).astype(np.int64)
+
+    # Arp voice with per-step envelope; index 3 is the chord root an octave up
+    triad = BGM_CHORDS[spec['chord']]
+    notes = np.array(triad + [triad[0] * 2.0], dtype=np.float64)
+    pat = np.array(spec['arp'], dtype=np.int64)
+    arp_freq = notes[pat[step % len(pat)]]
+    env = np.ones(frames, dtype=np.float64)
+    attack = within_step < a_samp
+    release = (~attack) & (within_step >= step_samples - r_samp)
+    env[attack] = within_step[attack] / float(max(1, a_samp))
+    env[release] = np.maximum(0, step_samples - within_step[release]) / float(max(1, r_samp))
+    lfo = 0.5 + 0.5 * np.sin(two_pi * 0.08 * t)
+    s = BGM_ARP_LEVEL * lfo * np.sin(two_pi * arp_freq * t) * env
+
+    # Bass voice (odd harmonics for warmth)
+    bass_freq = BGM_BASS[spec['chord']]
+    s += BGM_BASS_LEVEL * (np.sin(two_pi * bass_freq * t) + 0.33 * np.sin(3 * two_pi * bass_freq * t))
+
+    # Kicks
+    for beat in spec['kicks']:
+        rel = t_in_measure - beat * beat_len
+        on = (rel >= 0.0) & (rel < BGM_KICK_LEN)
+        k_env = 1.0 - rel[on] / BGM_KICK_LEN
+        s[on] += BGM_KICK_LEVEL * np.sin(two_pi * 60.0 * t[on]) * (k_env ** 2)
+
+    # Snares and hats draw from one per-measure noise stream
+    noise = _lcg_noise_block(spec['noise_seed'], frames * 2)
+    for beat in spec['snares']:
+        rel = t_in_measure - beat * beat_len
+        on = (rel >= 0.0) & (rel < BGM_SNARE_LEN)
+        s_env = 1.0 - rel[on] / BGM_SNARE_LEN
+        s[on] += BGM_SNARE_LEVEL * (0.6 * noise[:frames][on] + 0.4 * np.sin(two_pi * 200.0 * t[on])) * (s_env ** 1.5)
+    grid_pos = t_in_measure % step_len
+    hat_on = (grid_pos < BGM_HAT_LEN) & (step < spec['hat_steps'])
+    h_env = 1.0 - grid_pos[hat_on] / BGM_HAT_LEN
+    s[hat_on] += BGM_HAT_LEVEL * (noise[frames:][hat_on] - 0.1 * np.sin(two_pi * 80.0 * t[hat_on])) * (h_env ** 2)
+
+    wave_i16 = (np.clip(s, -1.0, 1.0) * 32767).astype(np.int16)
+    if channels == 2:
+        wave_i16 = np.repeat(wave_i16[:, None], 2, axis=1).ravel()
+    return wave_i16.tobytes()
+
+class BgmStream:
+    """Endless, non-repeating BGM: renders one measure at a time and keeps exactly one
+    measure queued behind the one playing (Channel.queue), from a daemon feeder thread.
+    """
+    def __init__(self, sample_rate, channels, seed=None):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.rng = random.Random(seed)
+        self.measure_idx = 0
+        self.channel = None
+        self._stop = threading.Event()
+        self._thread = None
+        # stats
+        self.measures_rendered = 0
+        self.render_time = 0.0
+        self.underruns = 0
+        self.chunk_bytes = 0
+
+    def next_chunk(self):
+        """Render the next measure into a Sound."""
+        t0 = time.perf_counter()
+        spec = _bgm_measure_spec(self.rng, self.measure_idx)
+        pcm = _render_bgm_measure(self.sample_rate, spec, self.channels)
+        self.measure_idx += 1
+        self.measures_rendered += 1
+        self.render_time += time.perf_counter() - t0
+        self.chunk_bytes = len(pcm)
+        return pygame.mixer.Sound(buffer=pcm)
+
+    def start(self, channel):
+        """Start playback on `channel` and spawn the feeder thread."""
+        self.channel = channel
+        channel.play(self.next_chunk())
+        channel.queue(self.next_chunk())
+        self._thread = threading.Thread(target=self._feed, name="bgm-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self.channel is not None:
+            self.channel.stop()
+
+    def _feed(self):
+        while not self._stop.wait(BGM_STREAM_POLL):
+            try:
+                ch = self.channel
+                if not ch.get_busy():
+                    # Queue ran dry (should not happen): restart from a fresh measure
+                    self.underruns += 1
+                    ch.play(self.next_chunk())
+                if ch.get_queue() is None:
+                    ch.queue(self.next_chunk())
+            except Exception as e:
+                print(f"[Audio] BGM stream feeder stopped: {e}")
+                return
+
+    def stats(self):
+        """Playback/render counters for diagnostics."""
+        n = max(1, self.measures_rendered)
+        return {
+            'measures': self.measures_rendered,
+            'avg_render_ms': 1000.0 * self.render_time / n,
+            'underruns': self.underruns,
+            'buffered_bytes': 2 * self.chunk_bytes,  # playing + queued measure
+        }
+
+# Adaptive BGM: the loop's arp/bass/drum voices are rendered as separate stems that loop together
+# on the reserved 'stems' channels, and each stem's channel volume follows the game state: a sparse
+# bass-led layer on the menus, drums and arp coming in while playing and rising with the streak.
+# Cost is fixed (three looping channels, volume changes only). Needs numpy; RT_BGM_ADAPTIVE=0
+# restores the single looping mix. Streaming mode (RT_BGM_STREAM=1) takes precedence.
+BGM_ADAPTIVE = os.environ.get('RT_BGM_ADAPTIVE', '') != '0'
+# game_state -> stem levels (0..1, scaled by the bgm bus volume); states not listed use 'input_name'
+BGM_STEM_MIX = {
+    'input_name':   {'bass': 1.0, 'arp': 0.35, 'drums': 0.0},
+    'instructions': {'bass': 1.0, 'arp': 0.6, 'drums': 0.3},
+    'playing':      {'bass': 1.0, 'arp': 0.7, 'drums': 0.6},
+    'results':      {'bass': 1.0, 'arp': 0.5, 'drums': 0.0},
+    'rankings':     {'bass': 1.0, 'arp': 0.35, 'drums': 0.0},
+    'settings':     {'bass': 1.0, 'arp': 0.35, 'drums': 0.0},
+}
+BGM_STEM_STREAK_BOOST = {'arp': 0.3, 'drums': 0.4}  # added while playing, in full at BGM_STEM_STREAK_FULL
+BGM_STEM_STREAK_FULL = 6
+BGM_STEM_RAMP = 1.5   # level change per second (a full 0 -> 1 swell takes ~0.7 s)
+BGM_STEM_MAX_DT = 0.1  # longest frame time one ramp step honours, so a stalled frame can't jump the mix
+
+class BgmStems:
+    """Plays the BGM stems phase-locked on the 'stems' channel group and ramps their volumes
+    toward the mix for the current game state (set_mix). The screen loops call advance(dt)
+    once per frame; nothing runs between frames once the levels have settled.
+    """
+    def __init__(self, stems):
+        self.stems = stems
+        self.channels = {}
+        self.levels = {name: 0.0 for name in stems}
+        self.targets = dict(BGM_STEM_MIX['input_name'])
+        self.mix_key = None
+        self.ramping = False  # levels moving toward the targets, or volumes to re-apply
+
+    def start(self):
+        """Start every stem looping at volume 0 (back to back, so they share the loop phase)."""
+        group = CHANNELS.stems
+        if len(group.channels) < len(self.stems):
+            return False
+        for ch, name in zip(group.channels, self.stems):
+            ch.set_volume(0.0)
+            self.channels[name] = ch
+        for name, ch in self.channels.items():
+            ch.play(self.stems[name], loops=-1)
+        group.plays += len(self.channels)
+        self.ramping = True  # fade in to the first mix
+        return True
+
+    def stop(self):
+        self.ramping = False
+        for ch in self.channels.values():
+            ch.stop()
+
+    def set_mix(self, game_state, streak=0):
+        """Retarget the stem levels for `game_state` (and the streak while playing)."""
+        boost = min(streak, BGM_STEM_STREAK_FULL) / float(BGM_STEM_STREAK_FULL) if game_state == 'playing' else 0.0
+        key = (game_state, boost)
+        if key == self.mix_key:
+            return
+        self.mix_key = key
+        mix = BGM_STEM_MIX.get(game_state, BGM_STEM_MIX['input_name'])
+        self.targets = {name: min(1.0, mix.get(name, 0.0) + boost * BGM_STEM_STREAK_BOOST.get(name, 0.0))
+                        for name in self.stems}
+        self.ramping = True
+
+    def refresh(self):
+        """Re-apply the channel volumes on the next frame (after the bgm bus volume changed)."""
+        self.ramping = True
+
+    def advance(self, dt):
+        """Step each stem level toward its target by dt seconds of ramp and apply the channel
+        volumes. Returns True while the levels are still moving."""
+        if not self.ramping or dt <= 0:
+            return self.ramping
+        step = BGM_STEM_RAMP * min(dt, BGM_STEM_MAX_DT)
+        settled = True
+        try:
+            for name, ch in self.channels.items():
+                level, target = self.levels[name], self.targets[name]
+                if level < target:
+                    level = min(target, level + step)
+                elif level > target:
+                    level = max(target, level - step)
+                settled = settled and level == target
+                self.levels[name] = level
+                ch.set_volume(level * BGM_TARGET_VOLUME)
+        except Exception as e:
+            print(f"[Audio] BGM stem ramp stopped: {e}")
+            settled = True
+        self.ramping = not settled
+        return self.ramping
+
+    def stats(self):
+        return {'stems': len(self.channels), 'levels': dict(self.levels), 'targets': dict(self.targets)}
+
+
+# Mixer channel layout: channels reserved per group, and what to do when all of them are busy.
+# 'steal' restarts the group's longest-playing voice with the new sound; 'drop' skips the new one.
+# Reserved channels are never handed out by Sound.play()/find_channel(), so groups can't starve each other.
+CHANNEL_GROUPS = (
+    ('bgm', 1, 'drop'),
+    ('stems', len(BGM_STEM_NAMES), 'drop'),  # adaptive BGM layers, one per stem
+    ('feedback', 4, 'steal'),  # gameplay hits/misses and start/game-over stingers
+    ('countdown', 1, 'steal'),
+    ('ui', 3, 'steal'),        # navigation and typing clicks
+)
+
+class ChannelGroup:
+    """Reserved mixer channels for one group of sounds, with play/drop/steal counters."""
+    def __init__(self, name, channels, policy='steal'):
+        self.name = name
+        self.channels = channels
+        self.policy = policy
+        self.started = [0.0] * len(channels)
+        self.plays = 0
+        self.drops = 0
+        self.steals = 0
+
+    def acquire(self):
+        """Return an idle channel, else apply the group's policy (steal the oldest voice or drop)."""
+        channels = self.channels
+        for i, ch in enumerate(channels):
+            if not ch.get_busy():
+                self.started[i] = time.perf_counter()
+                return ch
+        if self.policy != 'steal' or not channels:
+            self.drops += 1
+            return None
+        i = self.started.index(min(self.started))
+        self.steals += 1
+        self.started[i] = time.perf_counter()
+        return channels[i]
+
+    def play(self, sound):
+        ch = self.acquire()
+        if ch is None:
+            return None
+        try:
+            ch.play(sound)
+        except Exception:
+            self.drops += 1
+            return None
+        self.plays += 1
+        return ch
+
+    def stats(self):
+        return {'channels': len(self.channels), 'plays': self.plays, 'drops': self.drops, 'steals': self.steals}
+
+class ChannelManager:
+    """Splits the first mixer channels into the CHANNEL_GROUPS; groups are attributes (CHANNELS.ui)."""
+    def __init__(self, layout=CHANNEL_GROUPS):
+        self.layout = layout
+        self.groups = []
+        for name, count, policy in layout:
+            group = ChannelGroup(name, [], policy)
+            self.groups.append(group)
+            setattr(self, name, group)
+
+    def open(self):
+        """Reserve the groups' channels on the open mixer (groups stay empty without one)."""
+        total = sum(count for _, count, _ in self.layout)
+        if not SOUND_ENABLED or pygame.mixer.get_init() is None:
+            return
+        try:
+            if pygame.mixer.get_num_channels() < total + 4:
+                pygame.mixer.set_num_channels(total + 4)  # keep a few unreserved channels
+            pygame.mixer.set_reserved(total)
+        except Exception as e:
+            print(f"[Audio] channel reservation failed: {e}")
+            return
+        index = 0
+        for group, (_, count, _) in zip(self.groups, self.layout):
+            group.channels[:] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            group.started = [0.0] * count
+            index += count
+
+    def stats(self):
+        return {g.name: g.stats() for g in self.groups}
+
+CHANNELS = ChannelManager()
+
+class _SilentSound:
+    """Stand-in for a sound that could not be generated: falsy, and play() does nothing."""
+    def __bool__(self):
+        return False
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def set_volume(self, volume):
+        pass
+
+    def get_volume(self):
+        return 0.0
+
+_SILENT_SOUND = _SilentSound()
+
+class _Voice:
+    """A registered Sound bound to its channel group: play() goes through the group's allocator."""
+    __slots__ = ('sound', 'group')
+
+    def __init__(self, sound, group):
+        self.sound = sound
+        self.group = group
+
+    def play(self):
+        return self.group.play(self.sound)
+
+class SoundBank:
+    """Owns every generated Sound, grouped into mixing buses under a master volume.
+    A Sound plays at base gain x bus volume x master volume; a bus change touches only the
+    sounds on that bus. Sounds are attributes (SOUNDS.success) holding a _Voice bound to the
+    sound's channel group, so play sites need no lookups or None checks: a sound that failed
+    to generate is a silent, falsy placeholder.
+    The 'bgm' bus has no Sounds of its own; it drives the BGM channel volume.
+    """
+    BUSES = ('sfx', 'ui', 'bgm')
+
+    def __init__(self, names=(), channels=None):
+        self.channels = channels or CHANNELS
+        self.master = 1.0
+        self.bus_volume = {'sfx': 1.0, 'ui': 1.0, 'bgm': BGM_VOLUME}
+        self._members = {bus: [] for bus in self.BUSES}
+        for name in names:
+            setattr(self, name, _SILENT_SOUND)
+
+    def add(self, name, sound, bus='sfx', gain=1.0, group='feedback'):
+        """Register `sound` as `name` on `bus` with base gain `gain`, playing on channel `group`.
+        Returns the bound voice. With name None the voice is tracked but not bound (see discard)."""
+        if sound is None:
+            if name:
+                setattr(self, name, _SILENT_SOUND)
+            return _SILENT_SOUND
+        self._members[bus].append((sound, gain))
+        voice = _Voice(sound, getattr(self.channels, group))
+        if name:
+            setattr(self, name, voice)
+        sound.set_volume(min(1.0, gain * self.master * self.bus_volume[bus]))
+        return voice
+
+    def discard(self, voice):
+        """Stop tracking an unbound voice's Sound (it no longer follows bus changes)."""
+        for members in self._members.values():
+            members[:] = [m for m in members if m[0] is not voice.sound]
+
+    @staticmethod
+    def _patch_group(patch):
+        bus = patch.get('bus', 'sfx')
+        return patch.get('group', 'ui' if bus == 'ui' else 'feedback')
+
+    def add_patch(self, name, sound, patch=None):
+        """Register a patch Sound with the bus, base gain and channel group from SOUND_PATCHES
+        (or from `patch`, for variants of a patch)."""
+        patch = SOUND_PATCHES[name] if patch is None else patch
+        return self.add(name, sound, patch.get('bus', 'sfx'), patch.get('volume', SFX_TARGET_VOLUME),
+                        self._patch_group(patch))
+
+    def add_composite(self, name, layers, sounds=None):
+        """Pre-mix patch layers [(patch name, level)] into one Sound, so they take one channel.
+        Levels are relative to each layer's own base gain; the composite uses the first layer's
+        bus and channel group. `sounds` replaces the bank's Sound for some layers (variants).
+        Missing layers leave a silent placeholder.
+        """
+        sources = []
+        for layer, level in layers:
+            snd = sounds[layer] if sounds and layer in sounds else getattr(getattr(self, layer), 'sound', None)
+            if snd is None:
+                return self.add(name, None)
+            sources.append((snd, SOUND_PATCHES[layer], level))
+        first = sources[0][1]
+        gain = first.get('volume', SFX_TARGET_VOLUME) * sources[0][2]
+        pcm = _mix_pcm([(snd.get_raw(), p.get('volume', SFX_TARGET_VOLUME) * level / gain)
+                        for snd, p, level in sources])
+        return self.add(name, pygame.mixer.Sound(buffer=pcm), first.get('bus', 'sfx'), gain,
+                        self._patch_group(first))
+
+    def set_bus_volume(self, bus, volume):
+        volume = max(0.0, min(1.0, float(volume)))
+        if volume != self.bus_volume[bus]:
+            self.bus_volume[bus] = volume
+            self._apply(bus)
+
+    def set_master_volume(self, volume):
+        volume = max(0.0, min(1.0, float(volume)))
+        if volume != self.master:
+            self.master = volume
+            for bus in self.BUSES:
+                self._apply(bus)
+
+    def _apply(self, bus):
+        level = self.master * self.bus_volume[bus]
+        if bus == 'bgm':
+            set_bgm_volume(level)
+            return
+        for sound, gain in self._members[bus]:
+            sound.set_volume(min(1.0, gain * level))
+
+SOUNDS = SoundBank(list(SOUND_PATCHES) + list(SOUND_COMPOSITES))
+
+def _init_sounds():
+    """Render the patch bank and register every sound (and composite) with SOUNDS."""
+    # Initialize sound effects
     try:
-        BGM_SOUND = create_background_music()
-        if BGM_SOUND is not None:
-            BGM_CHANNEL = BGM_SOUND.play(loops=-1)
-            if BGM_CHANNEL is not None:
-                BGM_CHANNEL.set_volume(BGM_VOLUME)
-            print("🎵 BGM started")
+        sounds = create_game_sounds()
+        if sounds and any(s is not None for s in sounds):
+            for name, snd in zip(('success', 'error', 'miss', 'combo'), sounds):
+                SOUNDS.add_patch(name, snd)
+            print("✅ Sound effects ready:", {
+                'success': bool(SOUNDS.success),
+                'error': bool(SOUNDS.error),
+                'miss': bool(SOUNDS.miss),
+                'combo': bool(SOUNDS.combo),
+            })
         else:
+            print("⚠️ Playing without audio effects")
+    except Exception as e:
+        print(f"⚠️ Sound initialization failed: {e}")
+    _startup_mark("sounds: success, error, miss, combo (renders the patch bank)")
+
+    # Initialize UI sounds (navigation and typing)
+    try:
+        for name, snd in zip(('ui_nav', 'ui_key_tap', 'ui_key_enter', 'ui_key_backspace'), create_ui_sounds()):
+            SOUNDS.add_patch(name, snd)
+        print("✅ UI sounds ready:", {
+            'nav': bool(SOUNDS.ui_nav),
+            'tap': bool(SOUNDS.ui_key_tap),
+            'enter': bool(SOUNDS.ui_key_enter),
+            'backspace': bool(SOUNDS.ui_key_backspace),
+        })
+    except Exception as e:
+        print(f"⚠️ UI sound initialization failed: {e}")
+    _startup_mark("sounds: ui_nav, ui_key_tap, ui_key_enter, ui_key_backspace")
+
+    # Initialize event sounds (start and game over)
+    try:
+        for name, snd in zip(('start', 'gameover'), create_event_sounds()):
+            SOUNDS.add_patch(name, snd)
+        print("✅ Event sounds ready:", {
+            'start': bool(SOUNDS.start),
+            'gameover': bool(SOUNDS.gameover),
+        })
+    except Exception as e:
+        print(f"⚠️ Event sound initialization failed: {e}")
+    _startup_mark("sounds: start, gameover")
+
+    # Initialize countdown beep sound
+    try:
+        SOUNDS.add_patch('countdown', create_countdown_beep())
+        print("✅ Countdown beep ready:", bool(SOUNDS.countdown))
+    except Exception as e:
+        print(f"⚠️ Countdown beep initialization failed: {e}")
+    _startup_mark("sounds: countdown")
+
+    # Pre-mix composites (e.g. Perfect = success + combo) from the registered patches
+    try:
+        for name, layers in SOUND_COMPOSITES.items():
+            SOUNDS.add_composite(name, layers)
+    except Exception as e:
+        print(f"⚠️ Composite sound mixing failed: {e}")
+    _startup_mark("sounds: " + ", ".join(SOUND_COMPOSITES) + " (pre-mixed)")
+
+# Audio/visual sync: a sound reaches the speaker roughly AV_LATENCY_BUFFERS mixer buffers after
+# play() (the buffer being played plus the one being mixed), plus AV_EXTRA_LATENCY for the OS/device.
+# Time-driven sounds (countdown, block expiry, game over) are fired that much early so they land
+# on the frame that shows their visual. RT_AV_LOG=1 prints the achieved offset per event.
+AV_LATENCY_BUFFERS = 2.0
+AV_EXTRA_LATENCY = float(os.environ.get('RT_AV_EXTRA_MS', '0') or 0) / 1000.0
+AV_LOG = os.environ.get('RT_AV_LOG', '') == '1'
+
+class AudioEvent:
+    """One sound tied to a visual change at perf_counter time `at`."""
+    __slots__ = ('label', 'voice', 'at', 'fire_at', 'fired_at', 'channel', 'cancelled')
+
+    def __init__(self, label, voice, at, fire_at):
+        self.label = label
+        self.voice = voice
+        self.at = at
+        self.fire_at = fire_at
+        self.fired_at = None
+        self.channel = None
+        self.cancelled = False
+
+class AudioScheduler:
+    """Fires sounds ahead of their visuals by the estimated output latency and measures the
+    resulting audio/visual offset. Frame loops call pump() before drawing and presented()
+    right after pygame.display.update().
+    """
+    def __init__(self, buffer_frames=MIXER_BUFFER):
+        self.calibrate(buffer_frames)
+        self.frame_dt = 1.0 / 60.0  # smoothed interval between presented frames
+        self._last_present = None
+        self._pending = []     # scheduled, not fired yet
+        self._unmatched = []   # fired, waiting for the frame that shows them
+        self._tags = {}        # tag -> events scheduled since the last claim()/cancel()
+        self.offsets = {}      # label -> [offset seconds, ...]
+
+    def calibrate(self, buffer_frames=MIXER_BUFFER):
+        """Estimate the output latency from the mixer's sample rate (22050 Hz if it is not open)."""
+        mi = pygame.mixer.get_init() if SOUND_ENABLED else None
+        sample_rate = mi[0] if mi else 22050
+        self.latency = AV_LATENCY_BUFFERS * buffer_frames / float(sample_rate) + AV_EXTRA_LATENCY
+
+    def schedule(self, label, voice, delay, tag=None):
+        """Play `voice` so it is heard when the visual due `delay` seconds from now is shown."""
+        at = time.perf_counter() + delay
+        ev = AudioEvent(label, voice, at, at - self.latency)
+        self._pending.append(ev)
+        self._tags.setdefault(tag or label, []).append(ev)
+        return ev
+
+    def play(self, label, voice):
+        """Play `voice` now for a visual that appears on the next presented frame (input-driven)."""
+        now = time.perf_counter()
+        ev = AudioEvent(label, voice, now, now)
+        self._fire(ev, now)
+        return ev
+
+    def _fire(self, ev, now):
+        ev.fired_at = now
+        ev.channel = ev.voice.play()
+        if ev.channel is not None:
+            self._unmatched.append(ev)
+
+    def pump(self):
+        """Fire every scheduled sound that is due before the next frame is presented."""
+        if not self._pending:
+            return
+        now = time.perf_counter()
+        horizon = now + 0.5 * self.frame_dt
+        due = [ev for ev in self._pending if ev.fire_at <= horizon]
+        if due:
+            self._pending = [ev for ev in self._pending if ev.fire_at > horizon]
+            for ev in due:
+                self._fire(ev, now)
+
+    def claim(self, tag):
+        """At the state change itself: fire whatever is still pending under `tag` and forget it.
+        Returns False if nothing was scheduled under `tag`, so the caller can play it directly."""
+        events = [ev for ev in self._tags.pop(tag, ()) if not ev.cancelled]
+        now = time.perf_counter()
+        for ev in events:
+            ev.at = min(ev.at, now)  # the state change may come earlier than planned
+            if ev.fired_at is None:
+                self._pending.remove(ev)
+                self._fire(ev, now)
+        return bool(events)
+
+    def cancel(self, tag):
+        """Drop the events under `tag`; one that already started is stopped on its channel."""
+        for ev in self._tags.pop(tag, ()):
+            ev.cancelled = True
+            if ev.fired_at is None:
+                self._pending.remove(ev)
+            else:
+                try:
+                    if ev.channel.get_sound() is ev.voice.sound:
+                        ev.channel.stop()
+                except Exception:
+                    pass
+                if ev in self._unmatched:
+                    self._unmatched.remove(ev)
+
+    def presented(self):
+        """Record a presented frame and log the offset of sounds whose visual it shows."""
+        now = time.perf_counter()
+        if self._last_present is not None:
+            self.frame_dt += 0.1 * (min(0.1, now - self._last_present) - self.frame_dt)
+        self._last_present = now
+        if not self._unmatched:
+            return
+        keep = []
+        for ev in self._unmatched:
+            if ev.at > now:
+                keep.append(ev)
+                continue
+            offset = (ev.fired_at + self.latency) - now  # > 0: audio lands after the frame
+            self.offsets.setdefault(ev.label, []).append(offset)
+            if AV_LOG:
+                print(f"[AV] {ev.label:<12} audio {offset * 1000:+7.1f} ms vs frame  "
+                      f"(fired {(ev.at - ev.fired_at) * 1000:5.1f} ms ahead)")
+        self._unmatched = keep
+
+    def stats(self):
+        """Per-label count, mean and worst audio/visual offset in milliseconds."""
+        return {label: {'n': len(v), 'mean_ms': 1000.0 * sum(v) / len(v),
+                        'max_abs_ms': 1000.0 * max(abs(x) for x in v)}
+                for label, v in self.offsets.items()}
+
+AUDIO = AudioScheduler()
+
+# Combo pitch ladder: from streak 2 up, each level starts the two combo tones higher and spreads
+# them wider. Variants are synthesized during the countdown, one per frame after it is presented
+# (so no frame waits on all of them), and kept in an LRU keyed by level and mixer format; the
+# gameplay hot path only reads the cache.
+COMBO_LADDER_LEVELS = 8      # streaks 2..9 get their own variant; longer streaks reuse the top one
+COMBO_LADDER_CAPACITY = 8    # LRU size in variants
+COMBO_LADDER_STEP = 2        # semitones the first tone rises per level
+COMBO_LADDER_INTERVALS = (4, 5, 7, 7, 9, 9, 12, 12)  # semitones between the two tones, per level
+
+class ComboLadder:
+    """LRU cache of streak-dependent (combo, perfect) voice pairs built from the combo patch.
+    `hot` is set while the gameplay loop runs: voices() never synthesizes, and a synthesis
+    attempted while hot is refused and counted in hot_syntheses (which should stay 0).
+    """
+    def __init__(self, bank, capacity=COMBO_LADDER_CAPACITY):
+        self.bank = bank
+        self.capacity = capacity
+        self._cache = collections.OrderedDict()  # (level, mixer format) -> (combo, perfect)
+        self.hot = False
+        self.synthesized = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hot_syntheses = 0
+
+    @staticmethod
+    def level(streak):
+        return max(0, min(COMBO_LADDER_LEVELS - 1, streak - 2))
+
+    def voices(self, streak):
+        """Cached (combo, perfect) voices for `streak`, or None (caller falls back to the fixed sounds)."""
+        key = (self.level(streak), pygame.mixer.get_init())
+        pair = self._cache.get(key)
+        if pair is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return pair
+
+    def prewarm(self, streaks=None, limit=None):
+        """Make sure the variants for `streaks` (default: every level) are cached, synthesizing
+        at most `limit` of them in this call. Returns True once none is left to build."""
+        levels = range(COMBO_LADDER_LEVELS) if streaks is None else sorted({self.level(s) for s in streaks})
+        fmt = pygame.mixer.get_init()
+        done = True
+        for level in levels:
+            key = (level, fmt)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                continue
+            if limit is not None and limit <= 0:
+                done = False
+                continue
+            if limit is not None:
+                limit -= 1
+            pair = self._synthesize(level)
+            if pair is None:
+                continue
+            self._cache[key] = pair
+            while len(self._cache) > self.capacity:
+                _, old = self._cache.popitem(last=False)
+                for voice in old:
+                    self.bank.discard(voice)
+                self.evictions += 1
+        return done
+
+    def _synthesize(self, level):
+        if self.hot:
+            self.hot_syntheses += 1
+            print(f"[Audio] refused combo ladder synthesis on the gameplay hot path (level {level})")
+            return None
+        if not SOUND_ENABLED or not self.bank.combo:
+            return None
+        base = SOUND_PATCHES['combo']
+        (f0, d0, l0), gap, (_, d1, l1) = base['notes']
+        f0 = f0 * 2.0 ** (COMBO_LADDER_STEP * level / 12.0)
+        f1 = f0 * 2.0 ** (COMBO_LADDER_INTERVALS[level] / 12.0)
+        patch = dict(base, notes=[(f0, d0, l0), gap, (f1, d1, l1)])
+        combo = render_patch_bank({'combo': patch}, cache_name=None).get('combo')
+        if combo is None:
+            return None
+        self.synthesized += 1
+        return (self.bank.add_patch(None, combo, patch),
+                self.bank.add_composite(None, SOUND_COMPOSITES['perfect'], {'combo': combo}))
+
+    def stats(self):
+        return {'cached': len(self._cache), 'synthesized': self.synthesized, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions, 'hot_syntheses': self.hot_syntheses}
+
+COMBO_LADDER = ComboLadder(SOUNDS)
+
+def set_bgm_volume(volume):
+    """Set the BGM channel volume; if the BGM is still being built, remember it for when it starts."""
+    global BGM_TARGET_VOLUME
+    with BGM_LOCK:
+        BGM_TARGET_VOLUME = max(0.0, min(1.0, float(volume)))
+        if BGM_CHANNEL is not None:
+            BGM_CHANNEL.set_volume(BGM_TARGET_VOLUME)
+    if BGM_STEMS_PLAYER is not None:
+        BGM_STEMS_PLAYER.refresh()
+
+def _start_bgm_playback(fade_in, start):
+    """Start the BGM on a free channel via start(channel), ramping up to BGM_TARGET_VOLUME over fade_in seconds."""
+    global BGM_CHANNEL
+    ch = CHANNELS.bgm.acquire() or pygame.mixer.find_channel(True)
+    if ch is None:
+        return
+    ch.set_volume(0.0 if fade_in > 0 else BGM_TARGET_VOLUME)
+    start(ch)
+    steps = max(1, int(fade_in / 0.02))
+    for i in range(1, steps + 1):
+        if fade_in <= 0:
+            break
+        time.sleep(fade_in / steps)
+        with BGM_LOCK:
+            # Re-read the target each step so settings changed mid-fade are honoured
+            ch.set_volume(BGM_TARGET_VOLUME * i / steps)
+    with BGM_LOCK:
+        ch.set_volume(BGM_TARGET_VOLUME)
+        BGM_CHANNEL = ch
+
+def _bgm_worker():
+    """Build the BGM and start it looping with a short fade-in (runs on a daemon thread)."""
+    global BGM_SOUND, BGM_STREAM_PLAYER, BGM_STEMS_PLAYER
+    try:
+        fade_in = BGM_FADE_IN if BGM_ASYNC else 0.0
+        if BGM_STREAM and NUMPY_AVAILABLE:
+            mi = pygame.mixer.get_init() or (22050, -16, 1)
+            BGM_STREAM_PLAYER = BgmStream(mi[0], mi[2])
+            _start_bgm_playback(fade_in, BGM_STREAM_PLAYER.start)
+            print("🎵 BGM streaming started")
+            return
+        if BGM_ADAPTIVE and NUMPY_AVAILABLE:
+            stems = create_bgm_stems()
+            _startup_mark("bgm synthesized")
+            player = BgmStems(stems) if stems else None
+            if player is not None and player.start():
+                BGM_STEMS_PLAYER = player  # fades in through its own ramp
+                print("🎵 BGM started (adaptive stems)")
+                return
+            print("[Audio] adaptive BGM unavailable, using the single loop")
+        snd = create_background_music()
+        _startup_mark("bgm synthesized")
+        if snd is None:
             print("⚠️ BGM not available")
+            return
+        BGM_SOUND = snd
+        _start_bgm_playback(fade_in, lambda ch: ch.play(snd, loops=-1))
+        print("🎵 BGM started")
     except Exception as e:
         print(f"⚠️ Failed to start BGM: {e}")
 
+def _start_bgm():
+    """Start background music (looping), built on the worker thread unless RT_BGM_SYNC=1."""
+    if SOUND_ENABLED and BGM_ENABLED:
+        if BGM_ASYNC:
+            threading.Thread(target=_bgm_worker, name="bgm-synth", daemon=True).start()
+            _startup_mark("bgm worker started")
+        else:
+            _bgm_worker()
+
+_AUDIO_READY = False
+
+def init_audio():
+    """Open the mixer and channel groups, register the sounds and start the BGM (once)."""
+    global _AUDIO_READY
+    if _AUDIO_READY:
+        return
+    _AUDIO_READY = True
+    _init_mixer()
+    _load_numpy()
+    CHANNELS.open()
+    AUDIO.calibrate()
+    _init_sounds()
+    _start_bgm()
+
 # Game constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Test Your Brain Age!")
+SCREEN = None  # display surface, created by init_display()
+
+def init_display():
+    """Open the game window once."""
+    global SCREEN
+    if SCREEN is not None:
+        return
+    init_pygame()
+    if FRAME_VSYNC:
+        try:
+            SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+            get_rate = getattr(pygame.display, 'get_current_refresh_rate', None)
+            PACER.set_vsync(get_rate() if get_rate else 0)
+        except pygame.error as e:
+            print(f"[Display] vsync unavailable ({e}); pacing with the frame timer")
+    if SCREEN is None:
+        SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Test Your Brain Age!")
+    _startup_mark("display set_mode")
+
+def init_subsystems():
+    """Everything the game needs, in the original startup order: audio, fonts, window, block sprites."""
+    init_audio()
+    init_fonts()
+    init_display()
+    BLOCK_SPRITES.build()
 
 # UI layout constants
 UI_MARGIN_X = 20
@@ -828,6 +2978,76 @@ BLOCK_INTERVAL = 3.0  # time between blocks (seconds)
 CORRECT_BLOCKS = 6  # number of correct blocks (text matches color)
 DISTURB_BLOCKS = 4  # number of distractor blocks (text doesn't match color)
 
+# Block sprites: there are only len(COLOR_LIST) ** 2 (color, text) blocks, so each one is
+# composited once at startup, together with BLOCK_FADE_FRAMES pre-scaled frames of the
+# disappear animation. Drawing a block is then a single blit; the fade is the frame's
+# surface-level alpha.
+BLOCK_FADE_FRAMES = 8
+BLOCK_FADE_SCALE = 0.5  # the disappear animation grows the block by this much
+
+def _render_block(rgb, label, scale, alpha):
+    """Block fill, border, highlight and label at `scale`, darkened as at `alpha` (opaque Surface)."""
+    width = int(BLOCK_WIDTH * scale)
+    height = int(BLOCK_HEIGHT * scale)
+    surface = pygame.Surface((width, height))
+    block_color = tuple(int(c * alpha / 255) for c in rgb)
+    surface.fill(block_color)
+    # Pixel-style border effect
+    border_color = tuple(max(0, c - 40) for c in block_color)
+    pygame.draw.rect(surface, border_color, (0, 0, width, height), 3)
+    # Highlight effect
+    highlight_color = tuple(min(255, c + 60) for c in block_color)
+    pygame.draw.rect(surface, highlight_color, (3, 3, width - 6, height - 6), 2)
+    # Pixel-style text (use contrasting color)
+    text_color = (20, 20, 20) if sum(rgb) > 400 else (240, 240, 240)
+    text_surface = small_font.render(label, False, text_color)
+    if scale != 1.0:
+        text_width = int(text_surface.get_width() * scale)
+        text_height = int(text_surface.get_height() * scale)
+        if text_width > 0 and text_height > 0:
+            text_surface = pygame.transform.scale(text_surface, (text_width, text_height))
+    surface.blit(text_surface, ((width - text_surface.get_width()) // 2,
+                                (height - text_surface.get_height()) // 2))
+    return surface
+
+class BlockSprites:
+    """(color, text_color) -> frames; frame k is the block at animation progress k / BLOCK_FADE_FRAMES."""
+    def __init__(self):
+        self._frames = {}
+        self._key = None
+        self.builds = 0
+        self.blits = 0
+
+    def build(self):
+        """Composite every block and its animation frames (again only if the font or size changed)."""
+        key = (BLOCK_WIDTH, BLOCK_HEIGHT, id(small_font))
+        if self._key == key:
+            return
+        init_fonts()
+        convert = pygame.display.get_surface() is not None
+        for color in COLOR_LIST:
+            for text_color in COLOR_LIST:
+                frames = []
+                for k in range(BLOCK_FADE_FRAMES):
+                    progress = k / BLOCK_FADE_FRAMES
+                    surface = _render_block(COLORS[color]['rgb'], COLORS[text_color]['name'],
+                                            1.0 + progress * BLOCK_FADE_SCALE, max(0, int(255 * (1.0 - progress))))
+                    frames.append(surface.convert() if convert else surface)
+                self._frames[(color, text_color)] = frames
+        self._key = key
+        self.builds += 1
+        _startup_mark("block sprites")
+
+    def frame(self, color, text_color, index=0):
+        if self._key is None:
+            self.build()
+        return self._frames[(color, text_color)][index]
+
+    def stats(self):
+        return {'sprites': sum(len(f) for f in self._frames.values()), 'builds': self.builds, 'blits': self.blits}
+
+BLOCK_SPRITES = BlockSprites()
+
 # Rankings data (only valid during a single run)
 rankings = []
 
@@ -869,6 +3089,7 @@ class Block:
         self.is_animating = False
         self.animation_start_time = 0
         self.animation_duration = 0.3  # seconds
+        self.frame = 0  # index into the BLOCK_SPRITES animation frames
         self.scale = 1.0
         self.alpha = 255
     
@@ -890,68 +3111,38 @@ class Block:
             self.is_animating = False
             return True  # Animation complete
         
-        # Scale and fade out effect
-        self.scale = 1.0 + (progress * 0.5)  # Grow slightly
+        # Scale and fade out effect: the scale steps through the pre-rendered frames,
+        # the fade is applied per draw as surface alpha
+        self.frame = min(BLOCK_FADE_FRAMES - 1, int(progress * BLOCK_FADE_FRAMES))
+        self.scale = 1.0 + (self.frame / BLOCK_FADE_FRAMES) * BLOCK_FADE_SCALE  # Grow slightly
         self.alpha = max(0, int(255 * (1.0 - progress)))  # Fade out
         
         return False  # Animation still running
-    
+
+    def rect(self):
+        """Screen area draw() covers at the current animation frame."""
+        width, height = BLOCK_SPRITES.frame(self.color, self.text_color, self.frame).get_size()
+        return pygame.Rect(self.x - (width - BLOCK_WIDTH) // 2,
+                           self.y - (height - BLOCK_HEIGHT) // 2, width, height)
+
     def draw(self, screen):
-        """Draw the block with pixel art style and animation effects"""
+        """Blit the pre-rendered block sprite for the current animation frame."""
         if self.alpha <= 0:
             return
-            
-        # Calculate animated size and position
-        animated_width = int(BLOCK_WIDTH * self.scale)
-        animated_height = int(BLOCK_HEIGHT * self.scale)
-        
-        # Center the scaled block
-        offset_x = (animated_width - BLOCK_WIDTH) // 2
-        offset_y = (animated_height - BLOCK_HEIGHT) // 2
-        
-        animated_x = self.x - offset_x
-        animated_y = self.y - offset_y
-        
-        # Create a surface with per-pixel alpha
-        block_surface = pygame.Surface((animated_width, animated_height), pygame.SRCALPHA)
-        
-    # Pixel-style block background
-        block_color = tuple(int(c * self.alpha / 255) for c in self.rgb)
-        pygame.draw.rect(block_surface, (*block_color, self.alpha), 
-                        (0, 0, animated_width, animated_height))
-        
-    # Pixel-style border effect
-        border_color = tuple(max(0, c - 40) for c in block_color)
-        pygame.draw.rect(block_surface, (*border_color, self.alpha), 
-                        (0, 0, animated_width, animated_height), 3)
-        
-    # Highlight effect
-        highlight_color = tuple(min(255, c + 60) for c in block_color)
-        pygame.draw.rect(block_surface, (*highlight_color, self.alpha), 
-                        (3, 3, animated_width - 6, animated_height - 6), 2)
-        
-    # Pixel-style text (use contrasting color)
-        text_color = (20, 20, 20) if sum(self.rgb) > 400 else (240, 240, 240)
-        text_surface = small_font.render(self.display_text, False, text_color)
-        text_surface.set_alpha(self.alpha)
-        
-        # Scale text if needed
-        if self.scale != 1.0:
-            text_width = int(text_surface.get_width() * self.scale)
-            text_height = int(text_surface.get_height() * self.scale)
-            if text_width > 0 and text_height > 0:
-                text_surface = pygame.transform.scale(text_surface, (text_width, text_height))
-        
-        # Center text on block
-        text_x = (animated_width - text_surface.get_width()) // 2
-        text_y = (animated_height - text_surface.get_height()) // 2
-        
-        block_surface.blit(text_surface, (text_x, text_y))
-        screen.blit(block_surface, (animated_x, animated_y))
+        sprite = BLOCK_SPRITES.frame(self.color, self.text_color, self.frame)
+        sprite.set_alpha(self.alpha if self.alpha < 255 else None)
+        width, height = sprite.get_size()
+        screen.blit(sprite, (self.x - (width - BLOCK_WIDTH) // 2, self.y - (height - BLOCK_HEIGHT) // 2))
+        BLOCK_SPRITES.blits += 1
+
 
+# Round stats: set RT_STATS_LOG=1 to print the audio, text and render cache counters and the
+# frame pacing figures at the end of every round.
+STATS_LOG = os.environ.get('RT_STATS_LOG', '') == '1'
 
 class Game:
     def __init__(self):
+        init_subsystems()
         self.username = ""
         self.score = 0
         self.streak = 0  # current consecutive correct count (streak)
@@ -989,9 +3180,10 @@ class Game:
         self.countdown_start = 0.0
         self.countdown_current = 3  # counts 3,2,1 then GO
         self.countdown_active = False
+        self.combo_ladder_ready = False  # all streak combo variants cached (built during the countdown)
 
     # Perfect particle effect container
-        self.perfect_particles = []  # list of dicts: {x,y,vx,vy,life,age,color}
+        self.perfect_particles = ParticleSystem(PARTICLE_CAPACITY, mode='fade')
         self._last_play_dt_time = 0.0
 
         # GIF capture state (F12 toggles recording)
@@ -1016,15 +3208,22 @@ class Game:
         self.autogif_t0 = 0.0
         self.autogif_flags = {}
 
+        # Sound registry; play sites use self.sounds.<name>.play()
+        self.sounds = SOUNDS
+        self.combo_ladder = COMBO_LADDER
+
         # Persistence paths and settings
         self.data_dir = os.path.join(os.path.expanduser('~'), '.reaction_mini')
         self.data_file = os.path.join(self.data_dir, 'data.json')
         self.settings = {
             'bgm_enabled': BGM_ENABLED,
             'bgm_volume': BGM_VOLUME,
-            'sfx_volume': 1.0
+            'sfx_volume': 1.0,
+            'master_volume': 1.0,
+            'frame_rate': FRAME_RATE
         }
         self.load_persistence()
+        PACER.set_target(self.settings.get('frame_rate', FRAME_RATE))
         # Apply audio settings (volume/toggles)
         try:
             self.apply_audio_settings()
@@ -1035,17 +3234,15 @@ class Game:
         self.title_anim_start = time.time()
         self.last_frame_time = time.time()
         # Decorative particles for the opening screen (upper half)
-        self.title_particles = []
+        self.title_particles = ParticleSystem(28, mode='twinkle')
         try:
             for _ in range(28):
-                self.title_particles.append({
-                    'x': random.uniform(0, SCREEN_WIDTH),
-                    'y': random.uniform(0, SCREEN_HEIGHT * 0.55),
-                    'dx': random.uniform(-12.0, 12.0),
-                    'dy': random.uniform(8.0, 22.0),
-                    'phase': random.uniform(0.0, math.pi * 2.0),
-                    'size': random.choice([1, 1, 2])
-                })
+                self.title_particles.spawn(random.uniform(0, SCREEN_WIDTH),
+                                           random.uniform(0, SCREEN_HEIGHT * 0.55),
+                                           random.uniform(-12.0, 12.0),
+                                           random.uniform(8.0, 22.0),
+                                           0.0, random.choice([1, 1, 2]), PIXEL_COLORS['text_accent'],
+                                           phase=random.uniform(0.0, math.pi * 2.0))
         except Exception:
             pass
 
@@ -1082,8 +3279,7 @@ class Game:
                                     pass
                                 if k == 'bgm_volume':
                                     try:
-                                        if BGM_CHANNEL:
-                                            BGM_CHANNEL.set_volume(v)
+                                        SOUNDS.set_bus_volume('bgm', v)
                                     except Exception:
                                         pass
         except Exception as e:
@@ -1101,35 +3297,54 @@ class Game:
         except Exception as e:
             print(f"[Persistence] save failed: {e}")
 
+    def cycle_frame_rate(self, step):
+        """Step the frame-rate setting through FRAME_RATE_CHOICES and apply it to the pacer."""
+        current = self.settings.get('frame_rate', FRAME_RATE)
+        index = FRAME_RATE_CHOICES.index(current) if current in FRAME_RATE_CHOICES else 0
+        self.settings['frame_rate'] = FRAME_RATE_CHOICES[(index + step) % len(FRAME_RATE_CHOICES)]
+        PACER.set_target(self.settings['frame_rate'])
+        try:
+            self.sounds.ui_key_tap.play()
+        except Exception:
+            pass
+
     def apply_audio_settings(self):
-        """Apply SFX/BGM volumes and bgm enabled flag to current mixer objects."""
+        """Drive the SoundBank buses from settings: master, SFX/UI (sfx_volume) and BGM."""
         if not SOUND_ENABLED:
             return
-        # SFX volume
+        try:
+            SOUNDS.set_master_volume(float(self.settings.get('master_volume', 1.0)))
+        except Exception:
+            pass
         try:
             vol = float(self.settings.get('sfx_volume', 1.0))
         except Exception:
             vol = 1.0
-        for name in [
-            'SUCCESS_SOUND','ERROR_SOUND','MISS_SOUND','COMBO_SOUND',
-            'UI_NAV_SOUND','UI_KEY_TAP_SOUND','UI_KEY_ENTER_SOUND','UI_KEY_BACKSPACE_SOUND',
-            'START_SOUND','GAMEOVER_SOUND','COUNTDOWN_BEEP_SOUND'
-        ]:
-            try:
-                if name in globals() and globals()[name] is not None:
-                    globals()[name].set_volume(max(0.0, min(1.0, vol)))
-            except Exception:
-                pass
-        # BGM volume and enable
+        SOUNDS.set_bus_volume('sfx', vol)
+        SOUNDS.set_bus_volume('ui', vol)
+        # BGM volume and enable (applied now, or when the background BGM build finishes)
         try:
             bgm_on = bool(self.settings.get('bgm_enabled', True))
-            bgm_vol = float(self.settings.get('bgm_volume', BGM_VOLUME if 'BGM_VOLUME' in globals() else 0.4))
-            if 'BGM_CHANNEL' in globals() and globals()['BGM_CHANNEL'] is not None:
-                ch = globals()['BGM_CHANNEL']
-                ch.set_volume(bgm_vol if bgm_on else 0.0)
+            bgm_vol = float(self.settings.get('bgm_volume', BGM_VOLUME))
+            SOUNDS.set_bus_volume('bgm', bgm_vol if bgm_on else 0.0)
         except Exception:
             pass
 
+    def update_music(self, dt=0.0):
+        """Point the adaptive BGM stems at the mix for the current state and streak, and step
+        their volume ramps by dt seconds. Returns True while a ramp is in progress."""
+        player = BGM_STEMS_PLAYER
+        if player is None:
+            return False
+        player.set_mix(self.game_state, self.streak)
+        return player.advance(dt)
+
+    def _tick_frame(self):
+        """Pace one frame of a screen loop (PACER.tick) and advance the adaptive BGM by its dt."""
+        dt = PACER.tick()
+        self.update_music(dt)
+        return dt
+
     def spawn_perfect_particles(self, cx, cy, color):
         """Spawn small pixel particles at (cx,cy) with given RGB color tuple."""
         try:
@@ -1140,16 +3355,7 @@ class Game:
                 vx = math.cos(angle) * speed
                 vy = math.sin(angle) * speed - random.uniform(30.0, 80.0)
                 life = random.uniform(0.55, 0.9)
-                self.perfect_particles.append({
-                    'x': float(cx),
-                    'y': float(cy),
-                    'vx': vx,
-                    'vy': vy,
-                    'life': life,
-                    'age': 0.0,
-                    'color': color,
-                    'size': random.choice([2,2,3])
-                })
+                self.perfect_particles.spawn(float(cx), float(cy), vx, vy, life, random.choice([2, 2, 3]), color)
         except Exception:
             pass
 
@@ -1259,6 +3465,8 @@ class Game:
                 self._toggle_capture()
         except Exception:
             pass
+        for tag in ('countdown', 'miss', 'gameover'):
+            AUDIO.cancel(tag)
         self.autogif = True
         self.autogif_phase = 'title'
         self.autogif_t0 = time.time()
@@ -1492,15 +3700,31 @@ class Game:
                 self.autogif_flags = {}
                 return
     
+    def _idle_events(self):
+        """Events for a static screen. While recording or auto-recording, or while the adaptive BGM
+        is ramping to a new mix, poll once per paced frame so capture, the autogif driver and the
+        ramp keep their timing; otherwise block in pygame.event.wait until input arrives (waking
+        every IDLE_WAIT_MS regardless).
+        """
+        if self._cap_active or self.autogif or self.update_music():
+            self._tick_frame()
+            return pygame.event.get()
+        PACER.idle()
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        events = [] if event.type == NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
+
+    def _rec_button_rect(self):
+        """Rect of the REC/STOP button: window bottom-right, outside the play frame in all screens."""
+        btn_w, btn_h = 86, 28
+        margin = 8
+        return pygame.Rect(SCREEN_WIDTH - btn_w - margin, SCREEN_HEIGHT - btn_h - margin, btn_w, btn_h)
+
     def _draw_rec_button(self):
         """Draw a small REC/STOP button at the bottom-right corner (outside the frame) and return its rect for hit testing."""
         try:
-            btn_w, btn_h = 86, 28
-            margin = 8
-            x = SCREEN_WIDTH - btn_w - margin
-            # Place at window bottom-right so it's outside the play frame in all screens
-            y = SCREEN_HEIGHT - btn_h - margin
-            rect = pygame.Rect(x, y, btn_w, btn_h)
+            rect = self._rec_button_rect()
             # Background
             pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], rect)
             # Border indicates state
@@ -1509,12 +3733,9 @@ class Game:
             # Label text
             label = "STOP" if self._cap_active else "REC"
             txt_col = PIXEL_COLORS['error'] if self._cap_active else PIXEL_COLORS['text_primary']
-            draw_pixel_text_with_shadow(
-                SCREEN, label, small_font,
-                rect.x + (rect.width - small_font.size(label)[0]) // 2,
-                rect.y + (rect.height - small_font.get_linesize()) // 2 + 2,
-                txt_col, PIXEL_COLORS['bg_primary']
-            )
+            label_surf, (label_w, _) = TEXT_CACHE.get(label, small_font, txt_col, PIXEL_COLORS['bg_primary'])
+            SCREEN.blit(label_surf, (rect.x + (rect.width - label_w) // 2,
+                                     rect.y + (rect.height - small_font.get_linesize()) // 2 + 2))
             # Red dot indicator on the left
             dot = pygame.Rect(rect.x + 8, rect.y + (rect.height - 10)//2, 10, 10)
             if self._cap_active:
@@ -1525,6 +3746,225 @@ class Game:
         except Exception:
             return None
     
+    def _build_results_layer(self, surf):
+        """Draw the results screen (background, panels, stats, brain age, hint) onto `surf`."""
+        # Pixel-style background
+        draw_screen_background(surf, 25)
+        
+        # Pixel-style title
+        draw_pixel_text_centered(surf, "GAME OVER", large_font,
+                               SCREEN_WIDTH//2,
+                               60, PIXEL_COLORS['error'], PIXEL_COLORS['bg_primary'])
+        
+        # Results panel
+        panel_rect = pygame.Rect(50, 130, SCREEN_WIDTH - 100, 300)
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], panel_rect)
+        draw_pixel_border(surf, panel_rect, PIXEL_COLORS['frame'], 3)
+        
+        # Player info
+        draw_pixel_text_centered(surf, f"PLAYER: {self.username}", font,
+                               SCREEN_WIDTH//2,
+                               160, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
+        
+        # Score display
+        score_color = PIXEL_COLORS['success'] if self.score >= 0 else PIXEL_COLORS['error']
+        draw_pixel_text_centered(surf, f"TOTAL SCORE: {self.score}", font,
+                               SCREEN_WIDTH//2,
+                               200, score_color, PIXEL_COLORS['bg_secondary'])
+
+        # Max combo display
+        max_combo_text = f"MAX COMBO: x{self.max_combo}"
+        draw_pixel_text_centered(surf, max_combo_text, font,
+                               SCREEN_WIDTH//2,
+                               230, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
+        
+        # reaction time statistics (only if there are valid clicks)
+        rt_texts = []
+        if self.reaction_times:
+            avg_rt = sum(self.reaction_times) / len(self.reaction_times)
+            min_rt = min(self.reaction_times)
+            max_rt = max(self.reaction_times)
+            rt_texts = [
+                f"Average reaction time: {avg_rt:.3f}s",
+                f"Fastest reaction time: {min_rt:.3f}s",
+                f"Slowest reaction time: {max_rt:.3f}s"
+            ]
+        else:
+            rt_texts = ["NO VALID CLICKS RECORDED"]
+        
+        # Reaction time stats display
+        y_offset = 250
+        for i, rt_line in enumerate(rt_texts):
+            draw_pixel_text_centered(surf, rt_line, small_font,
+                                   SCREEN_WIDTH//2,
+                                   y_offset + i*30, PIXEL_COLORS['text_secondary'], PIXEL_COLORS['bg_secondary'])
+        
+        # Brain age result
+        brain_age, brain_age_text = self.calculate_brain_age()
+        
+        # Brain age panel
+        brain_panel_rect = pygame.Rect(50, 380, SCREEN_WIDTH - 100, 120)
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], brain_panel_rect)
+        draw_pixel_border(surf, brain_panel_rect, PIXEL_COLORS['warning'], 3)
+        
+        # Brain age title
+        brain_title = f"BRAIN AGE: {brain_age} YEARS OLD"
+        draw_pixel_text_centered(surf, brain_title, font,
+                               SCREEN_WIDTH//2,
+                               395, PIXEL_COLORS['warning'], PIXEL_COLORS['bg_secondary'])
+        
+        # Brain age description (auto wrap)
+        brain_text_lines = wrap_text(brain_age_text, small_font, SCREEN_WIDTH - 120)
+        brain_y = 425
+        for line in brain_text_lines[:3]:  # show at most 3 lines
+            draw_pixel_text_centered(surf, line, small_font,
+                                   SCREEN_WIDTH//2,
+                                   brain_y, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
+            brain_y += 20
+        
+        # Continue hint (moved lower)
+        hint_text = "PRESS ANY KEY TO VIEW RANKINGS"
+        draw_pixel_text_centered(surf, hint_text, font,
+                               SCREEN_WIDTH//2,
+                               520, PIXEL_COLORS['success'], PIXEL_COLORS['bg_primary'])
+
+    def _build_instructions_layer(self, surf, text_area):
+        """Draw the instructions background, title and text panel onto `surf`."""
+        # Pixel-style background with decorative grid
+        draw_screen_background(surf, 40)
+        
+        # Pixel-style title
+        draw_pixel_text_centered(surf, "INSTRUCTIONS", large_font,
+                               SCREEN_WIDTH//2,
+                               30, PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_secondary'])
+        
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], text_area)
+        # Use accent-colored border
+        draw_pixel_border(surf, text_area, PIXEL_COLORS['accent'], 2)
+
+    def _build_instructions_panel(self, surf, lines, text_area, headline_font, ease):
+        """Draw the instruction lines (with shadow) at eased progress `ease` onto `surf`, which
+        covers `text_area` plus the 2px shadow offset."""
+        text_alpha = int(255 * ease)
+        scale = 0.92 + 0.08 * ease
+        text_margin = 30
+        text_width = text_area.width - text_margin * 2
+        wrapped_lines = []
+        for ln in lines:
+            wrapped_lines.extend(wrap_text(ln, headline_font, text_width))
+
+        line_spacing = 10
+        rendered_lines = []
+        for sub in wrapped_lines:
+            base_surf, _ = TEXT_CACHE.get(sub, headline_font, PIXEL_COLORS['text_primary'])
+            base_shadow, _ = TEXT_CACHE.get(sub, headline_font, PIXEL_COLORS['accent'])
+            w, h = base_surf.get_width(), base_surf.get_height()
+            sw = max(1, int(w * scale))
+            sh = max(1, int(h * scale))
+            if (sw, sh) == (w, h) and text_alpha >= 255:
+                # settled frame: the cached surfaces as they are
+                rendered_lines.append((base_surf, base_shadow, sw, sh))
+                continue
+            # Use nearest-neighbor scaling to preserve crisp pixel edges
+            text_surf = pygame.transform.scale(base_surf, (sw, sh))
+            shadow = pygame.transform.scale(base_shadow, (sw, sh))
+            text_surf.set_alpha(text_alpha)
+            shadow.set_alpha(text_alpha)
+            rendered_lines.append((text_surf, shadow, sw, sh))
+
+        total_height = sum(h for (_, _, _, h) in rendered_lines) + (len(rendered_lines) - 1) * line_spacing
+        y = (text_area.height - total_height) // 2
+        for (text_surf, shadow, sw, sh) in rendered_lines:
+            x = (text_area.width - sw) // 2
+            surf.blit(shadow, (x + 2, y + 2))
+            surf.blit(text_surf, (x, y))
+            y += sh + line_spacing
+
+    def _build_playing_layer(self, surf, progress_width):
+        """Draw the gameplay background, score/progress boxes and the black game frame onto `surf`."""
+        # Pixel-style background
+        draw_screen_background(surf, 20)
+        
+        # Score and progress boxes (text is drawn per frame)
+        score_bg = pygame.Rect(UI_MARGIN_X - 5, 5, 180, 40)
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], score_bg)
+        draw_pixel_border(surf, score_bg, PIXEL_COLORS['frame'], 2)
+        progress_bg = pygame.Rect(SCREEN_WIDTH - UI_MARGIN_X - progress_width + 5, 5, progress_width, 40)
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], progress_bg)
+        draw_pixel_border(surf, progress_bg, PIXEL_COLORS['frame'], 2)
+        
+        # black game frame (play area)
+        pygame.draw.rect(surf, (0, 0, 0), PLAY_AREA, width=4)
+
+    def _build_rankings_layer(self, surf, top):
+        """Draw the rankings background, panel, top-10 rows and hints onto `surf`."""
+        # Pixel-style background
+        draw_screen_background(surf, 30)
+        
+        # Pixel-style title
+        draw_pixel_text_centered(surf, "RANKINGS", large_font,
+                               SCREEN_WIDTH//2,
+                               30, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_primary'])
+        
+        # Rankings panel
+        panel_rect = pygame.Rect(30, 80, SCREEN_WIDTH - 60, 380)
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], panel_rect)
+        draw_pixel_border(surf, panel_rect, PIXEL_COLORS['frame'], 3)
+        
+        # Show top 10
+        for i, (name, score) in enumerate(top):
+            rank = i + 1
+            # Highlight current player
+            color = PIXEL_COLORS['error'] if name == self.username else PIXEL_COLORS['text_primary']
+            rank_text = f"{rank}. {name} - SCORE: {score}"
+            
+            # Rank background
+            if name == self.username:
+                rank_bg = pygame.Rect(50, 100 + i*35, SCREEN_WIDTH - 100, 30)
+                pygame.draw.rect(surf, PIXEL_COLORS['accent'], rank_bg)
+                draw_pixel_border(surf, rank_bg, PIXEL_COLORS['error'], 2)
+            
+            draw_pixel_text_centered(surf, rank_text, font,
+                                   SCREEN_WIDTH//2,
+                                   105 + i*35, color, PIXEL_COLORS['bg_secondary'])
+        
+        # Hints (with settings entry)
+        hint_text = "ESC: QUIT | ANY KEY: RESTART | S: SETTINGS"
+        draw_pixel_text_centered(surf, hint_text, small_font,
+                               SCREEN_WIDTH//2,
+                               480, PIXEL_COLORS['text_secondary'], PIXEL_COLORS['bg_primary'])
+
+    def _build_settings_layer(self, surf, labels, selected):
+        """Draw the settings background, panel, item labels and hint onto `surf`."""
+        draw_screen_background(surf, 30)
+
+        # Title
+        draw_pixel_text_centered(surf, "SETTINGS", large_font,
+                                 SCREEN_WIDTH//2,
+                                 30, PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_primary'])
+
+        panel = pygame.Rect(80, 90, SCREEN_WIDTH - 160, 360)
+        pygame.draw.rect(surf, PIXEL_COLORS['bg_secondary'], panel)
+        draw_pixel_border(surf, panel, PIXEL_COLORS['frame'], 3)
+
+        start_y = 140
+        gap = 46
+        for i, text in enumerate(labels):
+            col = PIXEL_COLORS['text_primary'] if i != selected else PIXEL_COLORS['success']
+            draw_pixel_text_centered(
+                surf, text, font,
+                SCREEN_WIDTH//2,
+                start_y + i*gap,
+                col, PIXEL_COLORS['bg_secondary']
+            )
+
+        hint = "UP/DOWN: SELECT  LEFT/RIGHT: ADJUST  ENTER: TOGGLE  ESC: BACK"
+        draw_pixel_text_centered(
+            surf, hint, small_font,
+            SCREEN_WIDTH//2,
+            480, PIXEL_COLORS['text_secondary'], PIXEL_COLORS['bg_primary']
+        )
+
     def calculate_brain_age(self):
         """Calculate brain age"""
         if not self.reaction_times:
@@ -1571,17 +4011,9 @@ class Game:
         # ensure frame time baseline
         self.last_frame_time = time.time()
         while self.game_state == "input_name":
-            # Pixel-style background
-            SCREEN.fill(PIXEL_COLORS['bg_primary'])
-            
-            # Draw grid background
-            grid_size = 20
-            for x in range(0, SCREEN_WIDTH, grid_size):
-                pygame.draw.line(SCREEN, PIXEL_COLORS['bg_secondary'], 
-                               (x, 0), (x, SCREEN_HEIGHT), 1)
-            for y in range(0, SCREEN_HEIGHT, grid_size):
-                pygame.draw.line(SCREEN, PIXEL_COLORS['bg_secondary'], 
-                               (0, y), (SCREEN_WIDTH, y), 1)
+            self._tick_frame()
+            # Pixel-style background with grid (cached layer)
+            LAYERS.blit(SCREEN, 'input_name', lambda surf: draw_screen_background(surf, 20))
 
             # Time and delta for animations
             now = time.time()
@@ -1590,25 +4022,11 @@ class Game:
 
             # Opening screen decorative particles (twinkling pixels)
             try:
-                star_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                for p in self.title_particles:
-                    p['x'] += p['dx'] * dt
-                    p['y'] += p['dy'] * dt
-                    # wrap around edges
-                    if p['y'] > SCREEN_HEIGHT * 0.6:
-                        p['y'] = -2
-                        p['x'] = random.uniform(0, SCREEN_WIDTH)
-                    if p['x'] < -2:
-                        p['x'] = SCREEN_WIDTH + 2
-                    elif p['x'] > SCREEN_WIDTH + 2:
-                        p['x'] = -2
-                    # twinkle alpha
-                    a = 90 + int(80 * (0.5 + 0.5 * math.sin(2.0 * now + p['phase'])))
-                    a = max(0, min(170, a))
-                    col = (*PIXEL_COLORS['text_accent'], a)
-                    size = p['size']
-                    pygame.draw.rect(star_overlay, col, (int(p['x']), int(p['y']), size, size))
-                SCREEN.blit(star_overlay, (0, 0))
+                self.title_particles.update(dt)
+                # wrap around edges
+                self.title_particles.wrap(SCREEN_WIDTH, SCREEN_HEIGHT * 0.6, lambda: random.uniform(0, SCREEN_WIDTH))
+                # twinkle alpha
+                self.title_particles.draw(SCREEN, now)
             except Exception:
                 pass
             
@@ -1616,7 +4034,8 @@ class Game:
             title_text = "TEST YOUR BRAIN AGE!"
             # Title bobbing + pulsing glow
             try:
-                tw = title_font.size(title_text)[0]
+                title_surf, (tw, _) = TEXT_CACHE.get(title_text, title_font, PIXEL_COLORS['text_accent'],
+                                                     PIXEL_COLORS['bg_secondary'])
                 th = title_font.get_linesize()
                 bob = int(3 * math.sin(now * 2.0))
                 tx = SCREEN_WIDTH // 2 - tw // 2
@@ -1624,15 +4043,14 @@ class Game:
 
                 # Pulsing glow behind the title
                 glow_alpha = max(0, min(120, int(60 + 50 * math.sin(2.0 * math.pi * 0.7 * now))))
-                glow_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
                 glow_rect = pygame.Rect(tx - 16, ty - 10, tw + 32, th + 20)
-                pygame.draw.rect(glow_overlay, (*PIXEL_COLORS['accent'], int(glow_alpha * 0.9)), glow_rect, 4)
-                pygame.draw.rect(glow_overlay, (*PIXEL_COLORS['accent'], int(glow_alpha * 0.5)), glow_rect.inflate(10, 8), 6)
-                SCREEN.blit(glow_overlay, (0, 0))
+                glow_overlay = OVERLAYS.begin('title_glow', glow_rect.inflate(10, 8))
+                glow_overlay.rect((*PIXEL_COLORS['accent'], int(glow_alpha * 0.9)), glow_rect, 4)
+                glow_overlay.rect((*PIXEL_COLORS['accent'], int(glow_alpha * 0.5)), glow_rect.inflate(10, 8), 6)
+                OVERLAYS.end(SCREEN, glow_overlay)
 
                 # Draw title text with shadow
-                draw_pixel_text_with_shadow(SCREEN, title_text, title_font, tx, ty, 
-                                            PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_secondary'])
+                SCREEN.blit(title_surf, (tx, ty))
 
                 # Animated underline segments
                 underline_y = ty + th + 6
@@ -1652,15 +4070,15 @@ class Game:
                     pygame.draw.rect(SCREEN, col, rect)
             except Exception:
                 # fallback title without effects
-                draw_pixel_text_with_shadow(SCREEN, title_text, title_font, 
-                                            SCREEN_WIDTH//2 - title_font.size(title_text)[0]//2, 
-                                            100, PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_secondary'])
+                draw_pixel_text_centered(SCREEN, title_text, title_font, 
+                                         SCREEN_WIDTH//2, 
+                                         100, PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_secondary'])
             
             # Input prompt
             prompt_text = "ENTER YOUR NAME:"
-            draw_pixel_text_with_shadow(SCREEN, prompt_text, font,
-                                      SCREEN_WIDTH//2 - font.size(prompt_text)[0]//2,
-                                      220, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
+            draw_pixel_text_centered(SCREEN, prompt_text, font,
+                                   SCREEN_WIDTH//2,
+                                   220, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
             
             # Input box
             input_box = pygame.Rect(SCREEN_WIDTH//2 - 150, 280, 300, 40)
@@ -1670,14 +4088,14 @@ class Game:
             try:
                 pulse = 0.5 + 0.5 * math.sin(now * 2.2)
                 a = int(60 + 80 * pulse)
-                deco = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                deco = OVERLAYS.begin('input_corners', input_box.inflate(4, 4))
                 c = (*PIXEL_COLORS['accent'], a)
                 s = 6
-                pygame.draw.rect(deco, c, (input_box.left - 2, input_box.top - 2, s, s))
-                pygame.draw.rect(deco, c, (input_box.right - s + 2, input_box.top - 2, s, s))
-                pygame.draw.rect(deco, c, (input_box.left - 2, input_box.bottom - s + 2, s, s))
-                pygame.draw.rect(deco, c, (input_box.right - s + 2, input_box.bottom - s + 2, s, s))
-                SCREEN.blit(deco, (0, 0))
+                deco.rect(c, (input_box.left - 2, input_box.top - 2, s, s))
+                deco.rect(c, (input_box.right - s + 2, input_box.top - 2, s, s))
+                deco.rect(c, (input_box.left - 2, input_box.bottom - s + 2, s, s))
+                deco.rect(c, (input_box.right - s + 2, input_box.bottom - s + 2, s, s))
+                OVERLAYS.end(SCREEN, deco)
             except Exception:
                 pass
             
@@ -1686,14 +4104,13 @@ class Game:
                 display_text = input_text + "|"
             else:
                 display_text = input_text
-            name_surface = font.render(display_text, False, PIXEL_COLORS['text_primary'])
-            SCREEN.blit(name_surface, (input_box.x + 10, input_box.y + 10))
+            GLYPHS.draw(SCREEN, display_text, font, input_box.x + 10, input_box.y + 10, PIXEL_COLORS['text_primary'])
             
             # Confirm hint
             hint_text = "PRESS ENTER TO CONFIRM"
-            draw_pixel_text_with_shadow(SCREEN, hint_text, small_font,
-                                      SCREEN_WIDTH//2 - small_font.size(hint_text)[0]//2,
-                                      350, PIXEL_COLORS['warning'], PIXEL_COLORS['bg_secondary'])
+            draw_pixel_text_centered(SCREEN, hint_text, small_font,
+                                   SCREEN_WIDTH//2,
+                                   350, PIXEL_COLORS['warning'], PIXEL_COLORS['bg_secondary'])
 
             # REC/STOP button (top-right). Note: R hotkey disabled on name screen to avoid interfering with typing
             rec_rect = self._draw_rec_button()
@@ -1724,8 +4141,7 @@ class Game:
                     if event.key == K_RETURN and input_text.strip() != "":
                         # key enter sound
                         try:
-                            if 'UI_KEY_ENTER_SOUND' in globals() and UI_KEY_ENTER_SOUND:
-                                UI_KEY_ENTER_SOUND.play()
+                            self.sounds.ui_key_enter.play()
                         except Exception:
                             pass
                         self.username = input_text.strip()
@@ -1736,8 +4152,7 @@ class Game:
                             pass
                         # navigation sound
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception:
                             pass
                         # Prepare to enter instructions screen
@@ -1746,8 +4161,7 @@ class Game:
                     elif event.key == K_BACKSPACE:
                         input_text = input_text[:-1]
                         try:
-                            if 'UI_KEY_BACKSPACE_SOUND' in globals() and UI_KEY_BACKSPACE_SOUND:
-                                UI_KEY_BACKSPACE_SOUND.play()
+                            self.sounds.ui_key_backspace.play()
                         except Exception:
                             pass
                     # NOTE: Character input is now handled exclusively by TEXTINPUT to avoid duplicates.
@@ -1758,8 +4172,7 @@ class Game:
                     try:
                         now_t = time.time()
                         if now_t - self.last_key_sound_time >= 0.04:
-                            if 'UI_KEY_TAP_SOUND' in globals() and UI_KEY_TAP_SOUND:
-                                UI_KEY_TAP_SOUND.play()
+                            self.sounds.ui_key_tap.play()
                             self.last_key_sound_time = now_t
                     except Exception:
                         pass
@@ -1775,42 +4188,53 @@ class Game:
             except Exception:
                 pass
             pygame.display.update()
+            AUDIO.presented()
+            _startup_mark("first frame", once=True)
             # capture after draw
             try:
                 self._maybe_capture_frame()
             except Exception:
                 pass
 
+    def _prewarm_combo_ladder(self, limit=1):
+        """Build up to `limit` missing combo ladder variants (all of them with limit=None)."""
+        if self.combo_ladder_ready:
+            return
+        try:
+            self.combo_ladder_ready = self.combo_ladder.prewarm(limit=limit)
+        except Exception as e:
+            print(f"[Audio] combo ladder prewarm failed: {e}")
+            self.combo_ladder_ready = True
+
+    def start_countdown(self):
+        """Start the 3-2-1-GO countdown. The '3' beep plays now; the '2'/'1' beeps and the start
+        sound are scheduled ahead of the frames that show them."""
+        self.countdown_active = True
+        self.countdown_start = time.time()
+        self.countdown_current = 3
+        self.combo_ladder_ready = False  # variants are built one per countdown frame
+        try:
+            beep = self.sounds.countdown or self.sounds.ui_nav
+            AUDIO.play('countdown-3', beep)
+            AUDIO.schedule('countdown-2', beep, 1.0, tag='countdown')
+            AUDIO.schedule('countdown-1', beep, 2.0, tag='countdown')
+            # new_idx goes negative (GO -> playing) once 4 seconds have elapsed
+            AUDIO.schedule('start', self.sounds.start or self.sounds.ui_nav, 4.0, tag='countdown')
+        except Exception:
+            pass
+
     def show_instructions(self):
         """Show game instructions"""
         while self.game_state == "instructions":
-            # Pixel-style background
-            SCREEN.fill(PIXEL_COLORS['bg_primary'])
-            
-            # Draw decorative grid
-            grid_size = 40
-            for x in range(0, SCREEN_WIDTH, grid_size):
-                pygame.draw.line(SCREEN, PIXEL_COLORS['bg_secondary'], 
-                               (x, 0), (x, SCREEN_HEIGHT), 1)
-            for y in range(0, SCREEN_HEIGHT, grid_size):
-                pygame.draw.line(SCREEN, PIXEL_COLORS['bg_secondary'], 
-                               (0, y), (SCREEN_WIDTH, y), 1)
-            
-            # Pixel-style title
-            title_text = "INSTRUCTIONS"
-            draw_pixel_text_with_shadow(SCREEN, title_text, large_font,
-                                      SCREEN_WIDTH//2 - large_font.size(title_text)[0]//2,
-                                      30, PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_secondary'])
+            self._tick_frame()
             lines = [
                 "Click on blocks where the color matches the text on them.",
                 "The faster, the better!"
             ]
-            
             # Centered, tighter instruction panel to reduce whitespace
             text_area = pygame.Rect(60, 150, SCREEN_WIDTH - 120, 240)
-            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], text_area)
-            # Use accent-colored border
-            draw_pixel_border(SCREEN, text_area, PIXEL_COLORS['accent'], 2)
+            # Background, grid, title and panel (cached layer)
+            LAYERS.blit(SCREEN, 'instructions', lambda surf: self._build_instructions_layer(surf, text_area))
 
             try:
                 # Animation params (fade-in + slide-down + scale) with accent glow
@@ -1821,50 +4245,23 @@ class Game:
                 dur = getattr(self, "instructions_anim_duration", 0.6)
                 p = 0.0 if dur <= 0 else max(0.0, min(1.0, elapsed / dur))
                 ease = 1.0 - (1.0 - p) ** 3  # ease-out cubic
-                slide_offset = int((1.0 - ease) * 14)
-                text_alpha = int(255 * ease)
-                scale = 0.92 + 0.08 * ease
 
                 import math
                 glow_alpha = max(0, min(120, int(60 + 50 * math.sin(2 * math.pi * 0.8 * now))))
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
                 glow_rect = text_area.inflate(18, 14)
-                pygame.draw.rect(overlay, (*PIXEL_COLORS['accent'], int(glow_alpha * 0.8)), glow_rect, 6)
-                pygame.draw.rect(overlay, (*PIXEL_COLORS['accent'], int(glow_alpha * 0.45)), glow_rect.inflate(8, 6), 8)
-                SCREEN.blit(overlay, (0, 0))
+                overlay = OVERLAYS.begin('instructions_glow', glow_rect.inflate(8, 6))
+                overlay.rect((*PIXEL_COLORS['accent'], int(glow_alpha * 0.8)), glow_rect, 6)
+                overlay.rect((*PIXEL_COLORS['accent'], int(glow_alpha * 0.45)), glow_rect.inflate(8, 6), 8)
+                OVERLAYS.end(SCREEN, overlay)
 
-                headline_font = _load_pixel_font(px(48))
-                text_margin = 30
-                text_width = text_area.width - text_margin * 2
-                wrapped_lines = []
-                for ln in lines:
-                    wrapped_lines.extend(wrap_text(ln, headline_font, text_width))
-
-                line_spacing = 10
-                rendered_lines = []
-                for sub in wrapped_lines:
-                    base_surf = headline_font.render(sub, False, PIXEL_COLORS['text_primary'])
-                    base_shadow = headline_font.render(sub, False, PIXEL_COLORS['accent'])
-                    w, h = base_surf.get_width(), base_surf.get_height()
-                    sw = max(1, int(w * scale))
-                    sh = max(1, int(h * scale))
-                    if sw <= 0 or sh <= 0:
-                        continue
-                    # Use nearest-neighbor scaling to preserve crisp pixel edges
-                    surf = pygame.transform.scale(base_surf, (sw, sh))
-                    shadow = pygame.transform.scale(base_shadow, (sw, sh))
-                    surf.set_alpha(text_alpha)
-                    shadow.set_alpha(text_alpha)
-                    rendered_lines.append((sub, surf, shadow, sw, sh))
-
-                total_height = sum(h for (_, _, _, _, h) in rendered_lines) + (len(rendered_lines) - 1) * line_spacing
-                y = text_area.y + (text_area.height - total_height) // 2 + slide_offset
-
-                for (_, surf, shadow, sw, sh) in rendered_lines:
-                    x = text_area.x + (text_area.width - sw) // 2
-                    SCREEN.blit(shadow, (x + 2, y + 2))
-                    SCREEN.blit(surf, (x, y))
-                    y += sh + line_spacing
+                # Text panel: fade, scale and slide baked into cached frames by eased progress
+                headline_font = FONTS.named('headline')
+                slide_offset = int((1.0 - ease) * 14)
+                ENTRANCES.blit(SCREEN, 'instructions',
+                               lambda surf, e: self._build_instructions_panel(surf, lines, text_area, headline_font, e),
+                               (text_area.width + 2, text_area.height + 2),
+                               (text_area.x, text_area.y + slide_offset), ease,
+                               key=(tuple(lines), id(headline_font)))
             except Exception as e:
                 # Fallback to static rendering on error to avoid crash
                 try:
@@ -1873,7 +4270,7 @@ class Game:
                     traceback.print_exc()
                 except Exception:
                     pass
-                fallback_font = _load_pixel_font(px(44))
+                fallback_font = FONTS.named('fallback')
                 text_margin = 30
                 text_width = text_area.width - text_margin * 2
                 wrapped = []
@@ -1883,7 +4280,7 @@ class Game:
                 total_height = len(wrapped) * fallback_font.get_linesize() + (len(wrapped) - 1) * line_spacing
                 y = text_area.y + (text_area.height - total_height) // 2
                 for sub in wrapped:
-                    surf = fallback_font.render(sub, False, PIXEL_COLORS['text_primary'])
+                    surf, _ = TEXT_CACHE.get(sub, fallback_font, PIXEL_COLORS['text_primary'])
                     x = text_area.x + (text_area.width - surf.get_width()) // 2
                     SCREEN.blit(surf, (x, y))
                     y += fallback_font.get_linesize() + line_spacing
@@ -1895,15 +4292,15 @@ class Game:
                     cd_text = str(self.countdown_current)
                 else:
                     cd_text = "GO!"
-                cd_font = _load_pixel_font(px(84))
-                draw_pixel_text_with_shadow(SCREEN, cd_text, cd_font,
-                                            SCREEN_WIDTH//2 - cd_font.size(cd_text)[0]//2,
-                                            SCREEN_HEIGHT - 140, PIXEL_COLORS['accent'], PIXEL_COLORS['bg_secondary'])
+                cd_font = FONTS.named('countdown')
+                GLYPHS.draw_centered(SCREEN, cd_text, cd_font,
+                                     SCREEN_WIDTH//2,
+                                     SCREEN_HEIGHT - 140, PIXEL_COLORS['accent'], PIXEL_COLORS['bg_secondary'])
             else:
                 start_text = "PRESS ANY KEY TO START"
-                draw_pixel_text_with_shadow(SCREEN, start_text, font,
-                                          SCREEN_WIDTH//2 - font.size(start_text)[0]//2,
-                                          SCREEN_HEIGHT - 80, PIXEL_COLORS['success'], PIXEL_COLORS['bg_secondary'])
+                draw_pixel_text_centered(SCREEN, start_text, font,
+                                       SCREEN_WIDTH//2,
+                                       SCREEN_HEIGHT - 80, PIXEL_COLORS['success'], PIXEL_COLORS['bg_secondary'])
             
             # REC/STOP button (top-right)
             rec_rect = self._draw_rec_button()
@@ -1925,17 +4322,7 @@ class Game:
                         continue
                     # start countdown on first key press (except F12/R)
                     if not self.countdown_active:
-                        self.countdown_active = True
-                        self.countdown_start = time.time()
-                        self.countdown_current = 3
-                        # play initial '3' beep immediately so it's audible
-                        try:
-                            if 'COUNTDOWN_BEEP_SOUND' in globals() and COUNTDOWN_BEEP_SOUND:
-                                COUNTDOWN_BEEP_SOUND.play()
-                            elif 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                UI_NAV_SOUND.play()
-                        except Exception:
-                            pass
+                        self.start_countdown()
                     else:
                         # if already active, ignore further keys
                         pass
@@ -1948,17 +4335,7 @@ class Game:
                         continue
                     # start countdown on mouse click (except when clicking the REC button)
                     if not self.countdown_active:
-                        self.countdown_active = True
-                        self.countdown_start = time.time()
-                        self.countdown_current = 3
-                        # play initial '3' beep immediately so it's audible
-                        try:
-                            if 'COUNTDOWN_BEEP_SOUND' in globals() and COUNTDOWN_BEEP_SOUND:
-                                COUNTDOWN_BEEP_SOUND.play()
-                            elif 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                UI_NAV_SOUND.play()
-                        except Exception:
-                            pass
+                        self.start_countdown()
                     else:
                         # if already active, ignore further keys
                         pass
@@ -1971,46 +4348,53 @@ class Game:
                 new_idx = 3 - int(elapsed)
                 if new_idx < 0:
                     # GO moment
-                    # play start sound (or nav fallback)
+                    # start sound (or nav fallback) was scheduled ahead; fire it now if it's still pending
                     try:
-                        if 'START_SOUND' in globals() and START_SOUND:
-                            START_SOUND.play()
-                        elif 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                            UI_NAV_SOUND.play()
+                        AUDIO.claim('countdown') or AUDIO.play('start', self.sounds.start or self.sounds.ui_nav)
                     except Exception:
                         pass
+                    # any combo variants the countdown frames didn't get to (normally none)
+                    self._prewarm_combo_ladder(limit=None)
                     # begin playing after short moment so player sees GO
                     self.next_state_time = now + 0.6
                     self.block_visible = False
                     self.current_block = None
                     self.countdown_active = False
                     self.instructions_enter_time = 0.0
+                    DIRTY.invalidate()  # first gameplay frame repaints the whole window
                     self.game_state = "playing"
                 else:
                     # update display number for animation (we use countdown_current for rendering)
+                    # (the 2 and 1 beeps were scheduled by start_countdown)
                     if new_idx != self.countdown_current:
                         self.countdown_current = new_idx
-                        # play countdown beep on 3,2,1
-                        if self.countdown_current > 0:
-                            try:
-                                if 'COUNTDOWN_BEEP_SOUND' in globals() and COUNTDOWN_BEEP_SOUND:
-                                    COUNTDOWN_BEEP_SOUND.play()
-                                elif 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                    UI_NAV_SOUND.play()
-                            except Exception:
-                                pass
             
             # autogif driver
             try:
                 self._tick_autogif('instructions')
             except Exception:
                 pass
+            AUDIO.pump()
             pygame.display.update()
+            AUDIO.presented()
             # capture after draw
             try:
                 self._maybe_capture_frame()
             except Exception:
                 pass
+            if self.countdown_active:
+                # after the frame is on screen: one streak combo variant, so no hit synthesizes one
+                self._prewarm_combo_ladder(limit=1)
+
+    def _log_round_stats(self):
+        """Print the cache and pacing counters (RT_STATS_LOG=1) when a round ends."""
+        if not STATS_LOG:
+            return
+        print(f"[Audio] combo ladder: {self.combo_ladder.stats()}")
+        print(f"[Font] registry: {FONTS.stats()} | text cache: {TEXT_CACHE.stats()} | glyphs: {GLYPHS.stats()}"
+              f" | layout: {TEXT_LAYOUT.stats()}")
+        print(f"[Render] layers: {LAYERS.stats()} | overlays: {OVERLAYS.stats()} | entrances: {ENTRANCES.stats()}"
+              f" | blocks: {BLOCK_SPRITES.stats()} | dirty rects: {DIRTY.stats()} | pacing: {PACER.stats()}")
 
     def next_block(self):
         """Generate the next block"""
@@ -2033,12 +4417,10 @@ class Game:
             
             # Game over sound on moving to results (fallback to nav)
             try:
-                if 'GAMEOVER_SOUND' in globals() and GAMEOVER_SOUND:
-                    GAMEOVER_SOUND.play()
-                elif 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                    UI_NAV_SOUND.play()
+                AUDIO.claim('gameover') or AUDIO.play('gameover', self.sounds.gameover or self.sounds.ui_nav)
             except Exception:
                 pass
+            self._log_round_stats()
             self.game_state = "results"  # all blocks shown, go to results screen
             return
     # Use predefined sequence to create the block
@@ -2048,9 +4430,15 @@ class Game:
         self.block_visible = True
         # set next transition to after BLOCK_DURATION (then interval will start)
         self.next_state_time = self.block_start_time + BLOCK_DURATION
+        # A valid block left unanswered ends in MISS!: have its sound land on that frame.
+        # Answering the block cancels it (see the click/key handlers).
+        AUDIO.cancel('miss')
+        if self.current_block.color == self.current_block.text_color:
+            AUDIO.schedule('miss', self.sounds.miss, BLOCK_DURATION)
 
     def handle_playing(self):
         """Handle game logic while playing"""
+        self._tick_frame()  # called once per gameplay frame by run()
         current_time = time.time()
         # dt for animations/particles
         try:
@@ -2077,12 +4465,11 @@ class Game:
                     self.reaction_time_text = "MISS!"
                     self.reaction_time_display_time = current_time
                     self.last_reaction_time_id += 1  # 防止重复显示
-                    # Play miss sound
-                    if MISS_SOUND:
-                        try:
-                            MISS_SOUND.play()
-                        except Exception as e:
-                            print(f"Error playing miss sound: {e}")
+                    # Miss sound was scheduled ahead when the block appeared; fire it now if still pending
+                    try:
+                        AUDIO.claim('miss') or AUDIO.play('miss', self.sounds.miss)
+                    except Exception as e:
+                        print(f"Error playing miss sound: {e}")
                     # Start disappear animation for the missed block so MISS! can be positioned correctly
                     self.current_block.start_disappear_animation()
                     self.animating_blocks.append(self.current_block)
@@ -2092,6 +4479,7 @@ class Game:
             if self.block_count == TOTAL_BLOCKS:
                 # if that was the last block, wait 1 second then show results
                 self.next_state_time = current_time + 1.0
+                AUDIO.schedule('gameover', self.sounds.gameover or self.sounds.ui_nav, 1.0)
             else:
                 # otherwise, wait for the normal interval
                 self.next_state_time = current_time + BLOCK_INTERVAL
@@ -2115,51 +4503,39 @@ class Game:
                     rankings.sort(key=lambda x: (-x["score"], x["avg_rt"] if x["avg_rt"] is not None else float('inf')))
                 
                 try:
-                    if 'GAMEOVER_SOUND' in globals() and GAMEOVER_SOUND:
-                        GAMEOVER_SOUND.play()
-                    elif 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                        UI_NAV_SOUND.play()
+                    AUDIO.claim('gameover') or AUDIO.play('gameover', self.sounds.gameover or self.sounds.ui_nav)
                 except Exception:
                     pass
+                self._log_round_stats()
                 self.game_state = "results"
             return
         
     # draw UI
-    # Pixel-style background
-        SCREEN.fill(PIXEL_COLORS['bg_primary'])
-        
-    # Draw background grid
-        draw_pixel_grid(SCREEN, 20, PIXEL_COLORS['bg_secondary'])
-        
-    # Pixel-style score display
-        score_bg = pygame.Rect(UI_MARGIN_X - 5, 5, 180, 40)
-        pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], score_bg)
-        draw_pixel_border(SCREEN, score_bg, PIXEL_COLORS['frame'], 2)
-        draw_pixel_text_with_shadow(SCREEN, f"SCORE: {self.score}", font, UI_MARGIN_X + 5, 18, 
-                                  PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
-        
-    # Pixel-style progress display
+    # Every element is laid out first so the dirty-rect pass knows what changes this frame
         progress_text = f"PROGRESS: {self.block_count}/{TOTAL_BLOCKS}"
-        progress_width = font.size(progress_text)[0] + 20
-        progress_bg = pygame.Rect(SCREEN_WIDTH - UI_MARGIN_X - progress_width + 5, 5, progress_width, 40)
-        pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], progress_bg)
-        draw_pixel_border(SCREEN, progress_bg, PIXEL_COLORS['frame'], 2)
-        draw_pixel_text_with_shadow(SCREEN, progress_text, font, 
-                                  SCREEN_WIDTH - UI_MARGIN_X - progress_width + 15, 18,
-                                  PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
+        progress_surf, (progress_w, _) = TEXT_CACHE.get(progress_text, font, PIXEL_COLORS['text_primary'],
+                                                        PIXEL_COLORS['bg_secondary'])
+        progress_width = progress_w + 20
+        progress_pos = (SCREEN_WIDTH - UI_MARGIN_X - progress_width + 15, 18)
+        score_text = f"SCORE: {self.score}"
+        score_w, score_h = GLYPHS.size(score_text, font, PIXEL_COLORS['text_primary'])
+        elements = [
+            ('score', (UI_MARGIN_X + 5, 18, score_w + 2, score_h + 2), score_text),
+            ('progress', progress_surf.get_rect(topleft=progress_pos), progress_text),
+        ]
 
     # During combos, briefly show "COMBO! +2" in the center; no combo shown on a single hit
+        combo_text = "COMBO! +2"
+        combo_rect = None
         if self.combo_last_streak >= 2 and current_time < self.combo_visible_until:
-            combo_text = "COMBO! +2"
-            cx = SCREEN_WIDTH // 2 - large_font.size(combo_text)[0] // 2
+            combo_surf, (combo_w, _) = TEXT_CACHE.get(combo_text, large_font, PIXEL_COLORS['accent'],
+                                                      PIXEL_COLORS['bg_secondary'])
             cy = SCREEN_HEIGHT // 2 - large_font.get_linesize() // 2
-            draw_pixel_text_with_shadow(
-                SCREEN, combo_text, large_font,
-                cx, cy,
-                PIXEL_COLORS['accent'], PIXEL_COLORS['bg_secondary']
-            )
+            combo_rect = combo_surf.get_rect(topleft=(SCREEN_WIDTH // 2 - combo_w // 2, cy))
+        elements.append(('combo', combo_rect, combo_text))
 
-    # Pixel-style feedback text (draw above play area)
+    # Pixel-style feedback text (above play area)
+        feedback_rect = None
         if self.feedback_text and (current_time - self.feedback_time) < self.feedback_duration:
             # 根据反馈类型选择颜色
             if "+" in self.feedback_text:
@@ -2168,19 +4544,17 @@ class Game:
                 feedback_color = PIXEL_COLORS['error']
             else:
                 feedback_color = PIXEL_COLORS['text_primary']
-            
-            # 绘制反馈背景（位置在游戏框上方）
-            feedback_width = font.size(self.feedback_text)[0] + 20
+            feedback_surf, (feedback_w, _) = TEXT_CACHE.get(self.feedback_text, font, feedback_color,
+                                                            PIXEL_COLORS['bg_secondary'])
+            feedback_width = feedback_w + 20
             feedback_y = PLAY_AREA.top - 50  # 50px above the play area
             feedback_bg = pygame.Rect(SCREEN_WIDTH//2 - feedback_width//2, feedback_y, feedback_width, 35)
-            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], feedback_bg)
-            draw_pixel_border(SCREEN, feedback_bg, feedback_color, 2)
-            
-            draw_pixel_text_with_shadow(SCREEN, self.feedback_text, font, 
-                                      SCREEN_WIDTH//2 - font.size(self.feedback_text)[0]//2, feedback_y + 8,
-                                      feedback_color, PIXEL_COLORS['bg_secondary'])
+            feedback_pos = (SCREEN_WIDTH//2 - feedback_w//2, feedback_y + 8)
+            feedback_rect = feedback_bg.union(feedback_surf.get_rect(topleft=feedback_pos))
+        elements.append(('feedback', feedback_rect, (self.feedback_text, self.feedback_time)))
 
         # Show reaction time (near the block position)
+        reaction_rect = None
         if self.reaction_time_text and (current_time - self.reaction_time_display_time) < self.reaction_time_duration:
             # Find the most recent clicked block position; if a block is disappearing, show there
             display_x, display_y = SCREEN_WIDTH//2, SCREEN_HEIGHT//2  # default position
@@ -2198,47 +4572,68 @@ class Game:
                 # If there is no animating block, don't show reaction time (avoid center display)
                 self.reaction_time_text = None
                 return
-            
+            reaction_w, reaction_h = GLYPHS.size(self.reaction_time_text, small_font, PIXEL_COLORS['text_accent'])
+            reaction_rect = pygame.Rect(display_x - reaction_w // 2, display_y, reaction_w + 2, reaction_h + 2)
+        elements.append(('reaction', reaction_rect, self.reaction_time_text))
+
+        # current block (only when visible) and animating (disappearing) blocks
+        show_block = self.block_visible and self.current_block
+        elements.append(('block', self.current_block.rect() if show_block else None, id(self.current_block)))
+        for block in self.animating_blocks:
+            elements.append((('animating', id(block)), block.rect() if block.alpha > 0 else None, None))
+
+        # update perfect particles (gravity-like drift)
+        self.perfect_particles.update(dt, gravity=40.0)
+        particle_rect = self.perfect_particles.bounds()
+        elements.append(('particles', particle_rect, None))
+
+        rec_rect = self._rec_button_rect()
+        elements.append(('rec', rec_rect, self._cap_active))
+
+    # Background, grid, score/progress boxes and the black game frame (cached layer);
+    # only the regions that change are restored from it
+        layer = LAYERS.get('playing', lambda surf: self._build_playing_layer(surf, progress_width),
+                           key=progress_width)
+        redraw = DIRTY.begin(SCREEN, layer, elements)
+
+    # Pixel-style score and progress text
+        if 'score' in redraw:
+            GLYPHS.draw(SCREEN, score_text, font, UI_MARGIN_X + 5, 18,
+                        PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
+        if 'progress' in redraw:
+            SCREEN.blit(progress_surf, progress_pos)
+
+        if combo_rect and 'combo' in redraw:
+            SCREEN.blit(combo_surf, combo_rect)
+
+        if feedback_rect and 'feedback' in redraw:
+            # 绘制反馈背景（位置在游戏框上方）
+            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], feedback_bg)
+            draw_pixel_border(SCREEN, feedback_bg, feedback_color, 2)
+            SCREEN.blit(feedback_surf, feedback_pos)
+
+        if reaction_rect and 'reaction' in redraw:
             # Draw reaction time text (no border)
-            rt_width = small_font.size(self.reaction_time_text)[0]
-            draw_pixel_text_with_shadow(SCREEN, self.reaction_time_text, small_font,
-                                      display_x - rt_width//2, display_y,
-                                      PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_primary'])
+            GLYPHS.draw_centered(SCREEN, self.reaction_time_text, small_font,
+                                 display_x, display_y,
+                                 PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_primary'])
 
-        # draw black game frame (play area)
-        pygame.draw.rect(SCREEN, (0, 0, 0), PLAY_AREA, width=4)
-        
-        # draw current block (only when visible)
-        if self.block_visible and self.current_block:
+        if show_block and 'block' in redraw:
             self.current_block.draw(SCREEN)
-        
-        # draw animating (disappearing) blocks
         for block in self.animating_blocks:
-            block.draw(SCREEN)
-
-        # update and draw perfect particles
-        if self.perfect_particles:
-            alive = []
-            for p in self.perfect_particles:
-                p['age'] += dt
-                if p['age'] <= p['life']:
-                    p['x'] += p['vx'] * dt
-                    p['y'] += p['vy'] * dt
-                    # gravity-like drift
-                    p['vy'] += 40.0 * dt
-                    alive.append(p)
-                    # fade by age
-                    alpha = max(0, min(255, int(255 * (1.0 - p['age']/p['life']))))
-                    col = (*p['color'], alpha)
-                    s = 2 if p.get('size', 2) <= 2 else 3
-                    surf = pygame.Surface((s, s), pygame.SRCALPHA)
-                    surf.fill(col)
-                    SCREEN.blit(surf, (int(p['x']), int(p['y'])))
-            self.perfect_particles = alive
+            if ('animating', id(block)) in redraw:
+                block.draw(SCREEN)
+
+        # draw perfect particles
+        if particle_rect and 'particles' in redraw:
+            # fade by age
+            self.perfect_particles.draw(SCREEN)
+
+        # Draw REC/STOP button
+        if 'rec' in redraw:
+            self._draw_rec_button()
         
         # event handling
-        # Draw REC/STOP button
-        rec_rect = self._draw_rec_button()
         for event in pygame.event.get():
             if event.type == QUIT:
                 pygame.quit()
@@ -2249,6 +4644,11 @@ class Game:
                 except Exception:
                     pass
                 continue
+            if event.type == KEYDOWN and event.key == pygame.K_F3:
+                # toggle the dirty-rect debug outlines
+                DIRTY.debug = not DIRTY.debug
+                DIRTY.invalidate()
+                continue
             if event.type == KEYDOWN and event.key == pygame.K_F9:
                 self._start_autogif()
                 continue
@@ -2261,6 +4661,7 @@ class Game:
                     continue
             if event.type == KEYDOWN and self.block_visible and not self.current_block.is_clicked:
                 self.current_block.is_clicked = True
+                AUDIO.cancel('miss')
                 reaction_time = current_time - self.block_start_time
                 self.reaction_times.append(reaction_time)  # record reaction time
                 
@@ -2305,20 +4706,16 @@ class Game:
 
                     # Play grade-appropriate sound
                     try:
-                        if grade == 'Perfect' and 'SUCCESS_SOUND' in globals() and SUCCESS_SOUND:
-                            ch = SUCCESS_SOUND.play()
-                            # 同时轻声播放 combo 音色以增强手感
-                            if 'COMBO_SOUND' in globals() and COMBO_SOUND:
-                                ch2 = COMBO_SOUND.play()
-                                try:
-                                    if ch2:
-                                        ch2.set_volume(0.6 * float(self.settings.get('sfx_volume', 1.0)))
-                                except Exception:
-                                    pass
-                        elif grade == 'Good' and 'COMBO_SOUND' in globals() and COMBO_SOUND:
-                            COMBO_SOUND.play()
-                        elif 'UI_KEY_TAP_SOUND' in globals() and UI_KEY_TAP_SOUND:
-                            UI_KEY_TAP_SOUND.play()
+                        sounds = self.sounds
+                        # from streak 2 the combo tones climb the (prewarmed) pitch ladder
+                        ladder = self.combo_ladder.voices(self.streak) if self.streak >= 2 else None
+                        if grade == 'Perfect' and sounds.perfect:
+                            # success chime + soft combo tones, pre-mixed into one voice
+                            AUDIO.play('perfect', ladder[1] if ladder else sounds.perfect)
+                        elif grade == 'Good' and sounds.combo:
+                            AUDIO.play('good', ladder[0] if ladder else sounds.combo)
+                        else:
+                            AUDIO.play('slow', sounds.ui_key_tap)
                     except Exception:
                         pass
                     # Perfect particle effect
@@ -2343,8 +4740,7 @@ class Game:
                     self.feedback_color = (180, 0, 0)
                     self.feedback_time = current_time
                     # Play error sound
-                    if ERROR_SOUND:
-                        ERROR_SOUND.play()
+                    AUDIO.play('error', self.sounds.error)
 
                 # Start disappear animation and move to animating blocks
                 self.current_block.start_disappear_animation()
@@ -2355,6 +4751,7 @@ class Game:
                 self.block_visible = False
                 if self.block_count == TOTAL_BLOCKS:
                     self.next_state_time = current_time + 1.0
+                    AUDIO.schedule('gameover', self.sounds.gameover or self.sounds.ui_nav, 1.0)
                 else:
                     self.next_state_time = current_time + BLOCK_INTERVAL
                 # save progress to persistence occasionally (after each click)
@@ -2368,6 +4765,7 @@ class Game:
                 if bx <= mx <= bx + BLOCK_WIDTH and by <= my <= by + BLOCK_HEIGHT:
                     # treat as a click on the block
                     self.current_block.is_clicked = True
+                    AUDIO.cancel('miss')
                     reaction_time = current_time - self.block_start_time
                     self.reaction_times.append(reaction_time)
                     
@@ -2408,19 +4806,16 @@ class Game:
 
                         # Play grade-appropriate sound (mirror keyboard behavior)
                         try:
-                            if grade == 'Perfect' and 'SUCCESS_SOUND' in globals() and SUCCESS_SOUND:
-                                ch = SUCCESS_SOUND.play()
-                                if 'COMBO_SOUND' in globals() and COMBO_SOUND:
-                                    ch2 = COMBO_SOUND.play()
-                                    try:
-                                        if ch2:
-                                            ch2.set_volume(0.6 * float(self.settings.get('sfx_volume', 1.0)))
-                                    except Exception:
-                                        pass
-                            elif grade == 'Good' and 'COMBO_SOUND' in globals() and COMBO_SOUND:
-                                COMBO_SOUND.play()
-                            elif 'UI_KEY_TAP_SOUND' in globals() and UI_KEY_TAP_SOUND:
-                                UI_KEY_TAP_SOUND.play()
+                            sounds = self.sounds
+                            # from streak 2 the combo tones climb the (prewarmed) pitch ladder
+                            ladder = self.combo_ladder.voices(self.streak) if self.streak >= 2 else None
+                            if grade == 'Perfect' and sounds.perfect:
+                                # success chime + soft combo tones, pre-mixed into one voice
+                                AUDIO.play('perfect', ladder[1] if ladder else sounds.perfect)
+                            elif grade == 'Good' and sounds.combo:
+                                AUDIO.play('good', ladder[0] if ladder else sounds.combo)
+                            else:
+                                AUDIO.play('slow', sounds.ui_key_tap)
                         except Exception:
                             pass
                         # Perfect particle effect (mouse path)
@@ -2444,8 +4839,7 @@ class Game:
                         self.feedback_color = (180, 0, 0)
                         self.feedback_time = current_time
                         # Play error sound
-                        if ERROR_SOUND:
-                            ERROR_SOUND.play()
+                        AUDIO.play('error', self.sounds.error)
 
                     # Start disappear animation and move to animating blocks
                     self.current_block.start_disappear_animation()
@@ -2456,6 +4850,7 @@ class Game:
                     self.block_visible = False
                     if self.block_count == TOTAL_BLOCKS:
                         self.next_state_time = current_time + 1.0
+                        AUDIO.schedule('gameover', self.sounds.gameover or self.sounds.ui_nav, 1.0)
                     else:
                         self.next_state_time = current_time + BLOCK_INTERVAL
         
@@ -2464,7 +4859,9 @@ class Game:
             self._tick_autogif('playing')
         except Exception:
             pass
-        pygame.display.update()
+        AUDIO.pump()
+        DIRTY.present(SCREEN)
+        AUDIO.presented()
         # capture after draw
         try:
             self._maybe_capture_frame()
@@ -2473,92 +4870,30 @@ class Game:
 
     def show_results(self):
         """Show game results and statistics"""
+        redraw, rec_state = True, None
+        rec_rect = self._rec_button_rect()
         while self.game_state == "results":
-            # Pixel-style background
-            SCREEN.fill(PIXEL_COLORS['bg_primary'])
-            draw_pixel_grid(SCREEN, 25, PIXEL_COLORS['bg_secondary'])
-            
-            # Pixel-style title
-            draw_pixel_text_with_shadow(SCREEN, "GAME OVER", large_font,
-                                      SCREEN_WIDTH//2 - large_font.size("GAME OVER")[0]//2,
-                                      60, PIXEL_COLORS['error'], PIXEL_COLORS['bg_primary'])
-            
-            # Results panel
-            panel_rect = pygame.Rect(50, 130, SCREEN_WIDTH - 100, 300)
-            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], panel_rect)
-            draw_pixel_border(SCREEN, panel_rect, PIXEL_COLORS['frame'], 3)
-            
-            # Player info
-            draw_pixel_text_with_shadow(SCREEN, f"PLAYER: {self.username}", font,
-                                      SCREEN_WIDTH//2 - font.size(f"PLAYER: {self.username}")[0]//2,
-                                      160, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
-            
-            # Score display
-            score_color = PIXEL_COLORS['success'] if self.score >= 0 else PIXEL_COLORS['error']
-            draw_pixel_text_with_shadow(SCREEN, f"TOTAL SCORE: {self.score}", font,
-                                      SCREEN_WIDTH//2 - font.size(f"TOTAL SCORE: {self.score}")[0]//2,
-                                      200, score_color, PIXEL_COLORS['bg_secondary'])
-
-            # Max combo display
-            max_combo_text = f"MAX COMBO: x{self.max_combo}"
-            draw_pixel_text_with_shadow(SCREEN, max_combo_text, font,
-                                      SCREEN_WIDTH//2 - font.size(max_combo_text)[0]//2,
-                                      230, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
-            
-            # reaction time statistics (only if there are valid clicks)
-            rt_texts = []
-            if self.reaction_times:
-                avg_rt = sum(self.reaction_times) / len(self.reaction_times)
-                min_rt = min(self.reaction_times)
-                max_rt = max(self.reaction_times)
-                rt_texts = [
-                    f"Average reaction time: {avg_rt:.3f}s",
-                    f"Fastest reaction time: {min_rt:.3f}s",
-                    f"Slowest reaction time: {max_rt:.3f}s"
-                ]
-            else:
-                rt_texts = ["NO VALID CLICKS RECORDED"]
-            
-            # Reaction time stats display
-            y_offset = 250
-            for i, rt_line in enumerate(rt_texts):
-                draw_pixel_text_with_shadow(SCREEN, rt_line, small_font,
-                                          SCREEN_WIDTH//2 - small_font.size(rt_line)[0]//2,
-                                          y_offset + i*30, PIXEL_COLORS['text_secondary'], PIXEL_COLORS['bg_secondary'])
-            
-            # Brain age result
-            brain_age, brain_age_text = self.calculate_brain_age()
-            
-            # Brain age panel
-            brain_panel_rect = pygame.Rect(50, 380, SCREEN_WIDTH - 100, 120)
-            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], brain_panel_rect)
-            draw_pixel_border(SCREEN, brain_panel_rect, PIXEL_COLORS['warning'], 3)
-            
-            # Brain age title
-            brain_title = f"BRAIN AGE: {brain_age} YEARS OLD"
-            draw_pixel_text_with_shadow(SCREEN, brain_title, font,
-                                      SCREEN_WIDTH//2 - font.size(brain_title)[0]//2,
-                                      395, PIXEL_COLORS['warning'], PIXEL_COLORS['bg_secondary'])
-            
-            # Brain age description (auto wrap)
-            brain_text_lines = wrap_text(brain_age_text, small_font, SCREEN_WIDTH - 120)
-            brain_y = 425
-            for line in brain_text_lines[:3]:  # show at most 3 lines
-                draw_pixel_text_with_shadow(SCREEN, line, small_font,
-                                          SCREEN_WIDTH//2 - small_font.size(line)[0]//2,
-                                          brain_y, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_secondary'])
-                brain_y += 20
+            # Static screen: draw and present only when something changed
+            if redraw or rec_state != self._cap_active:
+                # Everything but the REC button is fixed for the round (cached layer)
+                LAYERS.blit(SCREEN, 'results', self._build_results_layer,
+                            key=(self.username, self.score, self.max_combo, tuple(self.reaction_times)))
             
-            # Continue hint (moved lower)
-            hint_text = "PRESS ANY KEY TO VIEW RANKINGS"
-            draw_pixel_text_with_shadow(SCREEN, hint_text, font,
-                                      SCREEN_WIDTH//2 - font.size(hint_text)[0]//2,
-                                      520, PIXEL_COLORS['success'], PIXEL_COLORS['bg_primary'])
-            
-            # REC/STOP button (top-right)
-            rec_rect = self._draw_rec_button()
+                # REC/STOP button (top-right)
+                rec_rect = self._draw_rec_button()
+                rec_state = self._cap_active
+                pygame.display.update()
+                AUDIO.presented()
+                redraw = False
+            # capture after draw
+            try:
+                self._maybe_capture_frame()
+            except Exception:
+                pass
 
-            for event in pygame.event.get():
+            events = self._idle_events()
+            redraw = any(event.type != MOUSEMOTION for event in events)
+            for event in events:
                 if event.type == QUIT:
                     pygame.quit()
                     sys.exit()
@@ -2574,8 +4909,7 @@ class Game:
                         continue
                     # Any other key goes to rankings (as the hint says)
                     try:
-                        if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                            UI_NAV_SOUND.play()
+                        self.sounds.ui_nav.play()
                     except Exception:
                         pass
                     self.game_state = "rankings"
@@ -2587,8 +4921,7 @@ class Game:
                             pass
                         continue
                     try:
-                        if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                            UI_NAV_SOUND.play()
+                        self.sounds.ui_nav.play()
                     except Exception:
                         pass
                     self.game_state = "rankings"
@@ -2598,58 +4931,34 @@ class Game:
                 self._tick_autogif('results')
             except Exception:
                 pass
-            pygame.display.update()
+
+    def show_rankings(self):
+        """Show rankings"""
+        redraw, rec_state = True, None
+        rec_rect = self._rec_button_rect()
+        while self.game_state == "rankings":
+            # Static screen: draw and present only when something changed
+            if redraw or rec_state != self._cap_active:
+                # Background, table and hints only change with the board (cached layer)
+                top = tuple((user['name'], user['score']) for user in rankings[:10])
+                LAYERS.blit(SCREEN, 'rankings', lambda surf: self._build_rankings_layer(surf, top),
+                            key=(self.username, top))
+            
+                # REC/STOP button (top-right)
+                rec_rect = self._draw_rec_button()
+                rec_state = self._cap_active
+                pygame.display.update()
+                AUDIO.presented()
+                redraw = False
             # capture after draw
             try:
                 self._maybe_capture_frame()
             except Exception:
                 pass
 
-    def show_rankings(self):
-        """Show rankings"""
-        while self.game_state == "rankings":
-            # Pixel-style background
-            SCREEN.fill(PIXEL_COLORS['bg_primary'])
-            draw_pixel_grid(SCREEN, 30, PIXEL_COLORS['bg_secondary'])
-            
-            # Pixel-style title
-            draw_pixel_text_with_shadow(SCREEN, "RANKINGS", large_font,
-                                      SCREEN_WIDTH//2 - large_font.size("RANKINGS")[0]//2,
-                                      30, PIXEL_COLORS['text_primary'], PIXEL_COLORS['bg_primary'])
-            
-            # Rankings panel
-            panel_rect = pygame.Rect(30, 80, SCREEN_WIDTH - 60, 380)
-            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], panel_rect)
-            draw_pixel_border(SCREEN, panel_rect, PIXEL_COLORS['frame'], 3)
-            
-            # Show top 10
-            for i in range(min(10, len(rankings))):
-                rank = i + 1
-                user = rankings[i]
-                # Highlight current player
-                color = PIXEL_COLORS['error'] if user["name"] == self.username else PIXEL_COLORS['text_primary']
-                rank_text = f"{rank}. {user['name']} - SCORE: {user['score']}"
-                
-                # Rank background
-                if user["name"] == self.username:
-                    rank_bg = pygame.Rect(50, 100 + i*35, SCREEN_WIDTH - 100, 30)
-                    pygame.draw.rect(SCREEN, PIXEL_COLORS['accent'], rank_bg)
-                    draw_pixel_border(SCREEN, rank_bg, PIXEL_COLORS['error'], 2)
-                
-                draw_pixel_text_with_shadow(SCREEN, rank_text, font,
-                                          SCREEN_WIDTH//2 - font.size(rank_text)[0]//2,
-                                          105 + i*35, color, PIXEL_COLORS['bg_secondary'])
-            
-            # Hints (with settings entry)
-            hint_text = "ESC: QUIT | ANY KEY: RESTART | S: SETTINGS"
-            draw_pixel_text_with_shadow(SCREEN, hint_text, small_font,
-                                      SCREEN_WIDTH//2 - small_font.size(hint_text)[0]//2,
-                                      480, PIXEL_COLORS['text_secondary'], PIXEL_COLORS['bg_primary'])
-            
-            # REC/STOP button (top-right)
-            rec_rect = self._draw_rec_button()
-            
-            for event in pygame.event.get():
+            events = self._idle_events()
+            redraw = any(event.type != MOUSEMOTION for event in events)
+            for event in events:
                 if event.type == QUIT:
                     pygame.quit()
                     sys.exit()
@@ -2672,8 +4981,7 @@ class Game:
                         continue
                     if event.key == K_ESCAPE:
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception:
                             pass
                         pygame.quit()
@@ -2681,15 +4989,13 @@ class Game:
                     elif event.key == pygame.K_s:
                         # Enter settings page
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception:
                             pass
                         self.game_state = "settings"
                     else:
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND:
-                                UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception:
                             pass
                         # restart the game
@@ -2701,65 +5007,50 @@ class Game:
                 self._tick_autogif('rankings')
             except Exception:
                 pass
-            pygame.display.update()
-            # capture after draw
-            try:
-                self._maybe_capture_frame()
-            except Exception:
-                pass
 
     def show_settings(self):
-        """Settings screen: adjust BGM on/off, BGM volume, SFX volume."""
+        """Settings screen: adjust BGM on/off, BGM volume, SFX volume, frame rate."""
         selected = 0
-        items = ["BGM: ", "BGM VOLUME: ", "SFX VOLUME: ", "BACK"]
+        items = ["BGM: ", "BGM VOLUME: ", "SFX VOLUME: ", "FRAME RATE: ", "BACK"]
         adjusting = False
+        redraw, rec_state = True, None
+        rec_rect = self._rec_button_rect()
         while self.game_state == "settings":
-            SCREEN.fill(PIXEL_COLORS['bg_primary'])
-            draw_pixel_grid(SCREEN, 30, PIXEL_COLORS['bg_secondary'])
-
-            # Title
-            draw_pixel_text_with_shadow(SCREEN, "SETTINGS", large_font,
-                                        SCREEN_WIDTH//2 - large_font.size("SETTINGS")[0]//2,
-                                        30, PIXEL_COLORS['text_accent'], PIXEL_COLORS['bg_primary'])
-
-            panel = pygame.Rect(80, 90, SCREEN_WIDTH - 160, 360)
-            pygame.draw.rect(SCREEN, PIXEL_COLORS['bg_secondary'], panel)
-            draw_pixel_border(SCREEN, panel, PIXEL_COLORS['frame'], 3)
-
-            # Render items
-            opts = {
-                'bgm': "ON" if self.settings.get('bgm_enabled', True) else "OFF",
-                'bgm_vol': f"{float(self.settings.get('bgm_volume', 0.4)):.1f}",
-                'sfx_vol': f"{float(self.settings.get('sfx_volume', 1.0)):.1f}",
-            }
-            labels = [
-                f"BGM: {opts['bgm']}",
-                f"BGM VOLUME: {opts['bgm_vol']}",
-                f"SFX VOLUME: {opts['sfx_vol']}",
-                "BACK"
-            ]
-            start_y = 140
-            gap = 46
-            for i, text in enumerate(labels):
-                col = PIXEL_COLORS['text_primary'] if i != selected else PIXEL_COLORS['success']
-                draw_pixel_text_with_shadow(
-                    SCREEN, text, font,
-                    SCREEN_WIDTH//2 - font.size(text)[0]//2,
-                    start_y + i*gap,
-                    col, PIXEL_COLORS['bg_secondary']
+            # Static screen: draw and present only when something changed
+            if redraw or rec_state != self._cap_active:
+                # Render items
+                opts = {
+                    'bgm': "ON" if self.settings.get('bgm_enabled', True) else "OFF",
+                    'bgm_vol': f"{float(self.settings.get('bgm_volume', 0.4)):.1f}",
+                    'sfx_vol': f"{float(self.settings.get('sfx_volume', 1.0)):.1f}",
+                    'fps': str(self.settings.get('frame_rate', FRAME_RATE) or "UNCAPPED"),
+                }
+                labels = (
+                    f"BGM: {opts['bgm']}",
+                    f"BGM VOLUME: {opts['bgm_vol']}",
+                    f"SFX VOLUME: {opts['sfx_vol']}",
+                    f"FRAME RATE: {opts['fps']}",
+                    "BACK"
                 )
+                # Rebuilt only when the selection or a value changes (cached layer)
+                LAYERS.blit(SCREEN, 'settings', lambda surf: self._build_settings_layer(surf, labels, selected),
+                            key=(selected, labels))
+
+                # REC/STOP button (top-right)
+                rec_rect = self._draw_rec_button()
+                rec_state = self._cap_active
+                pygame.display.update()
+                AUDIO.presented()
+                redraw = False
+            # capture after draw
+            try:
+                self._maybe_capture_frame()
+            except Exception:
+                pass
 
-            hint = "UP/DOWN: SELECT  LEFT/RIGHT: ADJUST  ENTER: TOGGLE  ESC: BACK"
-            draw_pixel_text_with_shadow(
-                SCREEN, hint, small_font,
-                SCREEN_WIDTH//2 - small_font.size(hint)[0]//2,
-                480, PIXEL_COLORS['text_secondary'], PIXEL_COLORS['bg_primary']
-            )
-
-            # REC/STOP button (top-right)
-            rec_rect = self._draw_rec_button()
-
-            for event in pygame.event.get():
+            events = self._idle_events()
+            redraw = any(event.type != MOUSEMOTION for event in events)
+            for event in events:
                 if event.type == QUIT:
                     pygame.quit(); sys.exit()
                 if event.type == MOUSEBUTTONDOWN:
@@ -2781,7 +5072,7 @@ class Game:
                         continue
                     if event.key == K_ESCAPE:
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND: UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception: pass
                         # save and go back
                         try:
@@ -2789,14 +5080,14 @@ class Game:
                         except Exception: pass
                         self.game_state = "rankings"
                     elif event.key in (K_UP, K_w):
-                        selected = (selected - 1) % 4
+                        selected = (selected - 1) % len(items)
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND: UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception: pass
                     elif event.key in (K_DOWN, K_s):
-                        selected = (selected + 1) % 4
+                        selected = (selected + 1) % len(items)
                         try:
-                            if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND: UI_NAV_SOUND.play()
+                            self.sounds.ui_nav.play()
                         except Exception: pass
                     elif event.key in (K_LEFT, K_a, K_RIGHT, K_d):
                         # adjust volumes with left/right when on volume rows
@@ -2807,7 +5098,7 @@ class Game:
                             self.settings['bgm_volume'] = v
                             try:
                                 self.apply_audio_settings()
-                                if 'UI_KEY_TAP_SOUND' in globals() and UI_KEY_TAP_SOUND: UI_KEY_TAP_SOUND.play()
+                                self.sounds.ui_key_tap.play()
                             except Exception: pass
                         elif selected == 2:  # sfx volume
                             v = float(self.settings.get('sfx_volume', 1.0))
@@ -2815,18 +5106,22 @@ class Game:
                             self.settings['sfx_volume'] = v
                             try:
                                 self.apply_audio_settings()
-                                if 'UI_KEY_TAP_SOUND' in globals() and UI_KEY_TAP_SOUND: UI_KEY_TAP_SOUND.play()
+                                self.sounds.ui_key_tap.play()
                             except Exception: pass
+                        elif selected == 3:  # frame rate
+                            self.cycle_frame_rate(-1 if delta < 0 else 1)
                     elif event.key in (K_RETURN, K_SPACE):
                         if selected == 0:
                             self.settings['bgm_enabled'] = not bool(self.settings.get('bgm_enabled', True))
                             try:
                                 self.apply_audio_settings()
-                                if 'UI_KEY_ENTER_SOUND' in globals() and UI_KEY_ENTER_SOUND: UI_KEY_ENTER_SOUND.play()
+                                self.sounds.ui_key_enter.play()
                             except Exception: pass
                         elif selected == 3:
+                            self.cycle_frame_rate(1)
+                        elif selected == 4:
                             try:
-                                if 'UI_NAV_SOUND' in globals() and UI_NAV_SOUND: UI_NAV_SOUND.play()
+                                self.sounds.ui_nav.play()
                             except Exception: pass
                             try:
                                 self.save_persistence()
@@ -2838,12 +5133,6 @@ class Game:
                 self._tick_autogif('settings')
             except Exception:
                 pass
-            pygame.display.update()
-            # capture after draw
-            try:
-                self._maybe_capture_frame()
-            except Exception:
-                pass
 
     def run(self):
         """Run the main game loop"""
@@ -2853,7 +5142,12 @@ class Game:
             elif self.game_state == "instructions":
                 self.show_instructions()
             elif self.game_state == "playing":
-                self.handle_playing()
+                # combo ladder refuses (and counts) synthesis while the gameplay frame runs
+                self.combo_ladder.hot = True
+                try:
+                    self.handle_playing()
+                finally:
+                    self.combo_ladder.hot = False
             elif self.game_state == "results":
                 self.show_results()
             elif self.game_state == "rankings":
@@ -2862,6 +5156,12 @@ class Game:
                 self.show_settings()
 
 
+def main():
+    """Start the game: bring up every subsystem, then run the main loop."""
+    _startup_mark("main")
+    init_subsystems()
+    Game().run()
+
+
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    main()
\ No newline at end of file
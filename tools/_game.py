@@ -0,0 +1,29 @@
+import importlib.util
+import os
+import sys
+
+# Shared helper for the scripts in tools/: loads ReactionTest_Mini-Game.py as a module.
+# The file name contains a hyphen, so it cannot be imported with a plain `import`.
+# SDL is pointed at its dummy video/audio drivers unless the caller already chose drivers,
+# so benchmarks run headless (CI, SSH sessions) and never open a window.
+# Importing the game has no side effects; with init=True (default) the audio, fonts and
+# display are brought up as the game does at startup. Pass init=False and call the module's
+# init_audio()/init_fonts()/init_display() to bring up only what a tool needs.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_PATH = os.path.join(ROOT, "ReactionTest_Mini-Game.py")
+
+
+def load_game(headless=True, module_name="reaction_game", init=True):
+    if headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, GAME_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    if init:
+        module.init_subsystems()
+    return module
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+# Runs the automated demo (countdown, a few blocks with hits and a miss, results) once per mixer
+# buffer size with RT_AV_LOG=1 and summarizes the audio/visual offset the AudioScheduler achieved
+# per event type. Positive offsets mean the sound lands after the frame that shows its visual.
+# GIF capture is disabled in the child so frame pacing is the game's own.
+# Usage:
+#   python tools/av_offsets.py [buffer_frames ...]
+# Defaults: 256 512 1024.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CHILD = r"""
+import sys
+sys.path.insert(0, %r)
+from _game import load_game
+game = load_game()
+pygame = game.pygame
+g = game.Game()
+g._toggle_capture = lambda: None
+g._start_autogif()
+orig_tick = g._tick_autogif
+def tick(name):
+    orig_tick(name)
+    if not g.autogif:
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+g._tick_autogif = tick
+pygame.time.set_timer(pygame.QUIT, 30000)
+try:
+    g.run()
+except SystemExit:
+    pass
+for label, st in sorted(game.AUDIO.stats().items()):
+    print('STAT %%s %%d %%.2f %%.2f' %% (label, st['n'], st['mean_ms'], st['max_abs_ms']))
+print('LATENCY %%.2f' %% (game.AUDIO.latency * 1000))
+""" % HERE
+
+
+def run(buffer_frames):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["RT_MIXER_BUFFER"] = str(buffer_frames)
+    env["RT_AV_LOG"] = "1"
+    with tempfile.TemporaryDirectory() as home:
+        env["HOME"] = home
+        env["USERPROFILE"] = home
+        out = subprocess.run([sys.executable, "-c", CHILD], env=env,
+                             capture_output=True, text=True, timeout=120).stdout
+    stats, latency = {}, None
+    for line in out.splitlines():
+        if line.startswith("STAT "):
+            _, label, n, mean, worst = line.split()
+            stats[label] = (int(n), float(mean), float(worst))
+        elif line.startswith("LATENCY "):
+            latency = float(line.split()[1])
+    return latency, stats
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [256, 512, 1024]
+    for size in sizes:
+        latency, stats = run(size)
+        print(f"[av_offsets] buffer {size} frames: estimated output latency {latency or 0:.1f} ms")
+        for label, (n, mean, worst) in stats.items():
+            print(f"  {label:<12} n={n:<3d} mean {mean:+7.1f} ms   worst |{worst:6.1f}| ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+
+# Timing comparison of the two BGM renderers in the game:
+#   - _render_bgm_scalar: the original per-sample pure-Python loop
+#   - _render_bgm_numpy:  the block-vectorized NumPy path used when numpy is installed
+# Both render the same BGM_LENGTH loop; the script also reports how far the outputs differ.
+# Usage:
+#   python tools/bench_bgm.py [sample_rate] [seconds]
+# Defaults: the mixer's negotiated rate (22050 Hz normally) and BGM_LENGTH.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+
+def main():
+    game = load_game()
+    if not game.NUMPY_AVAILABLE:
+        print("[bench_bgm] numpy is not installed; nothing to compare against.")
+        sys.exit(1)
+    np = game.np
+    mi = game.pygame.mixer.get_init() or (22050, -16, 1)
+    sample_rate = int(sys.argv[1]) if len(sys.argv) > 1 else mi[0]
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else float(game.BGM_LENGTH)
+    frames = int(seconds * sample_rate)
+    print(f"[bench_bgm] {seconds:.1f}s loop @ {sample_rate} Hz mono = {frames} frames")
+
+    t0 = time.perf_counter()
+    scalar = game._render_bgm_scalar(sample_rate, frames)
+    t_scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vector = game._render_bgm_numpy(sample_rate, frames)
+    t_numpy = time.perf_counter() - t0
+
+    a = np.frombuffer(scalar, dtype=np.int16).astype(np.int32)
+    b = np.frombuffer(vector, dtype=np.int16).astype(np.int32)
+    diff = np.abs(a - b)
+    print(f"  scalar loop : {t_scalar * 1000:9.1f} ms")
+    print(f"  numpy blocks: {t_numpy * 1000:9.1f} ms  ({t_scalar / max(t_numpy, 1e-9):.1f}x faster)")
+    print(f"  max |diff| = {int(diff.max())} LSB, differing samples = {int((diff > 0).sum())}/{frames}")
+
+
+if __name__ == "__main__":
+    main()
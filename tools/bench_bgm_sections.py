@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+
+# Timing of the sectioned (multi-process) BGM render against the single-process NumPy render,
+# and a byte-for-byte check that the stitched sections equal the whole-loop output.
+# Usage:
+#   python tools/bench_bgm_sections.py [seconds] [workers ...]
+# Defaults: BGM_LENGTH and worker counts 2, 4 and os.cpu_count().
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+
+def main():
+    os.environ.setdefault("RT_BGM_SYNC", "1")  # keep the startup BGM build off the timings
+    game = load_game()
+    if not game.NUMPY_AVAILABLE:
+        print("[bench_bgm_sections] numpy is not installed; sectioned rendering needs it.")
+        sys.exit(1)
+    mi = game.pygame.mixer.get_init() or (22050, -16, 1)
+    sample_rate, channels = mi[0], mi[2]
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else float(game.BGM_LENGTH)
+    counts = [int(a) for a in sys.argv[2:]] or sorted({2, 4, os.cpu_count() or 1})
+    frames = int(seconds * sample_rate)
+    print(f"[bench_bgm_sections] {seconds:.1f}s loop @ {sample_rate} Hz x{channels}, "
+          f"{os.cpu_count()} CPU(s)")
+
+    t0 = time.perf_counter()
+    whole = game._render_bgm_numpy(sample_rate, frames, channels)
+    t_whole = time.perf_counter() - t0
+    print(f"  single process : {t_whole * 1000:9.1f} ms")
+
+    for workers in counts:
+        sections = game._bgm_sections(sample_rate, frames, workers)
+        t0 = time.perf_counter()
+        stitched = game._render_bgm_sectioned(sample_rate, frames, channels, workers=workers)
+        t_sec = time.perf_counter() - t0
+        same = "identical" if stitched == whole else "MISMATCH"
+        print(f"  {workers:2d} workers     : {t_sec * 1000:9.1f} ms  "
+              f"({len(sections)} sections, {t_whole / t_sec:.2f}x, {same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+# Soak test for the streaming BGM mode (BgmStream): plays streamed measures for a while
+# with the main thread kept busy drawing full frames (like gameplay), then reports render
+# cost per measure, underruns (queue ran dry = audible gap) and the buffered PCM footprint.
+# Usage:
+#   python tools/bench_bgm_stream.py [seconds]
+# Default: 12 seconds (six measures). Headless: uses SDL's dummy audio driver, which consumes
+# samples in real time, so queue timing behaves like a real device.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+
+def main():
+    game = load_game()
+    pygame = game.pygame
+    if not game.NUMPY_AVAILABLE:
+        print("[bench_bgm_stream] streaming needs numpy; not installed.")
+        sys.exit(1)
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 12.0
+    mi = pygame.mixer.get_init() or (22050, -16, 1)
+    # Silence the regular BGM so only the stream runs
+    pygame.mixer.stop()
+    stream = game.BgmStream(mi[0], mi[2], seed=1)
+    ch = pygame.mixer.find_channel(True)
+    stream.start(ch)
+
+    frames = 0
+    t_end = time.time() + seconds
+    while time.time() < t_end:
+        # Simulated gameplay load: full redraw and flip every iteration, no frame cap
+        game.SCREEN.fill(game.PIXEL_COLORS['bg_primary'])
+        game.draw_pixel_grid(game.SCREEN, 20, game.PIXEL_COLORS['bg_secondary'])
+        pygame.display.update()
+        pygame.event.pump()
+        frames += 1
+    stream.stop()
+    st = stream.stats()
+    print(f"[bench_bgm_stream] {seconds:.0f}s, {frames} busy frames on the main thread")
+    print(f"  measures rendered : {st['measures']}")
+    print(f"  render per measure: {st['avg_render_ms']:.1f} ms (measure lasts {4 * 60000 / game.BGM_BPM:.0f} ms)")
+    print(f"  underruns         : {st['underruns']}")
+    print(f"  buffered PCM      : {st['buffered_bytes'] / 1024:.0f} KiB "
+          f"(full {game.BGM_LENGTH:.0f}s loop: {game.BGM_LENGTH * mi[0] * 2 * mi[2] / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
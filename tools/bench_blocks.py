@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+# Cost of drawing one block, resting and during the disappear animation:
+#   - composite: the previous Block.draw (new SRCALPHA Surface, font render and text scaling per call)
+#   - sprites:   the BLOCK_SPRITES frame for the block, one blit with surface alpha
+# Usage:
+#   python tools/bench_blocks.py [draws]
+# Default: 5000 draws per mode.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+
+def composite(game, block, screen):
+    pygame = game.pygame
+    w = int(game.BLOCK_WIDTH * block.scale)
+    h = int(game.BLOCK_HEIGHT * block.scale)
+    surface = pygame.Surface((w, h), pygame.SRCALPHA)
+    block_color = tuple(int(c * block.alpha / 255) for c in block.rgb)
+    pygame.draw.rect(surface, (*block_color, block.alpha), (0, 0, w, h))
+    pygame.draw.rect(surface, (*tuple(max(0, c - 40) for c in block_color), block.alpha), (0, 0, w, h), 3)
+    pygame.draw.rect(surface, (*tuple(min(255, c + 60) for c in block_color), block.alpha), (3, 3, w - 6, h - 6), 2)
+    text = game.small_font.render(block.display_text, False, (20, 20, 20) if sum(block.rgb) > 400 else (240, 240, 240))
+    text.set_alpha(block.alpha)
+    if block.scale != 1.0:
+        text = pygame.transform.scale(text, (int(text.get_width() * block.scale), int(text.get_height() * block.scale)))
+    surface.blit(text, ((w - text.get_width()) // 2, (h - text.get_height()) // 2))
+    screen.blit(surface, (block.x - (w - game.BLOCK_WIDTH) // 2, block.y - (h - game.BLOCK_HEIGHT) // 2))
+
+
+def timed(draw, block, screen, draws):
+    t0 = time.perf_counter()
+    for _ in range(draws):
+        draw(block, screen)
+    return (time.perf_counter() - t0) / draws
+
+
+def main():
+    game = load_game()
+    draws = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    screen = game.SCREEN
+    block = game.Block()
+    print(f"[bench_blocks] {game.BLOCK_WIDTH}x{game.BLOCK_HEIGHT} block, {draws} draws, "
+          f"{game.BLOCK_SPRITES.stats()['sprites']} sprites")
+    for label, progress in (("resting", None), ("animating", 0.5)):
+        if progress is not None:
+            block.frame = int(progress * game.BLOCK_FADE_FRAMES)
+            block.scale = 1.0 + progress * game.BLOCK_FADE_SCALE
+            block.alpha = int(255 * (1.0 - progress))
+        old = timed(lambda b, s: composite(game, b, s), block, screen, draws)
+        new = timed(lambda b, s: b.draw(s), block, screen, draws)
+        print(f"  {label:<9}: composite {old * 1e6:7.1f} us | sprites {new * 1e6:6.1f} us ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+# Plays bursts of game sounds through the channel groups and prints the per-group play/drop/steal
+# counters, to check that nothing is lost at high input rates and that the BGM channel is never
+# taken over. Typing runs at each requested rate (keys per second) with a Perfect hit or a miss
+# every 250 ms alongside it.
+# Usage:
+#   python tools/bench_channels.py [seconds] [rate ...]
+# Defaults: 3 seconds per rate, rates 10, 30 and 100 keys/s.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+
+def burst(game, seconds, rate):
+    sounds = game.SOUNDS
+    before = game.CHANNELS.stats()
+    t_end = time.perf_counter() + seconds
+    interval = 1.0 / rate
+    hits = 0
+    while time.perf_counter() < t_end:
+        sounds.ui_key_tap.play()
+        if int(time.perf_counter() * 4) != hits:
+            hits = int(time.perf_counter() * 4)
+            (sounds.perfect if hits % 3 else sounds.miss).play()
+        time.sleep(interval)
+    after = game.CHANNELS.stats()
+    return {name: {k: after[name][k] - before[name][k] for k in ('plays', 'drops', 'steals')}
+            for name in after}
+
+
+def main():
+    os.environ.setdefault("RT_BGM_SYNC", "1")  # BGM channel is playing before the bursts start
+    game = load_game()
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    rates = [float(a) for a in sys.argv[2:]] or [10.0, 30.0, 100.0]
+    layout = ", ".join(f"{g.name}={len(g.channels)}/{g.policy}" for g in game.CHANNELS.groups)
+    print(f"[bench_channels] groups: {layout}")
+    for rate in rates:
+        stats = burst(game, seconds, rate)
+        bgm_ok = game.BGM_CHANNEL is None or game.BGM_CHANNEL.get_busy()
+        print(f"  {rate:5.0f} keys/s: " + "  ".join(
+            f"{name} {s['plays']}p/{s['drops']}d/{s['steals']}s" for name, s in stats.items() if any(s.values()))
+            + f"  | bgm {'playing' if bgm_ok else 'STOPPED'}")
+
+
+if __name__ == "__main__":
+    main()
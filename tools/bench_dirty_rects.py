@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import time
+
+# Pixels pushed to the display per gameplay frame with full-window updates against dirty-rect
+# updates. Each mode plays the same stretch of a round: matching blocks are clicked shortly
+# after they appear, so feedback, combo, reaction-time labels, disappear animations and
+# Perfect particles all show up.
+# Usage:
+#   python tools/bench_dirty_rects.py [seconds]
+# Default: 12 seconds per mode. Set RT_DIRTY_DEBUG=1 to draw the region outlines as well.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+
+def play(game, seconds, dirty):
+    game.DIRTY = game.DirtyRects(enabled=dirty)
+    g = game.Game()
+    g.data_file = os.path.join(tempfile.mkdtemp(), "data.json")  # keep the real rankings untouched
+    game.PACER.set_target(0)  # time the frame work, not the pacing wait
+    g.username = "BENCH"
+    g.game_state = "playing"
+    g.next_state_time = time.time() + 0.2
+    frame_times = []
+    t_end = time.time() + seconds
+    while g.game_state == "playing" and time.time() < t_end:
+        block = g.current_block
+        if (g.block_visible and block and not block.is_clicked and block.color == block.text_color
+                and time.time() - g.block_start_time > 0.2):
+            # click rather than press the color key: R also toggles recording during play
+            pos = (block.x + game.BLOCK_WIDTH // 2, block.y + game.BLOCK_HEIGHT // 2)
+            game.pygame.event.post(game.pygame.event.Event(game.MOUSEBUTTONDOWN, pos=pos, button=1))
+        t0 = time.perf_counter()
+        g.handle_playing()
+        frame_times.append(time.perf_counter() - t0)
+    return game.DIRTY.stats(), frame_times
+
+
+def main():
+    game = load_game()
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 12.0
+    print(f"[bench_dirty_rects] {game.SCREEN_WIDTH}x{game.SCREEN_HEIGHT}, {seconds:.0f}s of play per mode")
+    baseline = None
+    for dirty in (False, True):
+        stats, frame_times = play(game, seconds, dirty)
+        frame_times.sort()
+        median = frame_times[len(frame_times) // 2] * 1000 if frame_times else 0.0
+        line = (f"  {'dirty rects' if dirty else 'full window':<12}: {stats['px_per_frame']:8d} px/frame "
+                f"({stats['ratio'] * 100:5.1f}% of window), {stats['full_frames']} full of {stats['frames']} frames, "
+                f"median frame {median:.3f} ms")
+        if baseline:
+            line += f"  ({baseline / max(1, stats['px_per_frame']):.0f}x fewer pixels)"
+        baseline = stats['px_per_frame']
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+# Audio synthesis timings with and without numpy:
+#   - numpy:     the vectorized renderers used when numpy is installed
+#   - wavetable: the pure-Python fallback (wavetable oscillators, fixed-point phase)
+#   - scalar:    the original per-sample BGM loop, kept as the reference
+# Each engine runs in its own child process; numpy is hidden from the fallback runs by
+# poisoning sys.modules before the game is imported. A fresh temporary HOME keeps the
+# PCM cache cold, and the cache is switched off before timing so every sound is really synthesized.
+# Usage:
+#   python tools/bench_no_numpy.py [--no-scalar]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CHILD = r"""
+import sys, time
+if %(hide)r:
+    sys.modules['numpy'] = None
+sys.path.insert(0, %(here)r)
+from _game import load_game
+game = load_game()
+game.PCM_CACHE_ENABLED = False  # the import already filled the cache
+mi = game.pygame.mixer.get_init() or (22050, -16, 1)
+sr, channels = mi[0], mi[2]
+frames = int(game.BGM_LENGTH * sr)
+t0 = time.perf_counter()
+game.render_patch_bank()
+t_sfx = time.perf_counter() - t0
+render = {'numpy': game._render_bgm_numpy if game.NUMPY_AVAILABLE else None,
+          'wavetable': game._render_bgm_wavetable,
+          'scalar': game._render_bgm_scalar}[%(engine)r]
+t0 = time.perf_counter()
+render(sr, frames, channels)
+t_bgm = time.perf_counter() - t0
+print('RESULT %%d %%.6f %%.6f' %% (game.NUMPY_AVAILABLE, t_sfx, t_bgm))
+"""
+
+
+def run(engine):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["RT_BGM_SYNC"] = "1"
+    with tempfile.TemporaryDirectory() as home:
+        env["HOME"] = home
+        env["USERPROFILE"] = home
+        code = CHILD % {"hide": engine != "numpy", "here": HERE, "engine": engine}
+        out = subprocess.run([sys.executable, "-c", code], env=env,
+                             capture_output=True, text=True, check=True).stdout
+    for line in out.splitlines():
+        if line.startswith("RESULT "):
+            _, has_np, t_sfx, t_bgm = line.split()
+            return has_np == "1", float(t_sfx), float(t_bgm)
+    raise RuntimeError(f"no result from {engine} run")
+
+
+def main():
+    engines = ["numpy", "wavetable"]
+    if "--no-scalar" not in sys.argv[1:]:
+        engines.append("scalar")
+    results = {}
+    for engine in engines:
+        has_np, t_sfx, t_bgm = run(engine)
+        if engine == "numpy" and not has_np:
+            print("[bench_no_numpy] numpy is not installed; skipping the numpy baseline.")
+            continue
+        results[engine] = (t_sfx, t_bgm)
+
+    print(f"[bench_no_numpy] {'engine':<10} {'sfx bank':>10} {'bgm loop':>10}")
+    for engine, (t_sfx, t_bgm) in results.items():
+        line = f"  {engine:<10} {t_sfx * 1000:8.1f} ms {t_bgm * 1000:8.1f} ms"
+        if "numpy" in results and engine != "numpy":
+            line += f"   (bgm {t_bgm / results['numpy'][1]:.1f}x numpy)"
+        print(line)
+    print("  (scalar is the BGM reference loop; its sfx column is the wavetable bank again)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import math
+import os
+import random
+import sys
+import time
+
+# Per-frame cost of updating and drawing N live particles:
+#   - dicts:  the previous per-particle dicts, one new SRCALPHA Surface per particle per frame
+#   - numpy:  ParticleSystem on NumPy arrays, cached sprites, one Surface.blits call
+#   - array:  ParticleSystem on array('d') (the path used when numpy is not installed)
+# Particles are respawned as they expire so the live count stays at N.
+# Usage:
+#   python tools/bench_particles.py [frames] [count ...]
+# Defaults: 120 frames, counts 1000, 5000 and 20000.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+DT = 1.0 / 60.0
+COLOR = (255, 200, 80)
+
+
+def emit(rng):
+    angle = rng.uniform(0, 2 * math.pi)
+    speed = rng.uniform(120.0, 260.0)
+    return (rng.uniform(200, 600), rng.uniform(150, 450), speed * math.cos(angle),
+            speed * math.sin(angle), rng.uniform(0.55, 0.9), rng.choice([2, 2, 3]))
+
+
+def run_dicts(game, surface, count, frames):
+    pygame = game.pygame
+    rng = random.Random(1)
+    particles = []
+    t_total = 0.0
+    for _ in range(frames):
+        while len(particles) < count:
+            x, y, vx, vy, life, size = emit(rng)
+            particles.append({'x': x, 'y': y, 'vx': vx, 'vy': vy, 'life': life, 'age': 0.0, 'color': COLOR, 'size': size})
+        t0 = time.perf_counter()
+        alive = []
+        for p in particles:
+            p['age'] += DT
+            if p['age'] <= p['life']:
+                p['x'] += p['vx'] * DT
+                p['y'] += p['vy'] * DT
+                p['vy'] += 40.0 * DT
+                alive.append(p)
+                alpha = max(0, min(255, int(255 * (1.0 - p['age'] / p['life']))))
+                s = 2 if p['size'] <= 2 else 3
+                surf = pygame.Surface((s, s), pygame.SRCALPHA)
+                surf.fill((*p['color'], alpha))
+                surface.blit(surf, (int(p['x']), int(p['y'])))
+        particles = alive
+        t_total += time.perf_counter() - t0
+    return t_total / frames
+
+
+def run_system(game, surface, count, frames, use_numpy):
+    rng = random.Random(1)
+    system = game.ParticleSystem(count, mode='fade', use_numpy=use_numpy)
+    t_total = 0.0
+    for _ in range(frames):
+        while len(system) < count:
+            x, y, vx, vy, life, size = emit(rng)
+            system.spawn(x, y, vx, vy, life, size, COLOR)
+        t0 = time.perf_counter()
+        system.update(DT, gravity=40.0)
+        system.draw(surface)
+        t_total += time.perf_counter() - t0
+    return t_total / frames
+
+
+def main():
+    game = load_game(init=False)
+    game.init_pygame()
+    game.init_display()
+    surface = game.SCREEN
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    counts = [int(a) for a in sys.argv[2:]] or [1000, 5000, 20000]
+    has_numpy = game._load_numpy()
+    print(f"[bench_particles] update + draw per frame, {frames} frames, budget {1000 / 60:.1f} ms at 60 fps")
+    for count in counts:
+        line = f"  {count:6d} particles: dicts {run_dicts(game, surface, count, frames) * 1000:8.2f} ms"
+        if has_numpy:
+            line += f" | numpy {run_system(game, surface, count, frames, True) * 1000:7.2f} ms"
+        line += f" | array {run_system(game, surface, count, frames, False) * 1000:7.2f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import random
+import sys
+import time
+
+# Cost of wrapping many different strings (leaderboard names, messages) with wrap_text:
+#   - font.size: the previous wrap_text, one font.size call per candidate line and prefix probe
+#   - cold:      TEXT_LAYOUT on strings it has not seen (summed glyph advances, bisected breaks)
+#   - warm:      the same strings again (memoized line lists)
+# Usage:
+#   python tools/bench_wrap_text.py [strings] [max_width]
+# Defaults: 5000 strings, 300 px.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+WORDS = ["reaction", "brain", "age", "PLAYER", "quick", "the", "a", "faster", "better", "BLOCK",
+         "matches", "color", "XXXXXXXXXXXXXXXXXXXXXXXX", "hello", "world", "time", "ms"]
+
+
+def size_wrap(text, font_obj, max_width):
+    words = text.split(' ')
+    lines = []
+    current = ''
+    for w in words:
+        test = (current + ' ' + w).strip()
+        if font_obj.size(test)[0] <= max_width:
+            current = test
+        else:
+            if current:
+                lines.append(current)
+                current = ''
+            while font_obj.size(w)[0] > max_width and len(w) > 1:
+                lo, hi = 1, len(w)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if font_obj.size(w[:mid])[0] <= max_width:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                lines.append(w[:lo - 1])
+                w = w[lo - 1:]
+            current = w
+    if current:
+        lines.append(current)
+    return lines
+
+
+def timed(wrap, texts, font_obj, max_width):
+    t0 = time.perf_counter()
+    out = [wrap(text, font_obj, max_width) for text in texts]
+    return (time.perf_counter() - t0) / len(texts), out
+
+
+def main():
+    game = load_game(init=False)
+    game.init_pygame()
+    game.init_fonts()
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    max_width = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    font_obj = game.small_font
+    rng = random.Random(1)
+    texts = [f"{i} " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 14))) for i in range(count)]
+    layout = game.TextLayout(capacity=count)
+    old, expected = timed(size_wrap, texts, font_obj, max_width)
+    cold, lines = timed(layout.wrap, texts, font_obj, max_width)
+    warm, _ = timed(layout.wrap, texts, font_obj, max_width)
+    print(f"[bench_wrap_text] {count} strings at {max_width}px, "
+          f"glyph advances {'on' if layout.advances(font_obj) is not None else 'off (font kerns)'}, "
+          f"output {'identical' if lines == expected else 'DIFFERENT'}")
+    print(f"  font.size {old * 1e6:7.1f} us | cold {cold * 1e6:6.1f} us ({old / cold:.1f}x) | "
+          f"warm {warm * 1e6:5.2f} us ({old / warm:.0f}x) per string")
+
+
+if __name__ == "__main__":
+    main()
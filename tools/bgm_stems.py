@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+# Checks the adaptive BGM stems: that the arp/bass/drum stems add back up to the single-loop mix,
+# and how the stem levels ramp when the game state and streak change.
+# Usage:
+#   python tools/bgm_stems.py [seconds per step]
+# Default: 1.0 second per step of the state walk below.
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _game import load_game
+
+WALK = [("input_name", 0), ("instructions", 0), ("playing", 0), ("playing", 3), ("playing", 8),
+        ("results", 0), ("rankings", 0)]
+
+
+def main():
+    os.environ.setdefault("RT_BGM_SYNC", "1")  # stems are playing before the walk starts
+    game = load_game()
+    if not game.NUMPY_AVAILABLE:
+        print("[bgm_stems] numpy is not installed; adaptive music needs it.")
+        sys.exit(1)
+    import numpy as np
+    mi = game.pygame.mixer.get_init() or (22050, -16, 1)
+    sample_rate, channels = mi[0], mi[2]
+    frames = int(game.BGM_LENGTH * sample_rate)
+    full = np.frombuffer(game._render_bgm_numpy(sample_rate, frames, channels), np.int16).astype(np.int32)
+    summed = sum(np.frombuffer(game._render_bgm_numpy(sample_rate, frames, channels, voices=(name,)),
+                               np.int16).astype(np.int32) for name in game.BGM_STEM_NAMES)
+    print(f"[bgm_stems] stems {', '.join(game.BGM_STEM_NAMES)}: "
+          f"max |sum - loop| = {int(np.abs(summed - full).max())} LSB")
+
+    player = game.BGM_STEMS_PLAYER
+    if player is None:
+        print("[bgm_stems] adaptive BGM is not playing (RT_BGM_ADAPTIVE=0 or streaming mode?)")
+        return
+    step = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    for state, streak in WALK:
+        player.set_mix(state, streak)
+        t_end = time.perf_counter() + step
+        while time.perf_counter() < t_end:  # the game advances the ramps once per frame
+            time.sleep(1.0 / 60.0)
+            player.advance(1.0 / 60.0)
+        levels = "  ".join(f"{name} {level:.2f}" for name, level in player.stats()["levels"].items())
+        print(f"  {state:<12} streak {streak:2d}: {levels}")
+    print(f"  channels: {game.CHANNELS.stats()['stems']}")
+
+
+if __name__ == "__main__":
+    main()
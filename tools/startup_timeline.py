@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+# Prints the game's [Startup] timeline (RT_STARTUP_TRACE=1: ms since load and per phase) twice:
+# with the BGM synthesized on the worker thread (default) and with the old blocking behaviour
+# (RT_BGM_SYNC=1), to compare time-to-first-frame. Each run uses a fresh temporary HOME so the
+# PCM cache is cold and the BGM is really synthesized.
+# Usage:
+#   python tools/startup_timeline.py
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Child process: import the game headless and start it through main(); a timer set up once the
+# window is open quits shortly after the first frame
+CHILD = r"""
+import sys
+sys.path.insert(0, %r)
+from _game import load_game
+game = load_game(init=False)
+init_display = game.init_display
+def init_and_arm_quit():
+    init_display()
+    game.pygame.time.set_timer(game.pygame.QUIT, 400)
+game.init_display = init_and_arm_quit
+try:
+    game.main()
+except SystemExit:
+    pass
+""" % HERE
+
+
+def run(label, sync):
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    env["RT_BGM_SYNC"] = "1" if sync else "0"
+    env["RT_STARTUP_TRACE"] = "1"
+    with tempfile.TemporaryDirectory() as home:
+        env["HOME"] = home
+        env["USERPROFILE"] = home
+        out = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True).stdout
+    lines = [ln for ln in out.splitlines() if ln.startswith("[Startup]")]
+    print(f"== {label} ==")
+    for ln in lines:
+        print("  " + ln)
+    first = [ln for ln in lines if ln.endswith("first frame")]
+    return first[0].split()[1] if first else "n/a"
+
+
+def main():
+    before = run("blocking BGM (RT_BGM_SYNC=1)", sync=True)
+    after = run("background BGM worker", sync=False)
+    print(f"[startup_timeline] time-to-first-frame: before {before} ms -> after {after} ms")
+
+
+if __name__ == "__main__":
+    main()